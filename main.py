@@ -2,23 +2,40 @@
 """
 Checkers AI Game - Main Entry Point
 
-This is the main entry point for the Checkers AI Game. It provides both the original
-functionality and an organized interface for the game.
+This is the main entry point for the Checkers AI Game. It starts the Tkinter game
+window, or with ``--cli`` a text game in the terminal. tkinter is only imported
+when the window is opened, so the command-line game and anything importing the
+engine run without it.
+
+The game modules are imported only after the options are read, because the
+evaluation weights (``--weights``) are loaded when they are first imported.
 """
 
-# Import the original checker code for backward compatibility
-import sys
+import argparse
 import os
+import sys
+from typing import List, Optional
+
 
-# Add the examples directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'examples'))
+BOARD_NAMES = ("bitboard", "matrix")
+WEIGHTS_ENV = "CHECKERS_WEIGHTS"  # Read by src/game/evaluation.py at import, and inherited by worker processes
 
-from original_checker_code import PlayingTheGame
-import tkinter as tk
 
+def board_class(name: str):
+    """Board backend class for a --board choice."""
+    if name == "matrix":
+        from src.game.board import GameBoard
+        return GameBoard
+    from src.game.bitboard import BitboardGameBoard
+    return BitboardGameBoard
+
+
+def run_gui(args: argparse.Namespace) -> int:
+    """Open the game window and run its event loop until it is closed."""
+    import tkinter as tk
+    from src.ai.instrumentation import SearchLog
+    from src.ui.checkers_gui import PlayingTheGame
 
-def main():
-    """Main function to start the Checkers AI Game."""
     print("Checkers AI Game")
     print("================")
     print("Instructions:")
@@ -27,17 +44,70 @@ def main():
     print("- The AI (blue pieces) will automatically make its move")
     print("- Try to capture all AI pieces to win!")
     print()
-    
+
     # Create the main window
     root = tk.Tk()
     root.title("Checkers Game Agent")
-    
+
     # Start the game
-    game = PlayingTheGame(root)
-    
+    search_log = SearchLog(args.search_log) if args.search_log else None
+    game = PlayingTheGame(root, board_class=board_class(args.board), time_budget=args.time_budget,
+                          algorithm=args.algorithm, record_path=args.record, search_log=search_log,
+                          profile=args.profile, verbose=args.verbose)
+
     # Run the game loop
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        if search_log is not None:
+            search_log.close()
+    return 0
+
+
+def run_cli(args: argparse.Namespace) -> int:
+    """Play a game in the terminal."""
+    from src.ai.instrumentation import SearchLog
+    from src.engine import Engine
+    from src.ui.cli import play_cli
+
+    search_log = SearchLog(args.search_log) if args.search_log else None
+    engine = Engine(time_budget=args.time_budget, algorithm=args.algorithm, search_log=search_log,
+                    profile=args.profile)
+    try:
+        play_cli(engine, board_class(args.board))
+    finally:
+        engine.close()
+        if search_log is not None:
+            search_log.close()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main function to start the Checkers AI Game; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Play checkers against the AI.")
+    parser.add_argument("--cli", action="store_true", help="play in the terminal instead of a window")
+    parser.add_argument("--board", choices=BOARD_NAMES, default="bitboard", help="board backend")
+    parser.add_argument("--time-budget", type=float, default=1.0, help="seconds the AI may think per move")
+    parser.add_argument("--algorithm", choices=("pvs", "alphabeta", "mcts"), default="pvs", help="search algorithm")
+    parser.add_argument("--record", metavar="PATH", help="append the games to this game record file (window only)")
+    parser.add_argument("--search-log", metavar="PATH", help="append a JSON line with the stats of every AI move")
+    parser.add_argument("--profile", choices=("sampling", "cprofile"),
+                        help="add a time breakdown of every search to its stats")
+    parser.add_argument("--verbose", action="store_true",
+                        help="print clicks, moves and AI stats to standard output (window only)")
+    parser.add_argument("--weights", metavar="PATH",
+                        help="evaluation weight file (default: evaluation_weights.json in the repository, if any)")
+    args = parser.parse_args(argv)
+    if args.weights is not None:
+        if not os.path.exists(args.weights):
+            parser.error(f"weight file not found: {args.weights}")
+        os.environ[WEIGHTS_ENV] = os.path.abspath(args.weights)
+
+    from src.game import evaluation
+    print(f"Evaluation weights: {evaluation.WEIGHTS_PATH or 'built-in'} ({evaluation.WEIGHTS_DIGEST})",
+          file=sys.stderr)
+    return run_cli(args) if args.cli else run_gui(args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Checkers AI Game - engine and user interface packages.
+"""
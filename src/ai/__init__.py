@@ -0,0 +1,12 @@
+"""
+AI search algorithms for the Checkers AI Game.
+"""
+
+from .iterative import iterative_deepening
+from .limits import SearchLimits, SearchTimeout
+from .minimax import SearchToolBox
+from .ordering import MoveOrderer
+from .transposition import TranspositionTable
+
+__all__ = ["SearchToolBox", "TranspositionTable", "SearchLimits", "SearchTimeout", "iterative_deepening",
+           "MoveOrderer"]
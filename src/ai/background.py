@@ -0,0 +1,158 @@
+"""
+Background Search Worker
+
+This module runs iterative-deepening (or Monte Carlo) searches on a worker thread so a UI event
+loop never blocks on the AI. Searches are queued as ``SearchJob`` objects whose
+``done`` event the caller polls; a running job can be cancelled, and a ponder
+job (searching the position after the predicted opponent reply, with no time
+limit) can be turned into the real search when the prediction comes true.
+"""
+
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from copy import copy
+from typing import Optional
+
+from .instrumentation import profile_search
+from .iterative import ASPIRATION_WINDOW, iterative_deepening
+from .limits import SearchLimits
+from .mcts import MonteCarloSearch
+from .minimax import Move
+from .ordering import MoveOrderer
+from .tablebase import EndgameTablebase
+from .transposition import TranspositionTable
+
+
+class SearchJob:
+    """A single search request and, once ``done`` is set, its result."""
+
+    def __init__(self, board_obj, maximizing_player: bool, stats: dict, limits: SearchLimits,
+                 ponder_move: Optional[Move] = None):
+        """
+        Create a job.
+
+        Args:
+            board_obj: Position to search (the job keeps its own copy)
+            maximizing_player: True when it is the AI's turn in that position
+            stats: Stats dict the search fills in
+            limits: Budget of the search; also the handle used to stop it
+            ponder_move: Predicted opponent move this ponder job assumes, or None
+        """
+        self.board = copy(board_obj)
+        self.maximizing_player = maximizing_player
+        self.stats = stats
+        self.limits = limits
+        self.ponder_move = ponder_move
+        self.requested_at = time.perf_counter()
+        self.best_move = None
+        self.score = None
+        self.cancelled = False
+        self.done = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop the search as soon as possible; its result should be ignored."""
+        self.cancelled = True
+        self.limits.stop()
+
+
+class BackgroundSearch:
+    """
+    Single worker thread that runs queued searches one at a time.
+
+    The transposition table and move orderer are shared by all jobs, which is safe
+    because only one job runs at a time.
+    """
+
+    def __init__(self, max_depth: int = 32, table: Optional[TranspositionTable] = None,
+                 ordering: Optional[MoveOrderer] = None, tablebase: Optional[EndgameTablebase] = None,
+                 profile: Optional[str] = None, algorithm: str = "pvs"):
+        """
+        Start the worker thread.
+
+        Args:
+            max_depth: Deepest iteration any job will search
+            table: Transposition table shared by all jobs, or None for a fresh one
+            ordering: Move orderer shared by all jobs, or None for a fresh one
+            tablebase: Endgame table probed by every job, or None
+            profile: "cprofile" or "sampling" to add a time breakdown to each job's stats
+            algorithm: "alphabeta" for plain alpha-beta, "pvs" for Principal Variation
+                Search with aspiration windows (same moves and scores, fewer nodes), or
+                "mcts" for Monte Carlo Tree Search (its tree is kept between jobs)
+        """
+        if algorithm not in ("alphabeta", "pvs", "mcts"):
+            raise ValueError(f"Unknown search algorithm: {algorithm!r}")
+        self.max_depth = max_depth
+        self.table = table if table is not None else TranspositionTable()
+        self.ordering = ordering if ordering is not None else MoveOrderer()
+        self.tablebase = tablebase
+        self.profile = profile
+        self.algorithm = algorithm
+        self.mcts = MonteCarloSearch() if algorithm == "mcts" else None
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="checkers-search", daemon=True)
+        self._thread.start()
+
+    def search(self, board_obj, stats: dict, time_budget: Optional[float],
+               maximizing_player: bool = True) -> SearchJob:
+        """
+        Queue a search under a time budget.
+
+        Args:
+            board_obj: Position to search
+            stats: Stats dict the search fills in
+            time_budget: Seconds to spend, or None to search until cancelled
+            maximizing_player: True when it is the AI's turn in that position
+
+        Returns:
+            The queued job
+        """
+        job = SearchJob(board_obj, maximizing_player, stats, SearchLimits(time_budget))
+        self._jobs.put(job)
+        return job
+
+    def ponder(self, board_obj, predicted_move: Move, stats: dict) -> Optional[SearchJob]:
+        """
+        Queue an open-ended search of the position after the predicted player move.
+
+        Args:
+            board_obj: Position with the player to move
+            predicted_move: Player move the AI expects
+            stats: Stats dict the search fills in
+
+        Returns:
+            The queued ponder job, or None if the predicted move is not legal
+        """
+        if predicted_move not in board_obj.generate_moves(False):
+            return None
+        board = copy(board_obj)
+        board.make_move(predicted_move)
+        job = SearchJob(board, True, stats, SearchLimits(None), ponder_move=predicted_move)
+        self._jobs.put(job)
+        return job
+
+    def shutdown(self) -> None:
+        """Stop the worker thread after the current job."""
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        """Worker loop: run queued jobs until shut down."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            pvs = self.algorithm == "pvs"
+            try:
+                if not job.cancelled:
+                    with profile_search(job.stats, self.profile) if self.profile else nullcontext():
+                        if self.mcts is not None:
+                            job.best_move, job.score = self.mcts.search(job.board, job.maximizing_player, job.stats,
+                                                                        limits=job.limits)
+                        else:
+                            job.best_move, job.score = iterative_deepening(
+                                job.board, job.maximizing_player, job.stats, max_depth=self.max_depth,
+                                table=self.table, ordering=self.ordering, limits=job.limits,
+                                tablebase=self.tablebase, pvs=pvs, aspiration_window=ASPIRATION_WINDOW if pvs else None)
+            finally:
+                job.done.set()  # Never leave a poller waiting, even if the search failed
@@ -0,0 +1,140 @@
+"""
+Opening Book
+
+This module builds and reads a precomputed opening book. Every game starts from
+the same position, so the AI's replies to all player moves in the first few
+turns are found once, offline, by deep searches, and stored in a small binary
+file instead of being searched again in every game.
+
+File layout (little endian):
+
+    header   magic b"CKOB", version (u16), search depth (u16), entry count (u32)
+    entries  (position key u64, from square u8, to square u8, score i16), sorted by key
+
+Keys are ``position_key(board, True)``: the Zobrist hash of the pieces with the AI
+to move. Squares use the 32-square numbering of the bitboard backend.
+"""
+
+import struct
+from copy import copy
+from typing import Dict, Optional, Tuple
+
+from ..game.bitboard import BitboardGameBoard, RC_TO_SQUARE, SQUARE_TO_RC
+from .iterative import iterative_deepening
+from .minimax import Move
+from .ordering import MoveOrderer
+from .transposition import TranspositionTable, position_key
+
+
+DEFAULT_PATH = "opening.ckbk"  # Where the builder writes and the game looks by default
+
+MAGIC = b"CKOB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<QBBh")
+
+
+def build_opening_book(path: str, moves: int = 3, depth: int = 10, board_class=BitboardGameBoard,
+                       progress=None) -> int:
+    """
+    Search the AI's reply to every player line of the first ``moves`` turns and write the book.
+
+    The player's side branches over all legal moves; the AI's side follows the
+    move the search chose, so the book covers exactly the positions the AI can
+    reach while it plays from the book.
+
+    Args:
+        path: Output file
+        moves: Number of AI moves covered
+        depth: Search depth used for every book position
+        board_class: Board backend to search with
+        progress: Optional callable receiving (positions done, turn) after each search
+
+    Returns:
+        Number of book entries written
+    """
+    table = TranspositionTable(64)
+    ordering = MoveOrderer()
+    entries: Dict[int, Tuple[Move, float]] = {}
+    frontier = [board_class()]  # Positions with the player to move
+    for turn in range(1, moves + 1):
+        next_frontier = []
+        for board in frontier:
+            for player_move in board.generate_moves(False):
+                child = copy(board)
+                child.make_move(player_move)
+                key = position_key(child, True)
+                if key in entries or child.ComputerPieces == 0 or child.PlayerPieces == 0:
+                    continue
+                best_move, score = iterative_deepening(child, True, {'nodes_expanded': 0, 'prunes': 0},
+                                                       max_depth=depth, table=table, ordering=ordering)
+                if best_move is None:
+                    continue
+                entries[key] = (best_move, score)
+                child.make_move(best_move)
+                next_frontier.append(child)
+                if progress is not None:
+                    progress(len(entries), turn)
+        frontier = next_frontier
+
+    with open(path, "wb") as output:
+        output.write(HEADER.pack(MAGIC, VERSION, depth, len(entries)))
+        for key in sorted(entries):
+            (old_x, old_y, new_x, new_y), score = entries[key]
+            output.write(ENTRY.pack(key, RC_TO_SQUARE[old_x * 8 + old_y], RC_TO_SQUARE[new_x * 8 + new_y],
+                                    int(max(-32768, min(32767, score)))))  # Clamp first: a won line scores inf
+    return len(entries)
+
+
+class OpeningBook:
+    """Opening book loaded into memory and searched by binary search on the key."""
+
+    def __init__(self, path: str):
+        """
+        Load a book file built by ``build_opening_book``.
+
+        Args:
+            path: Book file
+
+        Raises:
+            ValueError: If the file is not an opening book of this version
+        """
+        with open(path, "rb") as book_file:
+            self.data = book_file.read()
+        magic, version, self.depth, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION or len(self.data) != HEADER.size + self.count * ENTRY.size:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def lookup(self, board_obj, stats: Optional[dict] = None) -> Optional[Move]:
+        """
+        Find the book move for the AI in a position.
+
+        Args:
+            board_obj: Position with the AI to move
+            stats: Optional stats dict in which 'book_hits' and 'book_misses' are counted
+
+        Returns:
+            The book move, or None if the position is not in the book
+        """
+        key = position_key(board_obj, True)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if ENTRY.unpack_from(self.data, HEADER.size + middle * ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        move = None
+        if low < self.count:
+            found, src, dst, _ = ENTRY.unpack_from(self.data, HEADER.size + low * ENTRY.size)
+            if found == key:
+                move = SQUARE_TO_RC[src] + SQUARE_TO_RC[dst]
+                if move not in board_obj.generate_moves(True):
+                    move = None  # Hash collision with a different position
+        if stats is not None:
+            counter = 'book_hits' if move is not None else 'book_misses'
+            stats[counter] = stats.get(counter, 0) + 1
+        return move
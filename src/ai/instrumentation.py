@@ -0,0 +1,199 @@
+"""
+Search Instrumentation
+
+This module turns the search's ``stats`` dict into structured output and adds
+optional profiling around a search:
+
+- ``SearchLog`` writes one JSON object per line to a file, or hands each record
+  to a callback, so engine behavior can be charted across many games.
+- ``profile_search`` runs a block under ``cProfile`` or a low-overhead sampling
+  profiler and splits the time into move generation, evaluation, copying,
+  make/unmake, transposition table, search and other work.
+
+The counters themselves ('nodes_by_depth', 'effective_branching_factor',
+'cutoff_positions', 'pruning_gains', ...) are filled in by the search.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Union
+
+from ..game import evaluation
+
+
+# Function name -> time category; helpers, comprehensions and builtins are charged
+# to the nearest listed caller, and anything without one counts as 'other'
+TIME_CATEGORIES = {
+    'generate_moves': 'move_generation', '_generate': 'move_generation', 'is_valid_move': 'move_generation',
+    'iter_moves': 'move_generation',
+    'evaluate_board': 'evaluation', 'recompute_evaluation': 'evaluation', 'evaluate_matrix': 'evaluation',
+    '_weight_sum': 'evaluation', 'evaluate_encoded': 'evaluation',
+    '__copy__': 'copying', '__deepcopy__': 'copying', '_child': 'copying', 'get_valid_moves': 'copying',
+    'iter_valid_moves': 'copying',
+    'make_move': 'make_unmake', 'unmake_move': 'make_unmake', '_apply': 'make_unmake', 'move_piece': 'make_unmake',
+    '_key_index': 'make_unmake',
+    'probe': 'transposition', 'store': 'transposition', 'position_key': 'transposition',
+    'minimax': 'search', 'minimax_in_place': 'search', 'minimax_batched': 'search',
+    'order': 'search', 'record_cutoff': 'search', '_record_cutoff': 'search',
+}
+CATEGORY_NAMES = ('move_generation', 'evaluation', 'copying', 'make_unmake', 'transposition', 'search', 'other')
+
+_COPY_MODULE = os.path.basename(getattr(sys.modules.get('copy'), '__file__', 'copy.py'))
+_MAX_CALLER_LEVELS = 5  # How far up the call chain an unlisted function is charged
+
+
+def _category(filename: str, function: str) -> Optional[str]:
+    """Time category of a listed function (the standard copy module counts as copying)."""
+    if os.path.basename(filename) == _COPY_MODULE and function != '__copy__':
+        return 'copying'
+    return TIME_CATEGORIES.get(function)
+
+
+def _profiled_category(key: tuple, functions: dict) -> str:
+    """Category of a cProfile entry, following its busiest caller when it is unlisted."""
+    for _ in range(_MAX_CALLER_LEVELS):
+        category = _category(key[0], key[2])
+        if category is not None:
+            return category
+        callers = functions.get(key, (None,) * 5)[4]
+        if not callers:
+            break
+        key = max(callers, key=lambda caller: callers[caller][2])
+    return 'other'
+
+
+def _frame_category(frame) -> str:
+    """Category of a sampled frame, following its callers when it is unlisted."""
+    for _ in range(_MAX_CALLER_LEVELS):
+        if frame is None:
+            break
+        category = _category(frame.f_code.co_filename, frame.f_code.co_name)
+        if category is not None:
+            return category
+        frame = frame.f_back
+    return 'other'
+
+
+class _Sampler(threading.Thread):
+    """Background thread that samples which function another thread is running."""
+
+    def __init__(self, target_thread: int, interval: float):
+        super().__init__(name="checkers-sampler", daemon=True)
+        self.target_thread = target_thread
+        self.interval = interval
+        self.samples = dict.fromkeys(CATEGORY_NAMES, 0)
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread)
+            if frame is not None:
+                self.samples[_frame_category(frame)] += 1
+
+
+@contextmanager
+def profile_search(stats: dict, mode: str = "cprofile", interval: float = 0.001) -> Iterator[None]:
+    """
+    Profile the enclosed search and add a time breakdown to its stats.
+
+    Sets 'time_breakdown' (seconds per category) and 'profile_mode'; the cProfile
+    mode also sets 'profile_top' (the ten functions with the most own time).
+    cProfile times every call exactly but slows the search several times over;
+    sampling barely slows it but is only as precise as its sample count.
+
+    Args:
+        stats: Stats dict of the search
+        mode: "cprofile" or "sampling"
+        interval: Seconds between samples in sampling mode
+    """
+    if mode not in ("cprofile", "sampling"):
+        raise ValueError(f"Unknown profile mode: {mode!r}")
+    started = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            breakdown = dict.fromkeys(CATEGORY_NAMES, 0.0)
+            functions = pstats.Stats(profiler).stats
+            for key, (_, _, own_time, _, _) in functions.items():
+                breakdown[_profiled_category(key, functions)] += own_time
+            top = sorted(functions.items(), key=lambda item: item[1][2], reverse=True)[:10]
+            stats['profile_top'] = [[function, calls, own_time]
+                                    for (_, _, function), (_, calls, own_time, _, _) in top]
+            stats['time_breakdown'] = breakdown
+            stats['profile_mode'] = mode
+    else:
+        sampler = _Sampler(threading.get_ident(), interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+            elapsed = time.perf_counter() - started
+            total = sum(sampler.samples.values())
+            stats['time_breakdown'] = {category: elapsed * count / total if total else 0.0
+                                       for category, count in sampler.samples.items()}
+            stats['profile_samples'] = total
+            stats['profile_mode'] = mode
+
+
+class SearchLog:
+    """
+    Writes search records as JSON lines to a file or passes them to a callback.
+
+    Each record is a flat dict with an 'event' name, a Unix 'timestamp', the
+    evaluation weights in use ('weights_path', None for the built-in ones, and
+    'weights_digest') and the fields given to ``record`` (usually a copy of a
+    search's stats).
+    """
+
+    def __init__(self, sink: Union[str, Callable[[dict], None]]):
+        """
+        Open the log.
+
+        Args:
+            sink: Path of a file to append to, or a callable receiving each record
+        """
+        self.callback = sink if callable(sink) else None
+        self.file = None if callable(sink) else open(sink, "a")
+        self.lock = threading.Lock()  # Records may come from the search worker and the UI thread
+
+    def record(self, event: str, stats: Optional[Dict] = None, **fields) -> dict:
+        """
+        Emit one record.
+
+        Args:
+            event: Record type, e.g. "ai_move" or "game_over"
+            stats: Stats dict to include
+            **fields: Extra fields
+
+        Returns:
+            The record that was written
+        """
+        record = {'event': event, 'timestamp': time.time(), 'weights_path': evaluation.WEIGHTS_PATH,
+                  'weights_digest': evaluation.WEIGHTS_DIGEST}
+        record.update(stats or {})
+        record.update(fields)
+        if self.callback is not None:
+            self.callback(record)
+        else:
+            line = json.dumps(record, default=str)
+            with self.lock:
+                self.file.write(line + "\n")
+                self.file.flush()
+        return record
+
+    def close(self) -> None:
+        """Close the log file, if any."""
+        if self.file is not None:
+            self.file.close()
@@ -0,0 +1,162 @@
+"""
+Iterative Deepening Driver
+
+This module runs the in-place minimax search at depth 1, 2, 3, ... until a time or
+node budget runs out, returning the best move of the last completed iteration.
+Each iteration's principal variation (read back from the transposition table)
+orders the next one, and its score can center the next iteration's aspiration window.
+"""
+
+import math
+import time
+from copy import copy
+from typing import List, Optional, Tuple
+
+from ..game.evaluation import MAX_SQUARE_WEIGHT
+from .limits import SearchLimits, SearchTimeout
+from .minimax import Move, SearchToolBox
+from .ordering import MoveOrderer, summarize_cutoffs
+from .tablebase import EndgameTablebase
+from .transposition import TranspositionTable, position_key
+
+
+# Default half-width of the aspiration window, in evaluation points: 5 with the built-in
+# weights, scaled with the loaded ones so tuned weights do not fail almost every window
+ASPIRATION_WINDOW = max(1, round(5 * MAX_SQUARE_WEIGHT / 7))
+MAX_WIDENINGS = 3  # Failed aspiration searches before falling back to an open window
+
+
+def principal_variation(board_obj, maximizing_player: bool, table: TranspositionTable,
+                        max_length: int) -> List[Move]:
+    """
+    Follow the best moves stored in the table from a position.
+
+    Args:
+        board_obj: Root position (not modified)
+        maximizing_player: True when it is the AI's turn at the root
+        table: Transposition table filled by a search from this position
+        max_length: Maximum number of moves to return
+
+    Returns:
+        List of moves, starting with the root's best move
+    """
+    board = copy(board_obj)
+    line = []
+    for _ in range(max_length):
+        entry = table.get(position_key(board, maximizing_player))
+        if entry is None or entry[3] is None or entry[3] not in board.generate_moves(maximizing_player):
+            break
+        board.make_move(entry[3])
+        line.append(entry[3])
+        maximizing_player = not maximizing_player
+    return line
+
+
+def _search_iteration(board_obj, depth: int, maximizing_player: bool, stats: dict,
+                      table: TranspositionTable, limits: Optional[SearchLimits], pv: List[Move],
+                      ordering: MoveOrderer, tablebase: Optional[EndgameTablebase], pvs: bool,
+                      aspiration_window: Optional[int], previous_score: float) -> Tuple[Optional[Move], float]:
+    """Search one depth, inside an aspiration window around the previous score if one is given."""
+    alpha, beta = -math.inf, math.inf
+    margin = aspiration_window
+    if margin and abs(previous_score) != math.inf:
+        alpha, beta = previous_score - margin, previous_score + margin
+    widenings = 0
+    while True:
+        best_move, score = SearchToolBox.minimax_in_place(board_obj, depth, alpha, beta, maximizing_player, stats,
+                                                          table, limits, pv, ordering, 0, tablebase, pvs)
+        failed_low = alpha != -math.inf and score <= alpha
+        failed_high = beta != math.inf and score >= beta
+        if not (failed_low or failed_high):
+            return best_move, score  # Inside the window, so exact
+        stats['aspiration_researches'] = stats.get('aspiration_researches', 0) + 1
+        widenings += 1
+        margin *= 2
+        if failed_low:
+            alpha = score - margin if widenings < MAX_WIDENINGS else -math.inf
+        else:
+            beta = score + margin if widenings < MAX_WIDENINGS else math.inf
+
+
+def iterative_deepening(board_obj, maximizing_player: bool, stats: dict,
+                        time_budget: Optional[float] = None, node_budget: Optional[int] = None,
+                        max_depth: int = 32,
+                        table: Optional[TranspositionTable] = None,
+                        ordering: Optional[MoveOrderer] = None,
+                        limits: Optional[SearchLimits] = None,
+                        tablebase: Optional[EndgameTablebase] = None, pvs: bool = False,
+                        aspiration_window: Optional[int] = None) -> Tuple[Optional[Move], float]:
+    """
+    Search deeper and deeper until the budget is exhausted.
+
+    Depth 1 always completes so there is always a move to play; later iterations
+    are aborted from inside the search once the budget runs out, and their partial
+    results are discarded.
+
+    Args:
+        board_obj: Position to search (not modified)
+        maximizing_player: True when it is the AI's turn
+        stats: Stats dict; 'depth_reached', 'iteration_times', 'nodes_by_depth',
+            'effective_branching_factor' and 'principal_variation' are filled in
+            alongside the search counters
+        time_budget: Seconds to spend, or None
+        node_budget: Nodes to expand, or None
+        max_depth: Deepest iteration to run
+        table: Transposition table to use (and keep between moves), or None for a fresh one
+        ordering: Move orderer to use (and keep between moves), or None for a fresh one
+        limits: Budget to use instead of time_budget/node_budget, e.g. so another
+            thread can stop or extend the search
+        tablebase: Optional endgame table probed inside the search
+        pvs: Search each iteration with Principal Variation Search
+        aspiration_window: If set, search each iteration after the first inside
+            previous score +/- this margin, widening the failed side (doubling the
+            margin) and re-searching whenever the score falls outside; re-searches
+            are counted in 'aspiration_researches'
+
+    Returns:
+        Tuple of (best_move, score) from the deepest completed iteration
+    """
+    if table is None:
+        table = TranspositionTable()
+    if ordering is None:
+        ordering = MoveOrderer()
+    ordering.new_search()
+    if limits is None:
+        limits = SearchLimits(time_budget, node_budget)
+    limits.start(stats)
+    search_board = copy(board_obj)  # An aborted iteration leaves this board mid-search
+
+    best_move, best_score = None, -math.inf if maximizing_player else math.inf
+    pv = []
+    stats['depth_reached'] = 0
+    stats['iteration_times'] = []
+    stats['nodes_by_depth'] = []
+    stats['principal_variation'] = []
+
+    for depth in range(1, max_depth + 1):
+        started = time.perf_counter()
+        nodes_before = stats['nodes_expanded']
+        try:
+            best_move, best_score = _search_iteration(search_board, depth, maximizing_player, stats, table,
+                                                      limits if depth > 1 else None, pv, ordering, tablebase,
+                                                      pvs, aspiration_window if depth > 1 else None, best_score)
+        except SearchTimeout:
+            break
+        stats['depth_reached'] = depth
+        stats['iteration_times'].append(time.perf_counter() - started)
+        stats['nodes_by_depth'].append(stats['nodes_expanded'] - nodes_before)
+        if len(stats['nodes_by_depth']) >= 2 and stats['nodes_by_depth'][-2]:
+            # Growth of the tree from one iteration to the next
+            stats['effective_branching_factor'] = stats['nodes_by_depth'][-1] / stats['nodes_by_depth'][-2]
+
+        pv = principal_variation(board_obj, maximizing_player, table, depth)
+        stats['principal_variation'] = pv
+        if limits.expired(stats):
+            break
+
+    if best_move is None:
+        # Every move loses by force (all scored as infinite), but there is still one to play
+        valid_moves = board_obj.generate_moves(maximizing_player)
+        best_move = valid_moves[0] if valid_moves else None
+    summarize_cutoffs(stats)
+    return best_move, best_score
@@ -0,0 +1,101 @@
+"""
+Search Limits
+
+This module contains the time/node budget checked from inside the search, and the
+exception used to unwind the search when the budget runs out.
+"""
+
+import time
+from typing import Optional
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when its time or node budget is exhausted."""
+
+
+class SearchLimits:
+    """
+    Time and node budget for a search.
+
+    The search calls ``check`` at every interior node; the clock is only read every
+    ``check_interval`` calls to keep the overhead negligible.
+    """
+
+    def __init__(self, time_budget: Optional[float] = None, node_budget: Optional[int] = None,
+                 check_interval: int = 256):
+        """
+        Create a budget.
+
+        Args:
+            time_budget: Seconds the search may run, or None for no time limit
+            node_budget: Nodes the search may expand, or None for no node limit
+            check_interval: Number of check() calls between clock readings
+        """
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.check_interval = check_interval
+        self.started = None
+        self.deadline = None
+        self.node_limit = None
+        self.stopped = False
+        self._countdown = check_interval
+
+    def start(self, stats: dict) -> None:
+        """
+        Start the clock and node count.
+
+        Args:
+            stats: Stats dict whose 'nodes_expanded' counter the node budget applies to
+        """
+        self.started = time.perf_counter()
+        self.deadline = None if self.time_budget is None else self.started + self.time_budget
+        self.node_limit = None if self.node_budget is None else stats['nodes_expanded'] + self.node_budget
+        self._countdown = self.check_interval
+
+    def set_time_budget(self, time_budget: float) -> None:
+        """
+        Give a running search a deadline measured from when it started.
+
+        Used when a ponder search becomes the real search: time already spent
+        pondering counts toward the budget. Safe to call from another thread.
+
+        Args:
+            time_budget: Total seconds the search may run
+        """
+        self.time_budget = time_budget
+        if self.started is not None:
+            self.deadline = self.started + time_budget
+
+    def stop(self) -> None:
+        """Ask a running search to stop at its next check (safe to call from another thread)."""
+        self.stopped = True
+
+    def expired(self, stats: dict) -> bool:
+        """
+        Check whether the budget is used up.
+
+        Args:
+            stats: Stats dict of the running search
+
+        Returns:
+            True if the search should stop
+        """
+        if self.stopped:
+            return True
+        if self.node_limit is not None and stats['nodes_expanded'] >= self.node_limit:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def check(self, stats: dict) -> None:
+        """
+        Raise SearchTimeout if the budget is used up.
+
+        Args:
+            stats: Stats dict of the running search
+        """
+        self._countdown -= 1
+        if self._countdown > 0:
+            return
+        self._countdown = self.check_interval
+        if self.expired(stats):
+            raise SearchTimeout()
@@ -0,0 +1,299 @@
+"""
+Monte Carlo Tree Search
+
+This module contains an alternative to the alpha-beta search: UCT Monte Carlo
+Tree Search with random playouts. It needs no evaluation function (only won and
+lost games count) and is anytime: it can be stopped after any playout and still
+has a move.
+
+The tree is stored in parallel arrays indexed by node number (parent, first
+child, child count, visits, wins and the move leading to the node), about 20
+bytes per node instead of a Python object each. A node's children are stored
+next to each other, so they are found from the first child and the count.
+Positions are not stored; each iteration replays the moves from the root on one
+board with make_move/unmake_move.
+
+Between moves the tree is kept: when the next search starts from a position one
+or two plies below the old root (after the AI's move and the player's reply),
+that subtree becomes the new tree and its playouts are reused.
+"""
+
+import math
+import random
+import time
+from array import array
+from copy import copy
+from typing import List, Optional, Tuple
+
+from ..game.bitboard import RC_TO_SQUARE, SQUARE_TO_RC
+from .limits import SearchLimits
+from .minimax import Move
+
+
+EXPLORATION = 1.4  # UCT exploration constant
+MAX_PLAYOUT_PLIES = 200  # Playouts still running after this many plies are scored by the evaluation
+UNEXPANDED = -1  # first_child of a node whose children have not been generated yet
+
+
+class MonteCarloSearch:
+    """
+    UCT search over an array-backed tree that is kept between moves.
+
+    Not thread-safe: use one instance per searching thread.
+    """
+
+    def __init__(self, exploration: float = EXPLORATION, capture_policy: bool = True,
+                 max_nodes: int = 2_000_000, seed: Optional[int] = None):
+        """
+        Create an empty tree.
+
+        Args:
+            exploration: UCT exploration constant
+            capture_policy: In playouts, always take a capture when one is available
+                (otherwise moves are picked uniformly at random)
+            max_nodes: Tree size at which expansion stops (playouts continue)
+            seed: Seed of the playout random generator
+        """
+        self.exploration = exploration
+        self.capture_policy = capture_policy
+        self.max_nodes = max_nodes
+        self.rng = random.Random(seed)
+        self.root_board = None  # Position at the root, or None before the first search
+        self.root_maximizing = True  # True when the AI is to move at the root
+        self._clear()
+
+    def _clear(self) -> None:
+        """Reset the tree to a lone, unexpanded root."""
+        self.parent = array("i", [-1])
+        self.first_child = array("i", [UNEXPANDED])
+        self.child_count = array("H", [0])
+        self.visits = array("I", [0])
+        self.wins = array("f", [0.0])  # From the view of the side that moved into the node
+        self.move_from = array("B", [0])
+        self.move_to = array("B", [0])
+
+    def __len__(self) -> int:
+        return len(self.visits)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the tree arrays."""
+        return sum(len(column) * column.itemsize for column in
+                   (self.parent, self.first_child, self.child_count, self.visits, self.wins,
+                    self.move_from, self.move_to))
+
+    def _move(self, node: int) -> Move:
+        """Move leading to a node, as (old_x, old_y, new_x, new_y)."""
+        return SQUARE_TO_RC[self.move_from[node]] + SQUARE_TO_RC[self.move_to[node]]
+
+    def _expand(self, node: int, moves: List[Move]) -> None:
+        """Append a node's children (an empty list marks a lost, terminal position)."""
+        self.first_child[node] = len(self.visits)
+        self.child_count[node] = len(moves)
+        for old_x, old_y, new_x, new_y in moves:
+            self.parent.append(node)
+            self.first_child.append(UNEXPANDED)
+            self.child_count.append(0)
+            self.visits.append(0)
+            self.wins.append(0.0)
+            self.move_from.append(RC_TO_SQUARE[old_x * 8 + old_y])
+            self.move_to.append(RC_TO_SQUARE[new_x * 8 + new_y])
+
+    def _select(self, node: int) -> int:
+        """Child of an expanded node with the best UCT score (unvisited children first)."""
+        first = self.first_child[node]
+        log_visits = math.log(self.visits[node] or 1)
+        best, best_score = first, -1.0
+        for child in range(first, first + self.child_count[node]):
+            visits = self.visits[child]
+            if visits == 0:
+                return child
+            score = self.wins[child] / visits + self.exploration * math.sqrt(log_visits / visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _playout(self, board_obj, maximizing_player: bool, stats: dict) -> float:
+        """
+        Play random moves to the end of the game (the board is restored afterwards).
+
+        Returns:
+            1.0 if the AI wins, 0.0 if it loses, or the evaluation's verdict if the
+            playout is cut off
+        """
+        tokens = []
+        result = None
+        while len(tokens) < MAX_PLAYOUT_PLIES:
+            if board_obj.ComputerPieces == 0 or board_obj.PlayerPieces == 0:
+                result = 1.0 if board_obj.PlayerPieces == 0 else 0.0
+                break
+            moves = board_obj.generate_moves(maximizing_player)
+            if not moves:
+                result = 0.0 if maximizing_player else 1.0  # The side to move has lost
+                break
+            stats['playout_moves'] += 1
+            if self.capture_policy and abs(moves[0][0] - moves[0][2]) == 2:
+                # Captures come first; pick among them only
+                captures = [move for move in moves if abs(move[0] - move[2]) == 2]
+                move = captures[self.rng.randrange(len(captures))]
+            else:
+                move = moves[self.rng.randrange(len(moves))]
+            tokens.append(board_obj.make_move(move))
+            maximizing_player = not maximizing_player
+        if result is None:
+            evaluation = board_obj.evaluate_board()
+            result = 1.0 if evaluation > 0 else 0.0 if evaluation < 0 else 0.5
+        for token in reversed(tokens):
+            board_obj.unmake_move(token)
+        return result
+
+    def _find_root(self, board_obj, maximizing_player: bool) -> int:
+        """Node of the tree holding ``board_obj`` at most two plies below the root, or -1."""
+        if self.root_board is None:
+            return -1
+        target = board_obj.to_bytes()
+        board = copy(self.root_board)
+        if self.root_maximizing == maximizing_player and board.to_bytes() == target:
+            return 0
+        first = self.first_child[0]
+        if first == UNEXPANDED:
+            return -1
+        for child in range(first, first + self.child_count[0]):
+            token = board.make_move(self._move(child))
+            if self.root_maximizing != maximizing_player and board.to_bytes() == target:
+                return child
+            grand_first = self.first_child[child]
+            if grand_first != UNEXPANDED and self.root_maximizing == maximizing_player:
+                for grandchild in range(grand_first, grand_first + self.child_count[child]):
+                    grand_token = board.make_move(self._move(grandchild))
+                    found = board.to_bytes() == target
+                    board.unmake_move(grand_token)
+                    if found:
+                        return grandchild
+            board.unmake_move(token)
+        return -1
+
+    def _reroot(self, node: int) -> None:
+        """Keep only the subtree below ``node``, renumbered breadth-first so siblings stay adjacent."""
+        old = (self.first_child, self.child_count, self.visits, self.wins, self.move_from, self.move_to)
+        self._clear()
+        self.visits[0], self.wins[0] = old[2][node], old[3][node]
+        queue = [(node, 0)]  # (old index, new index) of kept nodes whose children are still to copy
+        for old_node, new_node in queue:
+            first = old[0][old_node]
+            if first == UNEXPANDED:
+                continue
+            self.first_child[new_node] = len(self.visits)
+            self.child_count[new_node] = old[1][old_node]
+            for old_child in range(first, first + old[1][old_node]):
+                queue.append((old_child, len(self.visits)))
+                self.parent.append(new_node)
+                self.first_child.append(UNEXPANDED)
+                self.child_count.append(old[1][old_child])
+                self.visits.append(old[2][old_child])
+                self.wins.append(old[3][old_child])
+                self.move_from.append(old[4][old_child])
+                self.move_to.append(old[5][old_child])
+
+    def principal_variation(self, max_length: int = 16) -> List[Move]:
+        """Most visited line from the root."""
+        line, node = [], 0
+        while len(line) < max_length and self.first_child[node] != UNEXPANDED and self.child_count[node]:
+            first = self.first_child[node]
+            node = max(range(first, first + self.child_count[node]), key=self.visits.__getitem__)
+            if self.visits[node] == 0:
+                break
+            line.append(self._move(node))
+        return line
+
+    def search(self, board_obj, maximizing_player: bool, stats: dict, time_budget: Optional[float] = None,
+               limits: Optional[SearchLimits] = None) -> Tuple[Optional[Move], float]:
+        """
+        Run playouts until the budget is used up, then pick the most visited move.
+
+        At least one playout is always run. The tree of the previous search is
+        reused when this position is part of it.
+
+        Args:
+            board_obj: Position to search (not modified)
+            maximizing_player: True when it is the AI's turn
+            stats: Stats dict; 'playouts', 'playouts_per_second', 'playout_moves',
+                'tree_nodes', 'tree_bytes', 'reused_nodes', 'reused_playouts',
+                'depth_reached' and 'principal_variation' are filled in, and
+                'nodes_expanded' counts the nodes added to the tree
+            time_budget: Seconds to spend, or None
+            limits: Budget to use instead of time_budget, e.g. so another thread can
+                stop the search (a node budget counts added tree nodes)
+
+        Returns:
+            Tuple of (best_move, AI win rate of that move between 0 and 1)
+        """
+        stats.setdefault('nodes_expanded', 0)
+        stats.setdefault('prunes', 0)
+        if limits is None:
+            limits = SearchLimits(time_budget)
+        limits.start(stats)
+        started = time.perf_counter()
+
+        root = self._find_root(board_obj, maximizing_player)
+        if root > 0:
+            self._reroot(root)
+        elif root < 0:
+            self._clear()
+        self.root_board = copy(board_obj)
+        self.root_maximizing = maximizing_player
+        stats['reused_nodes'] = len(self) - 1
+        stats['reused_playouts'] = self.visits[0]
+        stats['playouts'] = 0
+        stats['playout_moves'] = 0
+        max_depth = 0
+
+        board = copy(board_obj)
+        while True:
+            node, side = 0, maximizing_player
+            path = [0]
+            tokens = []
+            # Selection: descend through expanded nodes
+            while self.first_child[node] != UNEXPANDED and self.child_count[node]:
+                node = self._select(node)
+                tokens.append(board.make_move(self._move(node)))
+                side = not side
+                path.append(node)
+            # Expansion: add the leaf's children and step into one of them
+            if self.first_child[node] == UNEXPANDED and len(self) < self.max_nodes:
+                moves = board.generate_moves(side)
+                self._expand(node, moves)
+                stats['nodes_expanded'] += len(moves)
+                if moves:
+                    node = self.first_child[node] + self.rng.randrange(len(moves))
+                    tokens.append(board.make_move(self._move(node)))
+                    side = not side
+                    path.append(node)
+            max_depth = max(max_depth, len(path) - 1)
+
+            result = self._playout(board, side, stats)
+            # Backpropagation: each node scores the result for the side that moved into it
+            mover_is_ai = not maximizing_player  # Side that moved into the root
+            for visited in path:
+                self.visits[visited] += 1
+                self.wins[visited] += result if mover_is_ai else 1.0 - result
+                mover_is_ai = not mover_is_ai
+            for token in reversed(tokens):
+                board.unmake_move(token)
+            stats['playouts'] += 1
+            if limits.expired(stats):
+                break
+
+        elapsed = time.perf_counter() - started
+        stats['playouts_per_second'] = stats['playouts'] / elapsed if elapsed > 0 else 0.0
+        stats['tree_nodes'] = len(self)
+        stats['tree_bytes'] = self.memory_bytes
+        stats['depth_reached'] = max_depth
+        stats['principal_variation'] = self.principal_variation()
+
+        first = self.first_child[0]
+        if first == UNEXPANDED or not self.child_count[0]:
+            return None, 0.0 if maximizing_player else 1.0
+        best = max(range(first, first + self.child_count[0]), key=self.visits.__getitem__)
+        win_rate = self.wins[best] / self.visits[best] if self.visits[best] else 0.5
+        return self._move(best), win_rate if maximizing_player else 1.0 - win_rate
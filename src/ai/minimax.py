@@ -0,0 +1,250 @@
+"""
+Minimax Search Implementation
+
+This module contains the Minimax algorithm with Alpha-Beta pruning used by the
+Checkers AI, both in its original copy-per-move form and as an in-place variant
+that walks the game tree on a single mutable board.
+"""
+
+import math
+from copy import copy
+from typing import List, Optional, Tuple
+
+from .limits import SearchLimits
+from .ordering import MoveOrderer
+from .tablebase import EndgameTablebase
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable, position_key
+
+
+Move = Tuple[int, int, int, int]
+
+
+class SearchToolBox:
+    """Game tree search routines for the Checkers AI."""
+
+    @staticmethod
+    def minimax(board_obj, depth: int, alpha: float, beta: float,
+                maximizing_player: bool, stats: dict) -> Tuple[Optional[Move], float]:
+        """
+        Minimax algorithm with alpha-beta pruning over copied child boards.
+
+        Children are copied one at a time, so siblings after a cutoff are never
+        built; 'nodes_expanded' counts every generated move, as in
+        ``minimax_in_place``.
+
+        Args:
+            board_obj: Board to search from
+            depth: Remaining search depth
+            alpha: Best score the maximizing player can guarantee
+            beta: Best score the minimizing player can guarantee
+            maximizing_player: True when it is the AI's turn
+            stats: Dict with 'nodes_expanded' and 'prunes' counters to update
+
+        Returns:
+            Tuple of (best_move, score)
+        """
+        if depth == 0 or board_obj.ComputerPieces == 0 or board_obj.PlayerPieces == 0:
+            return None, board_obj.evaluate_board()  # Base case: return the board evaluation
+
+        best_move = None
+        valid_moves = board_obj.generate_moves(maximizing_player)
+        stats['nodes_expanded'] += len(valid_moves)  # Track the number of nodes expanded
+
+        if maximizing_player:
+            # Maximizing player (AI)
+            max_eval = -math.inf
+            for move in valid_moves:
+                child = copy(board_obj)
+                child.make_move(move)
+                _, eval = SearchToolBox.minimax(child, depth - 1, alpha, beta, False, stats)
+                if eval > max_eval:
+                    max_eval = eval
+                    best_move = move
+                alpha = max(alpha, eval)
+                if beta <= alpha:  # Alpha-beta pruning
+                    stats['prunes'] += 1
+                    break
+            return best_move, max_eval
+        else:
+            # Minimizing player (human)
+            min_eval = math.inf
+            for move in valid_moves:
+                child = copy(board_obj)
+                child.make_move(move)
+                _, eval = SearchToolBox.minimax(child, depth - 1, alpha, beta, True, stats)
+                if eval < min_eval:
+                    min_eval = eval
+                    best_move = move
+                beta = min(beta, eval)
+                if beta <= alpha:  # Alpha-beta pruning
+                    stats['prunes'] += 1
+                    break
+            return best_move, min_eval
+
+    @staticmethod
+    def _record_cutoff(stats: dict, ordering: Optional[MoveOrderer], move: Move, index: int,
+                       ply: int, depth: int, move_count: int) -> None:
+        """Count where in the move list a cutoff happened, and the moves it skipped, and credit the move."""
+        stats['cutoff_index_total'] = stats.get('cutoff_index_total', 0) + index
+        stats['pruned_moves'] = stats.get('pruned_moves', 0) + move_count - index - 1
+        if index == 0:
+            stats['first_move_cutoffs'] = stats.get('first_move_cutoffs', 0) + 1
+        positions = stats.setdefault('cutoff_positions', [])  # Cutoffs per move index
+        if len(positions) <= index:
+            positions.extend([0] * (index + 1 - len(positions)))
+        positions[index] += 1
+        if ordering is not None:
+            ordering.record_cutoff(move, ply, depth)
+
+    @staticmethod
+    def minimax_in_place(board_obj, depth: int, alpha: float, beta: float, maximizing_player: bool,
+                         stats: dict, table: Optional[TranspositionTable] = None,
+                         limits: Optional[SearchLimits] = None, pv: Optional[List[Move]] = None,
+                         ordering: Optional[MoveOrderer] = None, ply: int = 0,
+                         tablebase: Optional[EndgameTablebase] = None,
+                         pvs: bool = False) -> Tuple[Optional[Move], float]:
+        """
+        Minimax with alpha-beta pruning using make_move/unmake_move on one board.
+
+        Visits the same nodes in the same order as ``minimax`` and returns the same
+        result, but never copies the board, so memory use does not grow with the
+        number of nodes searched. The board is restored before returning.
+
+        With ``pvs`` it runs Principal Variation Search instead: the first move gets
+        the full window and later moves a null window that only tests whether they
+        beat the best score so far, with a full re-search when one does. Scores are
+        integers, so the result is the same while far fewer nodes are usually visited;
+        'null_window_searches' and 'pvs_researches' are counted in ``stats``.
+
+        Args:
+            board_obj: Board to search from (mutated during the search)
+            depth: Remaining search depth
+            alpha: Best score the maximizing player can guarantee
+            beta: Best score the minimizing player can guarantee
+            maximizing_player: True when it is the AI's turn
+            stats: Dict with 'nodes_expanded' and 'prunes' counters to update
+            table: Optional transposition table shared across the search
+            limits: Optional budget; SearchTimeout is raised (leaving the board
+                mid-search) once it runs out
+            pv: Optional principal variation from a previous search, tried first
+            ordering: Optional move orderer (hash/PV move, killers, history)
+            ply: Distance from the root, used to index killer moves
+            tablebase: Optional endgame table; positions below the root that it
+                covers are scored from it instead of being searched
+            pvs: Use Principal Variation Search
+
+        Returns:
+            Tuple of (best_move, score)
+        """
+        if tablebase is not None and ply > 0 and \
+                board_obj.PlayerPieces + board_obj.ComputerPieces <= tablebase.max_pieces:
+            score = tablebase.probe(board_obj, maximizing_player)
+            if score is not None:
+                stats['tablebase_hits'] = stats.get('tablebase_hits', 0) + 1
+                return None, score
+
+        if depth == 0 or board_obj.ComputerPieces == 0 or board_obj.PlayerPieces == 0:
+            return None, board_obj.evaluate_board()  # Base case: return the board evaluation
+
+        if limits is not None:
+            limits.check(stats)
+
+        hash_move = None
+        if table is not None:
+            key = position_key(board_obj, maximizing_player)
+            entry = table.probe(key, stats)
+            if entry is not None:
+                hash_move = entry[3]
+            if entry is not None and entry[0] >= depth:
+                _, score, bound, move = entry
+                if bound == EXACT:
+                    return move, score
+                if bound == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if beta <= alpha:
+                    return move, score
+            window = (alpha, beta)
+
+        best_move = None
+        valid_moves = board_obj.generate_moves(maximizing_player)
+        stats['nodes_expanded'] += len(valid_moves)  # Track the number of nodes expanded
+        if ordering is not None:
+            valid_moves = ordering.order(valid_moves, ply, pv[0] if pv else hash_move)
+        elif pv and pv[0] in valid_moves:
+            # Search the previous principal variation first
+            valid_moves.remove(pv[0])
+            valid_moves.insert(0, pv[0])
+
+        if maximizing_player:
+            # Maximizing player (AI)
+            best_eval = -math.inf
+            for index, move in enumerate(valid_moves):
+                token = board_obj.make_move(move)
+                child_pv = pv[1:] if pv and move == pv[0] else None
+                if pvs and index > 0 and alpha != -math.inf:
+                    # Null window: can this move beat alpha at all?
+                    stats['null_window_searches'] = stats.get('null_window_searches', 0) + 1
+                    _, eval = SearchToolBox.minimax_in_place(board_obj, depth - 1, alpha, alpha + 1, False, stats,
+                                                             table, limits, child_pv, ordering, ply + 1, tablebase,
+                                                             pvs)
+                    if alpha < eval < beta:
+                        stats['pvs_researches'] = stats.get('pvs_researches', 0) + 1
+                        _, eval = SearchToolBox.minimax_in_place(board_obj, depth - 1, alpha, beta, False, stats,
+                                                                 table, limits, child_pv, ordering, ply + 1,
+                                                                 tablebase, pvs)
+                else:
+                    _, eval = SearchToolBox.minimax_in_place(board_obj, depth - 1, alpha, beta, False, stats,
+                                                             table, limits, child_pv, ordering, ply + 1, tablebase,
+                                                             pvs)
+                board_obj.unmake_move(token)
+                if eval > best_eval:
+                    best_eval = eval
+                    best_move = move
+                alpha = max(alpha, eval)
+                if beta <= alpha:  # Alpha-beta pruning
+                    stats['prunes'] += 1
+                    SearchToolBox._record_cutoff(stats, ordering, move, index, ply, depth, len(valid_moves))
+                    break
+        else:
+            # Minimizing player (human)
+            best_eval = math.inf
+            for index, move in enumerate(valid_moves):
+                token = board_obj.make_move(move)
+                child_pv = pv[1:] if pv and move == pv[0] else None
+                if pvs and index > 0 and beta != math.inf:
+                    # Null window: can this move get below beta at all?
+                    stats['null_window_searches'] = stats.get('null_window_searches', 0) + 1
+                    _, eval = SearchToolBox.minimax_in_place(board_obj, depth - 1, beta - 1, beta, True, stats,
+                                                             table, limits, child_pv, ordering, ply + 1, tablebase,
+                                                             pvs)
+                    if alpha < eval < beta:
+                        stats['pvs_researches'] = stats.get('pvs_researches', 0) + 1
+                        _, eval = SearchToolBox.minimax_in_place(board_obj, depth - 1, alpha, beta, True, stats,
+                                                                 table, limits, child_pv, ordering, ply + 1,
+                                                                 tablebase, pvs)
+                else:
+                    _, eval = SearchToolBox.minimax_in_place(board_obj, depth - 1, alpha, beta, True, stats,
+                                                             table, limits, child_pv, ordering, ply + 1, tablebase,
+                                                             pvs)
+                board_obj.unmake_move(token)
+                if eval < best_eval:
+                    best_eval = eval
+                    best_move = move
+                beta = min(beta, eval)
+                if beta <= alpha:  # Alpha-beta pruning
+                    stats['prunes'] += 1
+                    SearchToolBox._record_cutoff(stats, ordering, move, index, ply, depth, len(valid_moves))
+                    break
+
+        if table is not None:
+            # Classify the score against the window this node was actually searched with
+            if best_eval <= window[0]:
+                bound = UPPER
+            elif best_eval >= window[1]:
+                bound = LOWER
+            else:
+                bound = EXACT
+            table.store(key, depth, best_eval, bound, best_move)
+        return best_move, best_eval
@@ -0,0 +1,115 @@
+"""
+Move Ordering
+
+This module contains the move-ordering component used by the in-place search:
+the hash/PV move first, then captures, then per-ply killer moves, then the
+remaining quiet moves sorted by a from/to history table that is credited on
+every beta cutoff.
+"""
+
+from typing import List, Optional, Tuple
+
+
+Move = Tuple[int, int, int, int]
+
+# Sort keys for the ordering bands; history scores stay below KILLER_SCORE
+FIRST_MOVE_SCORE = 1 << 62
+CAPTURE_SCORE = 1 << 61
+KILLER_SCORE = 1 << 60
+
+
+class MoveOrderer:
+    """
+    Orders moves with the hash/PV move, killer moves and the history heuristic.
+
+    A single instance is shared by every node of a search (and may be kept across
+    searches, see ``new_search``).
+    """
+
+    def __init__(self, max_ply: int = 64, killer_slots: int = 2):
+        """
+        Create empty killer and history tables.
+
+        Args:
+            max_ply: Deepest ply that gets its own killer slots
+            killer_slots: Killer moves remembered per ply
+        """
+        self.max_ply = max_ply
+        self.killer_slots = killer_slots
+        self.killers: List[List[Move]] = [[] for _ in range(max_ply)]
+        self.history = [0] * (64 * 64)  # Indexed by from_square * 64 + to_square
+
+    def new_search(self) -> None:
+        """Forget killers and age the history table before searching a new position."""
+        self.killers = [[] for _ in range(self.max_ply)]
+        self.history = [score >> 1 for score in self.history]
+
+    def order(self, moves: List[Move], ply: int, first_move: Optional[Move] = None) -> List[Move]:
+        """
+        Sort moves best-first.
+
+        Captures keep their generated order among themselves, as do quiet moves
+        with equal history scores.
+
+        Args:
+            moves: Moves generated for the node
+            ply: Distance from the root
+            first_move: Hash or PV move to search first, if any
+
+        Returns:
+            New list of the same moves in search order
+        """
+        killers = self.killers[ply] if ply < self.max_ply else ()
+        history = self.history
+
+        def score(move: Move) -> int:
+            if move == first_move:
+                return FIRST_MOVE_SCORE
+            old_x, old_y, new_x, new_y = move
+            if abs(new_x - old_x) == 2:
+                return CAPTURE_SCORE
+            if move in killers:
+                return KILLER_SCORE + self.killer_slots - killers.index(move)
+            return history[(old_x * 8 + old_y) * 64 + new_x * 8 + new_y]
+
+        return sorted(moves, key=score, reverse=True)
+
+    def record_cutoff(self, move: Move, ply: int, depth: int) -> None:
+        """
+        Credit a move that caused a beta cutoff.
+
+        Args:
+            move: Move that refuted the node
+            ply: Distance from the root
+            depth: Remaining depth at the node
+        """
+        old_x, old_y, new_x, new_y = move
+        if abs(new_x - old_x) == 2:
+            return  # Captures are already searched early
+        self.history[(old_x * 8 + old_y) * 64 + new_x * 8 + new_y] += depth * depth
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if move in killers:
+                killers.remove(move)
+            killers.insert(0, move)
+            del killers[self.killer_slots:]
+
+
+def summarize_cutoffs(stats: dict) -> None:
+    """
+    Add cutoff-quality ratios to a stats dict.
+
+    Sets 'first_move_cutoff_rate' (share of cutoffs caused by the first move
+    searched), 'average_cutoff_index' (mean position of the cutoff move) and
+    'pruning_gains' (percentage of generated moves never searched because of a cutoff).
+
+    Args:
+        stats: Stats dict with 'prunes', 'first_move_cutoffs', 'cutoff_index_total'
+            and 'pruned_moves'
+    """
+    if stats.get('nodes_expanded'):
+        stats['pruning_gains'] = 100 * stats.get('pruned_moves', 0) / stats['nodes_expanded']
+    cutoffs = stats.get('prunes', 0)
+    if cutoffs:
+        stats['first_move_cutoff_rate'] = stats.get('first_move_cutoffs', 0) / cutoffs
+        stats['average_cutoff_index'] = stats.get('cutoff_index_total', 0) / cutoffs
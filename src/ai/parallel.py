@@ -0,0 +1,219 @@
+"""
+Parallel Root-Split Search
+
+This module splits the root moves of a minimax search across a process pool.
+The first root move is searched alone (young brothers wait) to establish a bound;
+the remaining moves are then handed out as workers free up. Finished root scores
+go into an array shared with the workers, and each worker reads the best bound
+from it when it starts a move, not when the move was queued. Ties are resolved
+exactly as in the serial search, so the best move and score match
+``SearchToolBox.minimax_in_place`` at the same depth.
+"""
+
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Optional, Tuple
+
+from .minimax import Move, SearchToolBox
+from .ordering import MoveOrderer
+from .transposition import TranspositionTable
+
+
+# Most root moves a position can have: at most 32 pieces, each with at most 4 moves
+MAX_ROOT_MOVES = 128
+
+# Per-process search state, created by the pool initializer
+_worker_table = None
+_worker_ordering = None
+_worker_search_id = None  # Search the table and orderer hold results of
+_root_scores = None  # Shared exact scores of the finished root moves (NaN while unknown)
+
+
+def _init_worker(table_megabytes: float, root_scores) -> None:
+    """Give each worker process its own transposition table and move orderer."""
+    global _worker_table, _worker_ordering, _root_scores
+    _worker_table = TranspositionTable(table_megabytes)
+    _worker_ordering = MoveOrderer()
+    _root_scores = root_scores
+
+
+def _search_root_move(board_obj, move: Move, index: int, depth: int, maximizing_player: bool,
+                      search_id: int) -> Tuple[float, float, dict, int, float]:
+    """
+    Search the subtree below root move ``index`` inside a worker process.
+
+    The worker's table and orderer are shared by the root moves of one search but
+    cleared when a new search starts: entries stored by a deeper earlier search
+    would otherwise be reused and change the scores. The bound is read from the
+    shared root scores just before searching.
+
+    Returns:
+        Tuple of (score, bound searched with, stats, worker pid, CPU seconds spent)
+    """
+    global _worker_ordering, _worker_search_id
+    started = time.process_time()
+    if search_id != _worker_search_id:
+        _worker_table.clear()
+        _worker_ordering = MoveOrderer()
+        _worker_search_id = search_id
+    with _root_scores.get_lock():
+        scores = _root_scores[:]
+    bound = _root_bound(((i, score) for i, score in enumerate(scores) if not math.isnan(score)),
+                        index, maximizing_player)
+    alpha, beta = (bound, math.inf) if maximizing_player else (-math.inf, bound)
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    board_obj.make_move(move)
+    _, score = SearchToolBox.minimax_in_place(board_obj, depth - 1, alpha, beta, not maximizing_player,
+                                              stats, _worker_table, None, None, _worker_ordering, 1)
+    return score, bound, stats, os.getpid(), time.process_time() - started
+
+
+def _tie_bound(score: float, maximizing_player: bool) -> float:
+    """
+    Bound a move searched *before* an already-scored later move must beat.
+
+    Scores are integers (or infinite), so matching ``score`` means beating
+    ``score - 1`` for the maximizer and ``score + 1`` for the minimizer.
+    """
+    if maximizing_player:
+        return sys.float_info.max if score == math.inf else score - 1
+    return -sys.float_info.max if score == -math.inf else score + 1
+
+
+def _root_bound(exact: Iterable[Tuple[int, float]], index: int, maximizing_player: bool) -> float:
+    """
+    Best score root move ``index`` must beat to change the serial result.
+
+    Args:
+        exact: (root move index, exact score) of the moves finished so far
+        index: Root move about to be searched
+        maximizing_player: True when it is the AI's turn
+    """
+    bounds = [score if i < index else _tie_bound(score, maximizing_player) for i, score in exact]
+    if not bounds:
+        return -math.inf if maximizing_player else math.inf
+    return max(bounds) if maximizing_player else min(bounds)
+
+
+class ParallelSearch:
+    """
+    Process pool that searches root moves in parallel.
+
+    Use as a context manager, or call ``close`` when done, to shut the pool down.
+    """
+
+    def __init__(self, workers: Optional[int] = None, table_megabytes: float = 16):
+        """
+        Start the worker processes.
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            table_megabytes: Transposition table size for each worker
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.root_scores = multiprocessing.Array('d', MAX_ROOT_MOVES)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(table_megabytes, self.root_scores))
+        self.searches = 0  # Number of searches started, used as the id of the next one
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self.executor.shutdown()
+
+    def __enter__(self) -> 'ParallelSearch':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def search(self, board_obj, depth: int, maximizing_player: bool, stats: dict,
+               measure_speedup: bool = False) -> Tuple[Optional[Move], float]:
+        """
+        Search a position to a fixed depth using all workers.
+
+        Besides 'nodes_expanded' and 'prunes', fills in 'parallel_workers',
+        'worker_nodes' (nodes expanded per worker pid), 'parallel_wall_time' and
+        'worker_utilization' (summed worker CPU time over workers times wall-clock
+        time, 1.0 when every worker was busy throughout). With ``measure_speedup``
+        the position is then also searched serially in this process, adding
+        'serial_wall_time' and 'speedup' (serial over parallel wall-clock time).
+
+        Args:
+            board_obj: Position to search (not modified)
+            depth: Search depth
+            maximizing_player: True when it is the AI's turn
+            stats: Stats dict to update
+            measure_speedup: Time a serial search of the same depth as well
+
+        Returns:
+            Tuple of (best_move, score), identical to the serial search
+        """
+        if depth == 0 or board_obj.ComputerPieces == 0 or board_obj.PlayerPieces == 0:
+            return None, board_obj.evaluate_board()  # Base case: return the board evaluation
+
+        started = time.perf_counter()
+        self.searches += 1
+        search_id = self.searches
+        moves = board_obj.generate_moves(maximizing_player)
+        if len(moves) > MAX_ROOT_MOVES:
+            raise ValueError(f"{len(moves)} root moves, at most {MAX_ROOT_MOVES} supported")
+        stats['nodes_expanded'] += len(moves)  # Track the number of nodes expanded
+        worker_nodes = stats.setdefault('worker_nodes', {})
+        exact = {}  # Root move index -> exact score
+        pending = {}  # Future -> root move index
+        work_time = 0.0
+        with self.root_scores.get_lock():
+            self.root_scores[:] = [math.nan] * MAX_ROOT_MOVES
+
+        def submit(index: int) -> None:
+            future = self.executor.submit(_search_root_move, board_obj, moves[index], index, depth,
+                                          maximizing_player, search_id)
+            pending[future] = index
+
+        def collect() -> None:
+            nonlocal work_time
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                score, bound, child_stats, pid, cpu_time = future.result()
+                if abs(bound) == math.inf or ((score > bound) if maximizing_player else (score < bound)):
+                    exact[index] = score  # Inside the window, so the score is exact
+                    with self.root_scores.get_lock():
+                        self.root_scores[index] = score
+                stats['nodes_expanded'] += child_stats['nodes_expanded']
+                stats['prunes'] += child_stats['prunes']
+                worker_nodes[pid] = worker_nodes.get(pid, 0) + child_stats['nodes_expanded']
+                work_time += cpu_time
+
+        if moves:
+            # Young brothers wait: the first move alone establishes a bound
+            submit(0)
+            collect()
+        next_index = 1
+        while next_index < len(moves) or pending:
+            while next_index < len(moves) and len(pending) < self.workers:
+                submit(next_index)
+                next_index += 1
+            collect()
+
+        wall_time = time.perf_counter() - started
+        stats['parallel_workers'] = self.workers
+        stats['parallel_wall_time'] = wall_time
+        stats['worker_utilization'] = work_time / (wall_time * self.workers) if wall_time > 0 else 1.0
+        if measure_speedup:
+            started = time.perf_counter()
+            SearchToolBox.minimax_in_place(board_obj, depth, -math.inf, math.inf, maximizing_player,
+                                           {'nodes_expanded': 0, 'prunes': 0})
+            stats['serial_wall_time'] = time.perf_counter() - started
+            stats['speedup'] = stats['serial_wall_time'] / wall_time if wall_time > 0 else 1.0
+
+        if not exact:
+            return None, -math.inf if maximizing_player else math.inf
+        # The serial search keeps the first move reaching the best score
+        sign = 1 if maximizing_player else -1
+        best_index = min(exact, key=lambda i: (-sign * exact[i], i))
+        return moves[best_index], exact[best_index]
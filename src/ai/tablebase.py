@@ -0,0 +1,256 @@
+"""
+Endgame Tablebases
+
+This module builds win/loss/draw tables with distance to the result for every
+position with up to N men, by retrograde analysis, and probes them from a
+memory-mapped file during the search.
+
+Men never promote and only move forward, so every move brings the game closer to
+its end and positions can be solved backwards: slices with fewer pieces first
+(captures lead there), and within a slice in order of increasing "potential", the
+number of rows the men can still advance (every quiet move lowers it by one).
+A side with no pieces or no legal move has lost.
+
+File layout (little endian):
+
+    header   magic b"CKTB", version (u16), max_pieces (u16), slice count (u32)
+    slices   (player men, AI men, offset of the slice's first byte) as (u8, u8, 6 pad, u64)
+    data     one byte per position: result << 6 | distance in plies
+
+Inside a slice the index of a position is
+``(rank(player squares) * C(32 - p, c) + rank(AI squares among the rest)) * 2 + side``
+where ``rank`` is the combinatorial (colex) rank of a square set and side is 1 when
+the AI is to move. Positions with kings are not covered.
+"""
+
+import mmap
+import struct
+from array import array
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from ..game.bitboard import BitboardGameBoard, RC_TO_SQUARE
+
+
+DEFAULT_PATH = "endgame.cktb"  # Where the builder writes and the game looks by default
+
+MAGIC = b"CKTB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+SLICE = struct.Struct("<BB6xQ")
+
+# Results, stored in the top two bits of each entry (from the side to move's view)
+LOSS, DRAW, WIN = 0, 1, 2
+MAX_DISTANCE = 63
+
+# Score returned for a won position; faster wins score higher (WIN_SCORE - distance)
+WIN_SCORE = 1000
+
+# Binomial coefficients C(n, k) for 0 <= n, k <= 32 from Pascal's triangle (math.comb needs Python 3.8)
+BINOMIAL = [[1] + [0] * 32]
+for _n in range(1, 33):
+    BINOMIAL.append([1] + [BINOMIAL[_n - 1][_k - 1] + BINOMIAL[_n - 1][_k] for _k in range(1, 33)])
+
+# Rows each man can still advance from each square
+PLAYER_POTENTIAL = [s >> 2 for s in range(32)]  # 'B' men move toward row 0
+COMPUTER_POTENTIAL = [7 - (s >> 2) for s in range(32)]  # 'C' men move toward row 7
+
+
+def _slices(max_pieces: int) -> List[Tuple[int, int]]:
+    """(player men, AI men) of every slice, fewest pieces first."""
+    return [(player, total - player) for total in range(2, max_pieces + 1) for player in range(1, total)]
+
+
+def _slice_size(player: int, computer: int) -> int:
+    """Number of entries in a slice (both sides to move)."""
+    return BINOMIAL[32][player] * BINOMIAL[32 - player][computer] * 2
+
+
+def _squares(bb: int) -> List[int]:
+    """Set squares of a bitboard, ascending."""
+    squares = []
+    while bb:
+        low = bb & -bb
+        squares.append(low.bit_length() - 1)
+        bb ^= low
+    return squares
+
+
+def _rank(squares: List[int]) -> int:
+    """Colex rank of an ascending square set."""
+    return sum(BINOMIAL[square][i + 1] for i, square in enumerate(squares))
+
+
+def _index(player_bb: int, computer_bb: int, computer_to_move: bool) -> int:
+    """Index of a position inside its slice."""
+    player_squares = _squares(player_bb)
+    # AI squares are ranked among the squares the player does not occupy
+    computer_squares = [square - bin(player_bb & ((1 << square) - 1)).count("1") for square in _squares(computer_bb)]
+    free = BINOMIAL[32 - len(player_squares)][len(computer_squares)]
+    return (_rank(player_squares) * free + _rank(computer_squares)) * 2 + computer_to_move
+
+
+def _combine(children: List[int]) -> int:
+    """Entry of a position from its children's entries (each from the opponent's view)."""
+    if not children:
+        return LOSS << 6  # No legal move
+    losses = [entry & MAX_DISTANCE for entry in children if entry >> 6 == LOSS]
+    if losses:
+        return WIN << 6 | min(min(losses) + 1, MAX_DISTANCE)
+    if any(entry >> 6 == DRAW for entry in children):
+        return DRAW << 6
+    return LOSS << 6 | min(max(entry & MAX_DISTANCE for entry in children) + 1, MAX_DISTANCE)
+
+
+def build_tablebase(path: str, max_pieces: int = 4, progress=None) -> None:
+    """
+    Solve every position with up to ``max_pieces`` men and write the table file.
+
+    Args:
+        path: Output file
+        max_pieces: Largest total number of men covered
+        progress: Optional callable receiving (player men, AI men) as each slice starts
+    """
+    slices = _slices(max_pieces)
+    offsets: Dict[Tuple[int, int], int] = {}
+    offset = HEADER.size + SLICE.size * len(slices)
+    for key in slices:
+        offsets[key] = offset
+        offset += _slice_size(*key)
+    data = bytearray(offset)
+    board = BitboardGameBoard()
+    board.king_bb = 0
+
+    def lookup(player_bb: int, computer_bb: int, computer_to_move: bool) -> int:
+        if not (computer_bb if computer_to_move else player_bb):
+            return LOSS << 6  # The side to move has no pieces left
+        key = (bin(player_bb).count("1"), bin(computer_bb).count("1"))
+        return data[offsets[key] + _index(player_bb, computer_bb, computer_to_move)]
+
+    for player, computer in slices:
+        if progress is not None:
+            progress(player, computer)
+        # Bucket the slice by potential so every quiet move's result is solved first
+        buckets: Dict[int, array] = {}
+        for player_squares in combinations(range(32), player):
+            player_bb = sum(1 << square for square in player_squares)
+            player_potential = sum(PLAYER_POTENTIAL[square] for square in player_squares)
+            free = [square for square in range(32) if not player_bb >> square & 1]
+            for computer_squares in combinations(free, computer):
+                potential = player_potential + sum(COMPUTER_POTENTIAL[square] for square in computer_squares)
+                bucket = buckets.setdefault(potential, array("Q"))
+                bucket.append(player_bb << 32 | sum(1 << square for square in computer_squares))
+
+        base = offsets[(player, computer)]
+        for potential in sorted(buckets):
+            for packed in buckets[potential]:
+                board.player_bb, board.computer_bb = packed >> 32, packed & 0xFFFFFFFF
+                for computer_to_move in (False, True):
+                    children = []
+                    for src, dst, captured in board._generate(computer_to_move):
+                        moved = (1 << src) | (1 << dst)
+                        removed = 1 << captured if captured >= 0 else 0
+                        if computer_to_move:
+                            child = (board.player_bb & ~removed, board.computer_bb ^ moved)
+                        else:
+                            child = (board.player_bb ^ moved, board.computer_bb & ~removed)
+                        children.append(lookup(child[0], child[1], not computer_to_move))
+                    index = _index(board.player_bb, board.computer_bb, computer_to_move)
+                    data[base + index] = _combine(children)
+
+    header = HEADER.pack(MAGIC, VERSION, max_pieces, len(slices))
+    header += b"".join(SLICE.pack(player, computer, offsets[(player, computer)]) for player, computer in slices)
+    data[:len(header)] = header
+    with open(path, "wb") as output:
+        output.write(data)
+
+
+class EndgameTablebase:
+    """
+    Read-only, memory-mapped endgame table.
+
+    Only the pages holding probed positions are ever loaded, so an open table
+    costs almost no resident memory until the game reaches it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a table file built by ``build_tablebase``.
+
+        Args:
+            path: Table file
+
+        Raises:
+            ValueError: If the file is not a tablebase of this version
+        """
+        with open(path, "rb") as table_file:
+            self.data = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.max_pieces, count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {VERSION} checkers tablebase")
+        self.offsets = {}
+        for i in range(count):
+            player, computer, offset = SLICE.unpack_from(self.data, HEADER.size + i * SLICE.size)
+            self.offsets[(player, computer)] = offset
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.data.close()
+
+    def lookup(self, board_obj, maximizing_player: bool) -> Optional[Tuple[int, int]]:
+        """
+        Look up a position's exact result.
+
+        Args:
+            board_obj: Board of either backend
+            maximizing_player: True when it is the AI's turn
+
+        Returns:
+            (result, distance in plies) from the side to move's view, or None if
+            the position has kings or too many pieces
+        """
+        if board_obj.PlayerPieces + board_obj.ComputerPieces > self.max_pieces:
+            return None
+        if hasattr(board_obj, "player_bb"):
+            if board_obj.king_bb:
+                return None
+            player_bb, computer_bb = board_obj.player_bb, board_obj.computer_bb
+        else:
+            player_bb = computer_bb = 0
+            for x, row in enumerate(board_obj.Matrix):
+                for y, piece in enumerate(row):
+                    if piece in ("BK", "CK"):
+                        return None
+                    if piece == "B":
+                        player_bb |= 1 << RC_TO_SQUARE[x * 8 + y]
+                    elif piece == "C":
+                        computer_bb |= 1 << RC_TO_SQUARE[x * 8 + y]
+        if not (computer_bb if maximizing_player else player_bb):
+            return LOSS, 0
+        if not (player_bb if maximizing_player else computer_bb):
+            return WIN, 0  # Not reached by play, but the opponent has nothing left
+        offset = self.offsets[(bin(player_bb).count("1"), bin(computer_bb).count("1"))]
+        entry = self.data[offset + _index(player_bb, computer_bb, maximizing_player)]
+        return entry >> 6, entry & MAX_DISTANCE
+
+    def probe(self, board_obj, maximizing_player: bool) -> Optional[int]:
+        """
+        Score a position for the AI from the table.
+
+        Args:
+            board_obj: Board of either backend
+            maximizing_player: True when it is the AI's turn
+
+        Returns:
+            ``WIN_SCORE - distance`` if the AI wins, its negation if it loses, 0 for a
+            draw, or None if the position is not covered
+        """
+        found = self.lookup(board_obj, maximizing_player)
+        if found is None:
+            return None
+        result, distance = found
+        if result == DRAW:
+            return 0
+        score = WIN_SCORE - distance
+        return score if (result == WIN) == maximizing_player else -score
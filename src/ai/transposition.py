@@ -0,0 +1,126 @@
+"""
+Transposition Table Implementation
+
+This module contains a bounded, Zobrist-keyed transposition table for the
+minimax search. Each bucket holds two entries: a depth-preferred slot that only
+gives way to deeper (or equally deep) results, and an always-replace slot that
+takes everything else.
+"""
+
+from typing import Optional, Tuple
+
+from ..game.zobrist import SIDE_KEY
+
+
+# Bound types stored with each score
+EXACT = 0  # Score is the exact minimax value
+LOWER = 1  # Search failed high: true value >= score
+UPPER = 2  # Search failed low: true value <= score
+
+# Rough memory cost of one slot (key + entry tuple and its fields) used to size the table
+ENTRY_BYTES = 160
+
+
+def position_key(board_obj, maximizing_player: bool) -> int:
+    """
+    Combine a board's piece hash with the side to move.
+
+    Args:
+        board_obj: Board exposing a ``zobrist_hash`` attribute
+        maximizing_player: True when it is the AI's turn
+
+    Returns:
+        64-bit key for the table
+    """
+    return board_obj.zobrist_hash ^ SIDE_KEY if maximizing_player else board_obj.zobrist_hash
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table with depth-preferred / always-replace buckets.
+
+    Entries are (depth, score, bound, best_move) tuples keyed by a 64-bit hash.
+    """
+
+    def __init__(self, max_megabytes: float = 16):
+        """
+        Allocate the table.
+
+        Args:
+            max_megabytes: Approximate memory cap for the table
+        """
+        self.buckets = max(1, int(max_megabytes * 1024 * 1024) // (2 * ENTRY_BYTES))
+        self.keys = [None] * (2 * self.buckets)  # Slot 2*i is depth-preferred, 2*i+1 always-replace
+        self.entries = [None] * (2 * self.buckets)
+
+    def clear(self) -> None:
+        """Remove every entry from the table."""
+        self.keys = [None] * (2 * self.buckets)
+        self.entries = [None] * (2 * self.buckets)
+
+    def probe(self, key: int, stats: dict) -> Optional[Tuple[int, float, int, Optional[tuple]]]:
+        """
+        Look up a position.
+
+        Args:
+            key: 64-bit position hash (including the side to move)
+            stats: Dict in which 'tt_hits', 'tt_misses' and 'tt_collisions' are counted
+
+        Returns:
+            The stored (depth, score, bound, best_move) entry, or None on a miss
+        """
+        slot = 2 * (key % self.buckets)
+        if self.keys[slot] == key:
+            stats['tt_hits'] = stats.get('tt_hits', 0) + 1
+            return self.entries[slot]
+        if self.keys[slot + 1] == key:
+            stats['tt_hits'] = stats.get('tt_hits', 0) + 1
+            return self.entries[slot + 1]
+
+        stats['tt_misses'] = stats.get('tt_misses', 0) + 1
+        if self.keys[slot] is not None and self.keys[slot + 1] is not None:
+            # Both slots are held by other positions that map to this bucket
+            stats['tt_collisions'] = stats.get('tt_collisions', 0) + 1
+        return None
+
+    def get(self, key: int) -> Optional[Tuple[int, float, int, Optional[tuple]]]:
+        """
+        Look up a position without touching any statistics.
+
+        Args:
+            key: 64-bit position hash (including the side to move)
+
+        Returns:
+            The stored (depth, score, bound, best_move) entry, or None
+        """
+        slot = 2 * (key % self.buckets)
+        if self.keys[slot] == key:
+            return self.entries[slot]
+        if self.keys[slot + 1] == key:
+            return self.entries[slot + 1]
+        return None
+
+    def store(self, key: int, depth: int, score: float, bound: int, best_move: Optional[tuple]) -> None:
+        """
+        Store a search result, keeping the deeper entry in the depth-preferred slot.
+
+        Args:
+            key: 64-bit position hash (including the side to move)
+            depth: Remaining depth the score was searched to
+            score: Score returned by the search
+            bound: EXACT, LOWER or UPPER
+            best_move: Best move found, if any
+        """
+        slot = 2 * (key % self.buckets)
+        entry = (depth, score, bound, best_move)
+        current = self.entries[slot]
+        if current is None or self.keys[slot] == key or depth >= current[0]:
+            self.keys[slot] = key
+            self.entries[slot] = entry
+        else:
+            self.keys[slot + 1] = key
+            self.entries[slot + 1] = entry
+
+    def __len__(self) -> int:
+        """Number of occupied slots."""
+        return sum(1 for key in self.keys if key is not None)
@@ -0,0 +1,217 @@
+"""
+Evaluation Weight Tuning
+
+This module fits the per-square weights of ``evaluate_board`` to game outcomes
+(Texel tuning). Every quiet position of the recorded games is labelled with the
+game's result (1 when the AI won, 0 when the player won) and the weights are
+chosen to minimize the mean squared error between the labels and the predicted
+win probability ``sigmoid(k * evaluation)``.
+
+Positions are held as an (N, 64) uint8 indicator matrix, one column per square
+and side ('B' men, then 'C' men), so the evaluation of all positions is one
+matrix-vector product and so is the gradient; the fit runs a fixed number of
+full-batch Adam steps over it. ``k`` is fitted first, with the current weights,
+so the tuned weights stay on the scale of the current evaluation.
+
+NumPy is an optional dependency and is only needed when this module is imported.
+"""
+
+import math
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..game import evaluation
+from ..game.bitboard import (BitboardGameBoard, COMPUTER_DIRECTIONS, DIRECTIONS, FULL_MASK, OPPOSITE,
+                             PLAYER_DIRECTIONS, SHIFTS, SQUARE_TO_RC)
+from ..game.records import COMPUTER_WIN, PLAYER_WIN, read_games
+from .tablebase import MAX_DISTANCE, WIN_SCORE
+
+
+_SHIFTS = np.arange(32, dtype=np.int64)
+_CHUNK_ROWS = 1 << 18  # Rows converted to float32 at a time, to bound temporary memory
+
+
+def _has_capture(own: np.ndarray, opponent: np.ndarray, kings: np.ndarray, forward: Tuple[int, ...]) -> np.ndarray:
+    """Whether the side owning ``own`` can capture, for arrays of bitboards (as in ``_generate``)."""
+    empty = FULL_MASK & ~(own | opponent)
+    found = np.zeros(len(own), dtype=bool)
+    for d in DIRECTIONS:
+        movers = own if d in forward else own & kings
+        back = SHIFTS[OPPOSITE[d]]
+        found |= (movers & back(opponent & back(empty))) != 0
+    return found
+
+
+def load_positions(paths: Iterable[str], quiet_only: bool = True, validation_every: int = 10
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collect the labelled positions of finished games from game record files.
+
+    Positions with kings (which are not scored) are skipped, and so, with
+    ``quiet_only``, are positions where the side to move can capture, whose
+    evaluation says little about the outcome.
+
+    Args:
+        paths: Game record files
+        quiet_only: Keep only positions without a capture for the side to move
+        validation_every: Every this many games goes to the validation set (0: none)
+
+    Returns:
+        Tuple of (features as (N, 64) uint8, results as (N,) float32,
+        validation mask as (N,) bool)
+    """
+    player, computer, kings, player_turn, validation, results = (array("q") for _ in range(6))
+    game_index = 0
+    for path in paths:
+        for record in read_games(path, include_unfinished=False):
+            if record.result not in (PLAYER_WIN, COMPUTER_WIN):
+                continue
+            held_out = validation_every > 0 and game_index % validation_every == 0
+            game_index += 1
+            for board in record.positions(BitboardGameBoard):
+                player.append(board.player_bb)
+                computer.append(board.computer_bb)
+                kings.append(board.king_bb)
+                player_turn.append(board.PlayerTurn)
+                validation.append(held_out)
+                results.append(record.result == COMPUTER_WIN)
+
+    player, computer, kings = np.asarray(player), np.asarray(computer), np.asarray(kings)
+    player_turn = np.asarray(player_turn, dtype=bool)
+    keep = kings == 0
+    if quiet_only:
+        capture = np.where(player_turn, _has_capture(player, computer, kings, PLAYER_DIRECTIONS),
+                           _has_capture(computer, player, kings, COMPUTER_DIRECTIONS))
+        keep &= ~capture
+    features = np.concatenate([(player[keep, None] >> _SHIFTS) & 1, (computer[keep, None] >> _SHIFTS) & 1],
+                              axis=1).astype(np.uint8)
+    return (features, np.asarray(results, dtype=np.float32)[keep],
+            np.asarray(validation, dtype=bool)[keep])
+
+
+def signed_vector(player_weights: List[int], computer_weights: List[int]) -> np.ndarray:
+    """Per-side weight tables (indexed by x * 8 + y) as one signed 64-vector ('B' squares, then 'C')."""
+    return np.array([-player_weights[x * 8 + y] for x, y in SQUARE_TO_RC] +
+                    [computer_weights[x * 8 + y] for x, y in SQUARE_TO_RC], dtype=np.float64)
+
+
+def current_weights() -> np.ndarray:
+    """The evaluator's weights as a signed 64-vector."""
+    return signed_vector(evaluation.PLAYER_WEIGHTS, evaluation.COMPUTER_WEIGHTS)
+
+
+def evaluate_features(features: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Evaluation of every position: features @ weights, in float32 chunks."""
+    scores = np.empty(len(features), dtype=np.float32)
+    weights = weights.astype(np.float32)
+    for start in range(0, len(features), _CHUNK_ROWS):
+        scores[start:start + _CHUNK_ROWS] = features[start:start + _CHUNK_ROWS].astype(np.float32) @ weights
+    return scores
+
+
+def texel_loss(scores: np.ndarray, results: np.ndarray, k: float) -> float:
+    """Mean squared error between the results and sigmoid(k * score)."""
+    predicted = 1.0 / (1.0 + np.exp(-k * scores))
+    return float(np.mean((results - predicted) ** 2))
+
+
+def fit_k(scores: np.ndarray, results: np.ndarray, low: float = 1e-4, high: float = 10.0,
+          iterations: int = 60) -> float:
+    """
+    Find the sigmoid scale that best maps evaluations to results (golden-section search on log k).
+
+    Args:
+        scores: Evaluations of the positions
+        results: Result of each position's game
+        low: Smallest k considered
+        high: Largest k considered
+
+    Returns:
+        The fitted k
+    """
+    ratio = (math.sqrt(5) - 1) / 2
+    a, b = math.log(low), math.log(high)
+    c, d = b - ratio * (b - a), a + ratio * (b - a)
+    loss_c, loss_d = texel_loss(scores, results, math.exp(c)), texel_loss(scores, results, math.exp(d))
+    for _ in range(iterations):
+        if loss_c < loss_d:
+            b, d, loss_d = d, c, loss_c
+            c = b - ratio * (b - a)
+            loss_c = texel_loss(scores, results, math.exp(c))
+        else:
+            a, c, loss_c = c, d, loss_d
+            d = a + ratio * (b - a)
+            loss_d = texel_loss(scores, results, math.exp(d))
+    return math.exp((a + b) / 2)
+
+
+def tune_weights(features: np.ndarray, results: np.ndarray, k: float, initial: Optional[np.ndarray] = None,
+                 iterations: int = 300, learning_rate: float = 0.5, regularization: float = 1e-6,
+                 progress=None) -> np.ndarray:
+    """
+    Fit the signed weights by full-batch Adam on the Texel loss.
+
+    Args:
+        features: (N, 64) indicator matrix from ``load_positions``
+        results: (N,) results from ``load_positions``
+        k: Sigmoid scale, e.g. from ``fit_k``
+        initial: Starting weights (default: the current evaluator's)
+        iterations: Adam steps, each one pass over the positions
+        learning_rate: Adam step size, in evaluation points
+        regularization: L2 pull toward the starting weights, which keeps squares
+            that (almost) never occur in the data at their current values
+        progress: Optional callable receiving (iteration, loss) after each step
+
+    Returns:
+        The fitted 64-vector of float weights
+    """
+    start = current_weights() if initial is None else initial.astype(np.float64)
+    weights = start.copy()
+    first_moment = np.zeros_like(weights)
+    second_moment = np.zeros_like(weights)
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-12
+    for step in range(1, iterations + 1):
+        predicted = 1.0 / (1.0 + np.exp(-k * evaluate_features(features, weights)))
+        # d loss / d score of each position, then back through the matrix product
+        slope = (2.0 * k / len(results)) * (predicted - results) * predicted * (1.0 - predicted)
+        gradient = np.zeros_like(weights)
+        for row in range(0, len(features), _CHUNK_ROWS):
+            gradient += slope[row:row + _CHUNK_ROWS] @ features[row:row + _CHUNK_ROWS].astype(np.float32)
+        gradient += 2.0 * regularization * (weights - start)
+        first_moment = beta1 * first_moment + (1 - beta1) * gradient
+        second_moment = beta2 * second_moment + (1 - beta2) * gradient ** 2
+        corrected_first = first_moment / (1 - beta1 ** step)
+        corrected_second = second_moment / (1 - beta2 ** step)
+        weights -= learning_rate * corrected_first / (np.sqrt(corrected_second) + epsilon)
+        if progress is not None:
+            progress(step, float(np.mean((results - predicted) ** 2)))
+    return weights
+
+
+def integer_weights(weights: np.ndarray, scale: Optional[float] = None) -> Tuple[List[int], List[int], float]:
+    """
+    Round fitted signed weights to the evaluator's integer, per-side tables.
+
+    Scores must stay integers (the search relies on it) and below the tablebase's
+    smallest win score even with all 24 men on the board, so the weights are
+    scaled before rounding and clipped to that limit.
+
+    Args:
+        weights: Fitted 64-vector from ``tune_weights``
+        scale: Multiplier applied before rounding, or None for the largest one
+            that keeps every weight within the limit
+
+    Returns:
+        Tuple of (player weights, AI weights, scale), the tables indexed by x * 8 + y
+    """
+    limit = (WIN_SCORE - MAX_DISTANCE) // 24
+    if scale is None:
+        scale = limit / max(float(np.abs(weights).max()), 1e-9)
+    rounded = np.clip(np.rint(weights * scale), -limit, limit).astype(int).tolist()
+    player_weights, computer_weights = [0] * 64, [0] * 64
+    for square, (x, y) in enumerate(SQUARE_TO_RC):
+        player_weights[x * 8 + y] = -rounded[square]  # Stored per side, as unsigned 'B' weights
+        computer_weights[x * 8 + y] = rounded[32 + square]
+    return player_weights, computer_weights, scale
@@ -0,0 +1,184 @@
+"""
+Vectorized Board Evaluation
+
+This module scores batches of positions with NumPy. Positions are encoded as an
+(N, 32) int8 array, one column per dark square, and scored with matrix products
+against per-square weight tables for 'B' and 'C' men. ``evaluate_many`` is the
+standalone entry point for offline analysis; ``minimax_batched`` is an in-place
+minimax that scores all children of each depth-1 node in one NumPy call.
+
+NumPy is an optional dependency and is only needed when this module is imported.
+"""
+
+import math
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..game.bitboard import SQUARE_TO_RC
+from ..game.evaluation import SIGNED_WEIGHTS
+from .minimax import Move
+
+
+# Square codes used in encoded positions
+EMPTY, PLAYER_MAN, COMPUTER_MAN, PLAYER_KING, COMPUTER_KING = range(5)
+CODE_PIECES = ("---", "B", "C", "BK", "CK")
+
+# Signed weight of each code on each dark square (row = code, column = square)
+WEIGHT_TABLE = np.array([[SIGNED_WEIGHTS[piece][x * 8 + y] for x, y in SQUARE_TO_RC] for piece in CODE_PIECES],
+                        dtype=np.int32)
+
+_FLOAT_WEIGHTS = WEIGHT_TABLE.astype(np.float32)  # Integer weights are exact in float32 sums
+_SCORED_CODES = [code for code in range(1, len(CODE_PIECES)) if WEIGHT_TABLE[code].any()]
+_SHIFTS = np.arange(32, dtype=np.uint32)
+_CHUNK_ROWS = 1 << 20  # Rows scored per pass, to bound temporary memory
+
+
+def encode_bitboards(player_bbs, computer_bbs, king_bbs) -> np.ndarray:
+    """
+    Encode positions given as bitboard triples.
+
+    Args:
+        player_bbs: Sequence of player ('B') bitboards
+        computer_bbs: Sequence of AI ('C') bitboards
+        king_bbs: Sequence of king bitboards
+
+    Returns:
+        (N, 32) int8 array of square codes
+    """
+    player = (np.asarray(player_bbs, dtype=np.uint32)[:, None] >> _SHIFTS) & 1
+    computer = (np.asarray(computer_bbs, dtype=np.uint32)[:, None] >> _SHIFTS) & 1
+    kings = (np.asarray(king_bbs, dtype=np.uint32)[:, None] >> _SHIFTS) & 1
+    # Men are 1 ('B') or 2 ('C'); a king adds 2
+    return (player * PLAYER_MAN + computer * COMPUTER_MAN + kings * 2).astype(np.int8)
+
+
+def encode_boards(boards: Iterable) -> np.ndarray:
+    """
+    Encode board objects of either backend.
+
+    Args:
+        boards: GameBoard or BitboardGameBoard instances
+
+    Returns:
+        (N, 32) int8 array of square codes
+    """
+    boards = list(boards)
+    if all(hasattr(board, "player_bb") for board in boards):
+        return encode_bitboards([board.player_bb for board in boards],
+                                [board.computer_bb for board in boards],
+                                [board.king_bb for board in boards])
+    codes = {piece: code for code, piece in enumerate(CODE_PIECES)}
+    encoded = np.zeros((len(boards), 32), dtype=np.int8)
+    for row, board in enumerate(boards):
+        state = board.get_board_state()
+        encoded[row] = [codes[state[x][y]] for x, y in SQUARE_TO_RC]
+    return encoded
+
+
+def evaluate_encoded(encoded: np.ndarray) -> np.ndarray:
+    """
+    Score encoded positions for the AI, exactly as evaluate_board would.
+
+    Each piece code contributes a (rows x 32) indicator matrix times that code's
+    weight vector, which NumPy runs as a BLAS matrix-vector product.
+
+    Args:
+        encoded: (N, 32) array of square codes
+
+    Returns:
+        (N,) int64 array of scores
+    """
+    scores = np.empty(len(encoded), dtype=np.int64)
+    for start in range(0, len(encoded), _CHUNK_ROWS):
+        chunk = encoded[start:start + _CHUNK_ROWS]
+        total = np.zeros(len(chunk), dtype=np.float32)
+        for code in _SCORED_CODES:
+            total += (chunk == code).astype(np.float32) @ _FLOAT_WEIGHTS[code]
+        scores[start:start + _CHUNK_ROWS] = np.rint(total)
+    return scores
+
+
+def evaluate_many(boards) -> np.ndarray:
+    """
+    Score a batch of positions in one vectorized pass.
+
+    Args:
+        boards: Board objects, or an already encoded (N, 32) array
+
+    Returns:
+        (N,) int64 array of scores, equal to each board's evaluate_board()
+    """
+    encoded = boards if isinstance(boards, np.ndarray) else encode_boards(boards)
+    return evaluate_encoded(encoded)
+
+
+def _encode_children(board_obj, moves: List[Move]) -> np.ndarray:
+    """Encode the positions after each move without allocating child boards."""
+    if hasattr(board_obj, "player_bb"):
+        player, computer, kings = [], [], []
+        for move in moves:
+            token = board_obj.make_move(move)
+            player.append(board_obj.player_bb)
+            computer.append(board_obj.computer_bb)
+            kings.append(board_obj.king_bb)
+            board_obj.unmake_move(token)
+        return encode_bitboards(player, computer, kings)
+
+    children = []
+    for move in moves:
+        token = board_obj.make_move(move)
+        children.append(board_obj.__copy__())
+        board_obj.unmake_move(token)
+    return encode_boards(children)
+
+
+def minimax_batched(board_obj, depth: int, alpha: float, beta: float, maximizing_player: bool,
+                    stats: dict) -> Tuple[Optional[Move], float]:
+    """
+    In-place minimax that scores each depth-1 node's children in one NumPy call.
+
+    Returns the same result and counters as ``SearchToolBox.minimax_in_place``;
+    cutoffs at depth-1 nodes are replayed over the precomputed scores.
+
+    Args:
+        board_obj: Board to search from (restored before returning)
+        depth: Remaining search depth
+        alpha: Best score the maximizing player can guarantee
+        beta: Best score the minimizing player can guarantee
+        maximizing_player: True when it is the AI's turn
+        stats: Dict with 'nodes_expanded' and 'prunes' counters to update
+
+    Returns:
+        Tuple of (best_move, score)
+    """
+    if depth == 0 or board_obj.ComputerPieces == 0 or board_obj.PlayerPieces == 0:
+        return None, board_obj.evaluate_board()  # Base case: return the board evaluation
+
+    best_move = None
+    valid_moves = board_obj.generate_moves(maximizing_player)
+    stats['nodes_expanded'] += len(valid_moves)  # Track the number of nodes expanded
+    leaf_scores = evaluate_encoded(_encode_children(board_obj, valid_moves)).tolist() if depth == 1 else None
+
+    best_eval = -math.inf if maximizing_player else math.inf
+    for index, move in enumerate(valid_moves):
+        if leaf_scores is not None:
+            eval = leaf_scores[index]
+        else:
+            token = board_obj.make_move(move)
+            _, eval = minimax_batched(board_obj, depth - 1, alpha, beta, not maximizing_player, stats)
+            board_obj.unmake_move(token)
+        if maximizing_player:
+            if eval > best_eval:
+                best_eval = eval
+                best_move = move
+            alpha = max(alpha, eval)
+        else:
+            if eval < best_eval:
+                best_eval = eval
+                best_move = move
+            beta = min(beta, eval)
+        if beta <= alpha:  # Alpha-beta pruning
+            stats['prunes'] += 1
+            break
+    return best_move, best_eval
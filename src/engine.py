@@ -0,0 +1,120 @@
+"""
+Checkers Engine
+
+This module bundles the board and the AI into one import with no GUI
+dependencies, for the command-line game, scripts and worker processes:
+
+    from src.engine import Engine, BitboardGameBoard
+
+    board = BitboardGameBoard()
+    engine = Engine(time_budget=0.5)
+    move = engine.choose_move(board)  # Opening book first, then the search
+
+Importing it loads neither tkinter nor NumPy.
+"""
+
+import os
+import time
+from contextlib import nullcontext
+from typing import Optional
+
+from .ai import book, tablebase
+from .ai.instrumentation import SearchLog, profile_search
+from .ai.iterative import ASPIRATION_WINDOW, iterative_deepening
+from .ai.mcts import MonteCarloSearch
+from .ai.minimax import Move, SearchToolBox
+from .ai.ordering import MoveOrderer
+from .ai.transposition import TranspositionTable
+from .game.bitboard import BitboardGameBoard
+from .game.board import GameBoard
+from .game.records import COMPUTER_WIN, PLAYER_WIN, UNFINISHED, game_result
+
+
+__all__ = ["Engine", "GameBoard", "BitboardGameBoard", "SearchToolBox", "iterative_deepening",
+           "game_result", "PLAYER_WIN", "COMPUTER_WIN", "UNFINISHED"]
+
+
+class Engine:
+    """
+    Chooses AI moves: from the opening book when the position is in it, otherwise by
+    iterative deepening (or Monte Carlo Tree Search) under a time budget.
+
+    The transposition table, move orderer and Monte Carlo tree are kept between moves of a game;
+    call ``new_game`` before starting another one.
+    """
+
+    def __init__(self, time_budget: float = 1.0, max_depth: int = 32, table_megabytes: float = 16,
+                 tablebase_path: Optional[str] = tablebase.DEFAULT_PATH,
+                 book_path: Optional[str] = book.DEFAULT_PATH, algorithm: str = "pvs",
+                 search_log: Optional[SearchLog] = None, profile: Optional[str] = None):
+        """
+        Set up the engine.
+
+        Args:
+            time_budget: Seconds per move
+            max_depth: Deepest iteration of any search
+            table_megabytes: Transposition table size
+            tablebase_path: Endgame table probed during the search, used if the file exists
+            book_path: Opening book checked before searching, used if the file exists
+            algorithm: "pvs" (Principal Variation Search with aspiration windows), "alphabeta"
+                or "mcts" (Monte Carlo Tree Search; 'score' is then the AI's win rate)
+            search_log: Log receiving a JSON record with the stats of every AI move
+            profile: "cprofile" or "sampling" to time each search's parts (see profile_search)
+        """
+        if algorithm not in ("alphabeta", "pvs", "mcts"):
+            raise ValueError(f"Unknown search algorithm: {algorithm!r}")
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.pvs = algorithm == "pvs"
+        self.search_log = search_log
+        self.profile = profile
+        self.table = TranspositionTable(table_megabytes)
+        self.ordering = MoveOrderer()
+        self.mcts = MonteCarloSearch() if algorithm == "mcts" else None
+        self.tablebase = tablebase.EndgameTablebase(tablebase_path) \
+            if tablebase_path and os.path.exists(tablebase_path) else None
+        self.book = book.OpeningBook(book_path) if book_path and os.path.exists(book_path) else None
+
+    def new_game(self) -> None:
+        """Forget what was learned about the previous game's positions."""
+        self.table.clear()
+        self.ordering = MoveOrderer()
+        if self.mcts is not None:
+            self.mcts = MonteCarloSearch()
+
+    def choose_move(self, board_obj, stats: Optional[dict] = None) -> Optional[Move]:
+        """
+        Choose the AI's move.
+
+        Args:
+            board_obj: Position with the AI to move (not modified)
+            stats: Optional stats dict filled in by the search, plus 'time_spent'
+                (and 'time_breakdown' when profiling)
+
+        Returns:
+            The move to play, or None if the AI has no legal move
+        """
+        if stats is None:
+            stats = {}
+        stats.setdefault('nodes_expanded', 0)
+        stats.setdefault('prunes', 0)
+        started = time.perf_counter()
+        move = self.book.lookup(board_obj, stats) if self.book is not None else None
+        if move is None:
+            with profile_search(stats, self.profile) if self.profile else nullcontext():
+                if self.mcts is not None:
+                    move, stats['score'] = self.mcts.search(board_obj, True, stats, time_budget=self.time_budget)
+                else:
+                    move, stats['score'] = iterative_deepening(
+                        board_obj, True, stats, time_budget=self.time_budget, max_depth=self.max_depth,
+                        table=self.table, ordering=self.ordering, tablebase=self.tablebase,
+                        pvs=self.pvs, aspiration_window=ASPIRATION_WINDOW if self.pvs else None)
+        stats['time_spent'] = time.perf_counter() - started
+        if self.search_log is not None:
+            self.search_log.record("ai_move", stats, move=list(move) if move else None)
+        return move
+
+    def close(self) -> None:
+        """Release the endgame table's file mapping."""
+        if self.tablebase is not None:
+            self.tablebase.close()
@@ -0,0 +1,8 @@
+"""
+Game board implementations for the Checkers AI Game.
+"""
+
+from .board import GameBoard
+from .bitboard import BitboardGameBoard
+
+__all__ = ["GameBoard", "BitboardGameBoard"]
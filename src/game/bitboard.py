@@ -0,0 +1,537 @@
+"""
+Bitboard Checkers Board Implementation
+
+This module contains an alternative ``GameBoard`` backend that stores the position
+as 32-square integer bitboards (one mask per side plus a king mask) instead of an
+8x8 matrix of strings. Move generation is done with shifts and masks over the dark
+squares only, while the public API mirrors ``GameBoard`` so the search and the UI
+can use either backend interchangeably.
+
+Square layout (row-major over the dark squares, matching the matrix scan order):
+
+    row 0:  .  0  .  1  .  2  .  3
+    row 1:  4  .  5  .  6  .  7  .
+    ...
+    row 7: 28  . 29  . 30  . 31  .
+"""
+
+from typing import Iterator, List, Tuple
+
+from . import evaluation
+from .board import POSITION, unpack_position
+from .zobrist import PIECE_KEYS, hash_matrix
+
+
+FULL_MASK = 0xFFFFFFFF
+
+# Square <-> (row, column) conversion tables
+SQUARE_TO_RC = [(s >> 2, 2 * (s & 3) + (1 - ((s >> 2) & 1))) for s in range(32)]
+RC_TO_SQUARE = [-1] * 64
+for _s, (_x, _y) in enumerate(SQUARE_TO_RC):
+    RC_TO_SQUARE[_x * 8 + _y] = _s
+
+# Row and column masks used to keep shifts on the board
+EVEN_ROWS = sum(1 << s for s in range(32) if ((s >> 2) & 1) == 0)
+ODD_ROWS = FULL_MASK & ~EVEN_ROWS
+ROW_0 = 0x0000000F
+ROW_7 = 0xF0000000
+COL_0 = sum(1 << s for s in range(32) if (s & 3) == 0)
+COL_3 = sum(1 << s for s in range(32) if (s & 3) == 3)
+
+# Direction indices, in the order the matrix board scans them: (-1, -1), (-1, 1), (1, -1), (1, 1)
+UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = range(4)
+DIRECTIONS = (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)
+OPPOSITE = (DOWN_RIGHT, DOWN_LEFT, UP_RIGHT, UP_LEFT)
+PLAYER_DIRECTIONS = (UP_LEFT, UP_RIGHT)  # Player men ('B') move toward row 0
+COMPUTER_DIRECTIONS = (DOWN_LEFT, DOWN_RIGHT)  # AI men ('C') move toward row 7
+
+
+def _shift_up_left(bb: int) -> int:
+    return ((bb & EVEN_ROWS & ~ROW_0) >> 4) | ((bb & ODD_ROWS & ~COL_0) >> 5)
+
+
+def _shift_up_right(bb: int) -> int:
+    return ((bb & EVEN_ROWS & ~ROW_0 & ~COL_3) >> 3) | ((bb & ODD_ROWS) >> 4)
+
+
+def _shift_down_left(bb: int) -> int:
+    return ((bb & EVEN_ROWS) << 4) | ((bb & ODD_ROWS & ~ROW_7 & ~COL_0) << 3)
+
+
+def _shift_down_right(bb: int) -> int:
+    return ((bb & EVEN_ROWS & ~COL_3) << 5) | ((bb & ODD_ROWS & ~ROW_7) << 4)
+
+
+SHIFTS = (_shift_up_left, _shift_up_right, _shift_down_left, _shift_down_right)
+
+# Per-square neighbor tables (-1 when the step leaves the board)
+NEIGHBOR = [[(SHIFTS[d](1 << s).bit_length() - 1) for s in range(32)] for d in DIRECTIONS]
+JUMP = [[(SHIFTS[d](SHIFTS[d](1 << s)).bit_length() - 1) for s in range(32)] for d in DIRECTIONS]
+
+# Zobrist keys re-indexed by dark square: [player man, computer man, player king, computer king]
+SQUARE_KEYS = [[PIECE_KEYS[piece][x * 8 + y] for x, y in SQUARE_TO_RC] for piece in ("B", "C", "BK", "CK")]
+
+# Positional weights for men, identical to GameBoard.evaluate_board
+PLAYER_WEIGHTS = [evaluation.PLAYER_WEIGHTS[x * 8 + y] for x, y in SQUARE_TO_RC]
+COMPUTER_WEIGHTS = [evaluation.COMPUTER_WEIGHTS[x * 8 + y] for x, y in SQUARE_TO_RC]
+
+# Signed contribution to the AI's score, indexed like SQUARE_KEYS
+SQUARE_WEIGHTS = [[evaluation.SIGNED_WEIGHTS[piece][x * 8 + y] for x, y in SQUARE_TO_RC]
+                  for piece in ("B", "C", "BK", "CK")]
+
+
+def _byte_tables(weights: List[int]) -> List[List[int]]:
+    """Build 4 lookup tables mapping each byte of a bitboard to its summed weight."""
+    tables = []
+    for byte_index in range(4):
+        table = [0] * 256
+        for value in range(1, 256):
+            # Each value is a smaller value plus its lowest set bit
+            low = value & -value
+            table[value] = table[value ^ low] + weights[byte_index * 8 + low.bit_length() - 1]
+        tables.append(table)
+    return tables
+
+
+PLAYER_BYTE_WEIGHTS = _byte_tables(PLAYER_WEIGHTS)
+COMPUTER_BYTE_WEIGHTS = _byte_tables(COMPUTER_WEIGHTS)
+
+
+def _weight_sum(bb: int, tables: List[List[int]]) -> int:
+    """Sum the per-square weights of every bit set in ``bb``."""
+    return (tables[0][bb & 0xFF] + tables[1][(bb >> 8) & 0xFF] +
+            tables[2][(bb >> 16) & 0xFF] + tables[3][bb >> 24])
+
+
+class BitboardGameBoard:
+    """
+    Checkers board backed by 32-square bitboards.
+
+    Exposes the same attributes and methods as ``GameBoard`` (including a ``Matrix``
+    view for the UI), but keeps the position in three integers:
+    ``player_bb`` ('B' pieces), ``computer_bb`` ('C' pieces) and ``king_bb``.
+    """
+
+    # When True, evaluate_board checks the incremental score against a full recompute
+    verify_evaluation = False
+
+    def __init__(self):
+        """Initialize the game board with starting positions."""
+        self.player_bb = 0  # Squares holding player pieces ('B')
+        self.computer_bb = 0  # Squares holding AI pieces ('C')
+        self.king_bb = 0  # Subset of both masks holding kings
+        self.PlayerTurn = True  # True for player's turn, False for AI's turn
+        self.ComputerPieces = 12  # Number of AI pieces
+        self.PlayerPieces = 12  # Number of player pieces
+        self.SelectedPiece = None  # Currently selected piece by the player
+        self.PlayerPoints = 0  # Points scored by the player
+        self.ComputerPoints = 0  # Points scored by the AI
+        self.position_computer()  # Position AI pieces on the board
+        self.position_player()  # Position player pieces on the board
+        self.zobrist_hash = hash_matrix(self.get_board_state())  # Incrementally updated hash of the pieces
+        self.evaluation = self.recompute_evaluation()  # Incrementally updated evaluate_board score
+
+    def position_computer(self) -> None:
+        """Place AI pieces ('C') on the top 3 rows of the board."""
+        self.computer_bb |= 0x00000FFF
+
+    def position_player(self) -> None:
+        """Place player pieces ('B') on the bottom 3 rows of the board."""
+        self.player_bb |= 0xFFF00000
+
+    @property
+    def Matrix(self) -> List[List[str]]:
+        """8x8 string view of the board, compatible with ``GameBoard.Matrix``."""
+        return self.get_board_state()
+
+    @Matrix.setter
+    def Matrix(self, state: List[List[str]]) -> None:
+        self.set_board_state(state)
+
+    def _piece_at(self, square: int) -> str:
+        """Return the matrix symbol for a dark square index."""
+        bit = 1 << square
+        if self.player_bb & bit:
+            return "BK" if self.king_bb & bit else "B"
+        if self.computer_bb & bit:
+            return "CK" if self.king_bb & bit else "C"
+        return "---"
+
+    def _directions_for(self, square: int) -> Tuple[int, ...]:
+        """Return the directions the piece on ``square`` may move in."""
+        bit = 1 << square
+        if self.king_bb & bit:
+            return DIRECTIONS
+        return PLAYER_DIRECTIONS if self.player_bb & bit else COMPUTER_DIRECTIONS
+
+    def is_valid_move(self, old_x: int, old_y: int, new_x: int, new_y: int) -> bool:
+        """
+        Check if a move from (old_x, old_y) to (new_x, new_y) is valid.
+
+        Args:
+            old_x: Current row position
+            old_y: Current column position
+            new_x: Target row position
+            new_y: Target column position
+
+        Returns:
+            True if the move is valid, False otherwise
+        """
+        if not (0 <= old_x < 8 and 0 <= old_y < 8 and 0 <= new_x < 8 and 0 <= new_y < 8):
+            return False
+        src = RC_TO_SQUARE[old_x * 8 + old_y]
+        dst = RC_TO_SQUARE[new_x * 8 + new_y]
+        if src < 0 or dst < 0:
+            return False
+        occupied = self.player_bb | self.computer_bb
+        if not (occupied >> src) & 1 or (occupied >> dst) & 1:
+            return False
+
+        opponent_bb = self.computer_bb if (self.player_bb >> src) & 1 else self.player_bb
+        for d in self._directions_for(src):
+            if NEIGHBOR[d][src] == dst:
+                return True
+            if JUMP[d][src] == dst and (opponent_bb >> NEIGHBOR[d][src]) & 1:
+                return True
+        return False
+
+    def _key_index(self, bit: int) -> int:
+        """Return the SQUARE_KEYS row for the piece occupying ``bit``."""
+        return (0 if self.player_bb & bit else 1) + (2 if self.king_bb & bit else 0)
+
+    def _apply(self, src: int, dst: int, captured: int) -> None:
+        """Move the piece on ``src`` to ``dst``, removing ``captured`` (or -1), and switch turns."""
+        src_bit, dst_bit = 1 << src, 1 << dst
+        piece = self._key_index(src_bit)
+        keys, weights = SQUARE_KEYS[piece], SQUARE_WEIGHTS[piece]
+        self.zobrist_hash ^= keys[src] ^ keys[dst]
+        self.evaluation += weights[dst] - weights[src]
+        if self.player_bb & src_bit:
+            self.player_bb ^= src_bit | dst_bit
+        else:
+            self.computer_bb ^= src_bit | dst_bit
+        if self.king_bb & src_bit:
+            self.king_bb ^= src_bit | dst_bit
+
+        if captured >= 0:
+            # Remove the captured piece and update scores
+            captured_piece = self._key_index(1 << captured)
+            self.zobrist_hash ^= SQUARE_KEYS[captured_piece][captured]
+            self.evaluation -= SQUARE_WEIGHTS[captured_piece][captured]
+            keep = FULL_MASK ^ (1 << captured)
+            self.player_bb &= keep
+            self.computer_bb &= keep
+            self.king_bb &= keep
+
+            if self.PlayerTurn:
+                self.ComputerPieces -= 1
+                self.PlayerPoints += 1
+            else:
+                self.PlayerPieces -= 1
+                self.ComputerPoints += 1
+
+        self.PlayerTurn = not self.PlayerTurn  # Switch turns
+
+    def move_piece(self, old_x: int, old_y: int, new_x: int, new_y: int) -> bool:
+        """
+        Move a piece from (old_x, old_y) to (new_x, new_y) if the move is valid.
+
+        Args:
+            old_x: Current row position
+            old_y: Current column position
+            new_x: Target row position
+            new_y: Target column position
+
+        Returns:
+            True if the move was successful, False otherwise
+        """
+        if self.is_valid_move(old_x, old_y, new_x, new_y):
+            capture = abs(new_x - old_x) == 2  # Check if the move is a capture
+            captured = RC_TO_SQUARE[((old_x + new_x) // 2) * 8 + (old_y + new_y) // 2] if capture else -1
+            self._apply(RC_TO_SQUARE[old_x * 8 + old_y], RC_TO_SQUARE[new_x * 8 + new_y], captured)
+
+            if capture:
+                print(f"Move executed from ({old_y}, {old_x}) to ({new_y}, {new_x})")
+
+            print(f"Points Won by Player: {self.PlayerPoints}")
+            print(f"Points Won by Computer: {self.ComputerPoints}")
+            self.check_game_over()  # Check if the game is over
+            return True
+
+        return False
+
+    def _generate(self, maximizing_player: bool) -> List[Tuple[int, int, int]]:
+        """
+        Generate moves as (from_square, to_square, captured_square) triples.
+
+        Candidate pieces for each direction are found set-wise with shifts and masks;
+        only the resulting bits are then visited, in the same order as the matrix
+        scan: jumps first, then normal moves, by square and direction.
+        """
+        if maximizing_player:
+            own, opponent, forward = self.computer_bb, self.player_bb, COMPUTER_DIRECTIONS
+        else:
+            own, opponent, forward = self.player_bb, self.computer_bb, PLAYER_DIRECTIONS
+        empty = FULL_MASK & ~(self.player_bb | self.computer_bb)
+        men = own & ~self.king_bb
+        kings = own & self.king_bb
+
+        jump_from = [0, 0, 0, 0]
+        step_from = [0, 0, 0, 0]
+        for d in DIRECTIONS:
+            movers = (men | kings) if d in forward else kings
+            if not movers:
+                continue
+            back = SHIFTS[OPPOSITE[d]]
+            step_from[d] = movers & back(empty)
+            jump_from[d] = movers & back(opponent & back(empty))
+
+        moves = []
+        for from_sets, table in ((jump_from, JUMP), (step_from, None)):
+            pending = from_sets[0] | from_sets[1] | from_sets[2] | from_sets[3]
+            while pending:
+                low = pending & -pending
+                src = low.bit_length() - 1
+                pending ^= low
+                for d in DIRECTIONS:
+                    if from_sets[d] & low:
+                        if table is None:
+                            moves.append((src, NEIGHBOR[d][src], -1))
+                        else:
+                            moves.append((src, JUMP[d][src], NEIGHBOR[d][src]))
+        return moves
+
+    def _child(self, src: int, dst: int, captured: int) -> 'BitboardGameBoard':
+        """Return a copy of the board with the given move applied."""
+        new_board = self.__copy__()
+        new_board._apply(src, dst, captured)
+        return new_board
+
+    def iter_valid_moves(self, maximizing_player: bool) -> Iterator[Tuple['BitboardGameBoard', Tuple[int, int, int, int]]]:
+        """
+        Yield the child boards one at a time, each copied only when it is requested.
+
+        Args:
+            maximizing_player: True for AI player, False for human player
+
+        Yields:
+            Tuples of (new_board_state, move_coordinates), capture moves first
+        """
+        for src, dst, captured in self._generate(maximizing_player):
+            yield self._child(src, dst, captured), SQUARE_TO_RC[src] + SQUARE_TO_RC[dst]
+
+    def get_valid_moves(self, maximizing_player: bool) -> List[Tuple['BitboardGameBoard', Tuple[int, int, int, int]]]:
+        """
+        Get all valid moves for the current player (AI or player).
+
+        Args:
+            maximizing_player: True for AI player, False for human player
+
+        Returns:
+            List of tuples containing (new_board_state, move_coordinates)
+        """
+        return list(self.iter_valid_moves(maximizing_player))
+
+    def iter_moves(self, maximizing_player: bool) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Yield the valid move coordinates for a player one at a time, capture moves first.
+
+        Args:
+            maximizing_player: True for AI player, False for human player
+
+        Yields:
+            (old_x, old_y, new_x, new_y) tuples
+        """
+        for src, dst, _ in self._generate(maximizing_player):
+            yield SQUARE_TO_RC[src] + SQUARE_TO_RC[dst]
+
+    def generate_moves(self, maximizing_player: bool) -> List[Tuple[int, int, int, int]]:
+        """
+        Generate the valid move coordinates for a player without copying the board.
+
+        Args:
+            maximizing_player: True for AI player, False for human player
+
+        Returns:
+            List of (old_x, old_y, new_x, new_y) tuples, capture moves first
+        """
+        return [SQUARE_TO_RC[src] + SQUARE_TO_RC[dst] for src, dst, _ in self._generate(maximizing_player)]
+
+    def make_move(self, move: Tuple[int, int, int, int]) -> tuple:
+        """
+        Apply a generated move in place, without validation or output.
+
+        Args:
+            move: (old_x, old_y, new_x, new_y) tuple from generate_moves
+
+        Returns:
+            Undo token to pass to unmake_move
+        """
+        old_x, old_y, new_x, new_y = move
+        token = (self.player_bb, self.computer_bb, self.king_bb, self.PlayerTurn, self.ComputerPieces,
+                 self.PlayerPieces, self.PlayerPoints, self.ComputerPoints, self.zobrist_hash, self.evaluation)
+        captured = RC_TO_SQUARE[((old_x + new_x) >> 1) * 8 + ((old_y + new_y) >> 1)] if abs(new_x - old_x) == 2 else -1
+        self._apply(RC_TO_SQUARE[old_x * 8 + old_y], RC_TO_SQUARE[new_x * 8 + new_y], captured)
+        return token
+
+    def unmake_move(self, token: tuple) -> None:
+        """
+        Revert a move applied with make_move.
+
+        Args:
+            token: Undo token returned by make_move
+        """
+        (self.player_bb, self.computer_bb, self.king_bb, self.PlayerTurn, self.ComputerPieces,
+         self.PlayerPieces, self.PlayerPoints, self.ComputerPoints, self.zobrist_hash, self.evaluation) = token
+
+    def check_game_over(self) -> bool:
+        """
+        Check if the game is over (one player has no pieces left).
+
+        Returns:
+            True if the game is over, False otherwise
+        """
+        if self.PlayerPieces == 0:
+            print("Game Over! The AI wins.")
+            return True
+        elif self.ComputerPieces == 0:
+            print("Game Over! You win.")
+            return True
+        return False
+
+    def evaluate_board(self) -> int:
+        """
+        Evaluate the board state for the AI (higher score is better for the AI).
+
+        The score is maintained incrementally by every move, so this is O(1).
+
+        Returns:
+            Integer score representing board advantage
+        """
+        if self.verify_evaluation:
+            expected = self.recompute_evaluation()
+            if self.evaluation != expected:
+                raise AssertionError(f"Incremental evaluation {self.evaluation} != full recompute {expected}")
+        return self.evaluation
+
+    def recompute_evaluation(self) -> int:
+        """
+        Evaluate the board from scratch using per-byte weight tables.
+
+        Returns:
+            Integer score representing board advantage
+        """
+        player_score = _weight_sum(self.player_bb & ~self.king_bb, PLAYER_BYTE_WEIGHTS)
+        computer_score = _weight_sum(self.computer_bb & ~self.king_bb, COMPUTER_BYTE_WEIGHTS)
+        return computer_score - player_score  # Return the difference in scores
+
+    def get_board_state(self) -> List[List[str]]:
+        """
+        Get a copy of the current board state.
+
+        Returns:
+            8x8 board matrix built from the bitboards
+        """
+        state = [["---" for _ in range(8)] for _ in range(8)]
+        occupied = self.player_bb | self.computer_bb
+        while occupied:
+            low = occupied & -occupied
+            square = low.bit_length() - 1
+            occupied ^= low
+            x, y = SQUARE_TO_RC[square]
+            state[x][y] = self._piece_at(square)
+        return state
+
+    def set_board_state(self, state: List[List[str]]) -> None:
+        """
+        Set the board state from a given matrix.
+
+        Args:
+            state: Board state matrix to set
+        """
+        self.player_bb = self.computer_bb = self.king_bb = 0
+        for square, (x, y) in enumerate(SQUARE_TO_RC):
+            cell = state[x][y]
+            if cell.startswith("B"):
+                self.player_bb |= 1 << square
+            elif cell.startswith("C"):
+                self.computer_bb |= 1 << square
+            if cell.endswith("K"):
+                self.king_bb |= 1 << square
+        self.zobrist_hash = hash_matrix(self.get_board_state())
+        self.evaluation = self.recompute_evaluation()
+
+    def count_pieces(self) -> Tuple[int, int]:
+        """
+        Count the number of pieces for each player, kings included.
+
+        Returns:
+            Tuple of (player_pieces, computer_pieces)
+        """
+        return bin(self.player_bb).count("1"), bin(self.computer_bb).count("1")
+
+    def __str__(self) -> str:
+        """String representation of the board for debugging."""
+        result = "  0  1  2  3  4  5  6  7\n"
+        for i, row in enumerate(self.get_board_state()):
+            result += f"{i} "
+            for cell in row:
+                result += f"{cell} "
+            result += "\n"
+        return result
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the position and side to move in ``POSITION.size`` (13) bytes.
+
+        Returns:
+            Encoded position, identical for both backends
+        """
+        return POSITION.pack(self.player_bb, self.computer_bb, self.king_bb, self.PlayerTurn)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BitboardGameBoard':
+        """
+        Build a board from an encoded position.
+
+        Piece counts come from the position; points are the pieces each side has
+        captured from its starting 12.
+
+        Args:
+            data: Position encoded by ``to_bytes`` (of either backend)
+
+        Returns:
+            New board
+
+        Raises:
+            ValueError: If the data is not a valid encoded position
+        """
+        board = cls.__new__(cls)
+        board.player_bb, board.computer_bb, board.king_bb, board.PlayerTurn = unpack_position(data)
+        board.PlayerPieces, board.ComputerPieces = board.count_pieces()
+        board.SelectedPiece = None
+        board.PlayerPoints = 12 - board.ComputerPieces
+        board.ComputerPoints = 12 - board.PlayerPieces
+        board.zobrist_hash = hash_matrix(board.get_board_state())
+        board.evaluation = board.recompute_evaluation()
+        return board
+
+    def __copy__(self) -> 'BitboardGameBoard':
+        """Create a copy of the board without re-running the starting setup."""
+        new_board = BitboardGameBoard.__new__(BitboardGameBoard)
+        new_board.player_bb = self.player_bb
+        new_board.computer_bb = self.computer_bb
+        new_board.king_bb = self.king_bb
+        new_board.PlayerTurn = self.PlayerTurn
+        new_board.ComputerPieces = self.ComputerPieces
+        new_board.PlayerPieces = self.PlayerPieces
+        new_board.SelectedPiece = self.SelectedPiece
+        new_board.PlayerPoints = self.PlayerPoints
+        new_board.ComputerPoints = self.ComputerPoints
+        new_board.zobrist_hash = self.zobrist_hash
+        new_board.evaluation = self.evaluation
+        return new_board
+
+    def __deepcopy__(self, memo) -> 'BitboardGameBoard':
+        """Create a deep copy of the board (all state is immutable, so this is a copy)."""
+        return self.__copy__()
@@ -5,8 +5,76 @@ This module contains the core game board logic, piece management, and move valid
 for the Checkers game.
 """
 
-from copy import deepcopy
-from typing import List, Tuple, Optional
+import struct
+from typing import Iterator, List, Tuple, Optional
+
+from .evaluation import SIGNED_WEIGHTS, evaluate_matrix
+from .zobrist import PIECE_KEYS, hash_matrix
+
+
+# Fixed-size position encoding shared by both backends: player ('B'), AI ('C') and king
+# masks over the 32 dark squares in row-major order, then 1 if the player is to move
+POSITION = struct.Struct("<IIIB")
+
+# (row, column) of each dark square, in encoding order
+DARK_SQUARES = [(x, y) for x in range(8) for y in range(8) if (x + y) % 2 == 1]
+
+# Diagonal directions in generation order (the bitboard backend uses the same order)
+DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# Directions each piece may move in: men only forward, kings both ways
+PIECE_DIRECTIONS = {"B": DIAGONALS[:2], "C": DIAGONALS[2:], "BK": DIAGONALS, "CK": DIAGONALS}
+
+# Pieces each piece may capture
+OPPONENTS = {"B": ("C", "CK"), "BK": ("C", "CK"), "C": ("B", "BK"), "CK": ("B", "BK")}
+
+
+def _move_tables(directions: Tuple[Tuple[int, int], ...]) -> Tuple[tuple, tuple]:
+    """
+    Build the on-board steps and jumps from every square, indexed by x * 8 + y.
+
+    Each step is (new_x, new_y, move) and each jump (mid_x, mid_y, new_x, new_y, move),
+    where move is the ready-made (old_x, old_y, new_x, new_y) tuple to hand out.
+    """
+    steps, jumps = [], []
+    for x in range(8):
+        for y in range(8):
+            square_steps, square_jumps = [], []
+            for dx, dy in directions:
+                if 0 <= x + dx < 8 and 0 <= y + dy < 8:
+                    square_steps.append((x + dx, y + dy, (x, y, x + dx, y + dy)))
+                if 0 <= x + 2 * dx < 8 and 0 <= y + 2 * dy < 8:
+                    square_jumps.append((x + dx, y + dy, x + 2 * dx, y + 2 * dy, (x, y, x + 2 * dx, y + 2 * dy)))
+            steps.append(tuple(square_steps))
+            jumps.append(tuple(square_jumps))
+    return tuple(steps), tuple(jumps)
+
+
+# Per-piece step and jump tables, computed once so move generation only reads squares
+STEP_TABLES, JUMP_TABLES = {}, {}
+for _piece, _directions in PIECE_DIRECTIONS.items():
+    STEP_TABLES[_piece], JUMP_TABLES[_piece] = _move_tables(_directions)
+
+
+def unpack_position(data: bytes) -> Tuple[int, int, int, bool]:
+    """
+    Decode and validate a position encoded by ``to_bytes``.
+
+    Args:
+        data: Encoded position
+
+    Returns:
+        Tuple of (player mask, AI mask, king mask, player to move)
+
+    Raises:
+        ValueError: If the data is not a valid encoded position
+    """
+    if len(data) != POSITION.size:
+        raise ValueError(f"Encoded position must be {POSITION.size} bytes, got {len(data)}")
+    player_bb, computer_bb, king_bb, player_turn = POSITION.unpack(data)
+    if player_bb & computer_bb or king_bb & ~(player_bb | computer_bb) or player_turn > 1:
+        raise ValueError(f"Invalid encoded position: {bytes(data).hex()}")
+    return player_bb, computer_bb, king_bb, bool(player_turn)
 
 
 class GameBoard:
@@ -17,6 +85,9 @@ class GameBoard:
     Player pieces ('B') start at the bottom, AI pieces ('C') start at the top.
     """
     
+    # When True, evaluate_board checks the incremental score against a full recompute
+    verify_evaluation = False
+    
     def __init__(self):
         """Initialize the game board with starting positions."""
         self.Matrix = [["---" for _ in range(8)] for _ in range(8)]
@@ -28,6 +99,8 @@ class GameBoard:
         self.ComputerPoints = 0  # Points scored by the AI
         self.position_computer()  # Position AI pieces on the board
         self.position_player()  # Position player pieces on the board
+        self.zobrist_hash = hash_matrix(self.Matrix)  # Incrementally updated hash of the pieces
+        self.evaluation = self.recompute_evaluation()  # Incrementally updated evaluate_board score
 
     def position_computer(self) -> None:
         """Place AI pieces ('C') on the top 3 rows of the board."""
@@ -56,27 +129,21 @@ class GameBoard:
         Returns:
             True if the move is valid, False otherwise
         """
-        if 0 <= new_x < 8 and 0 <= new_y < 8:  # Ensure the new position is within the board
-            dx, dy = new_x - old_x, new_y - old_y
-            
-            # Prevent player pieces from moving backward
-            if self.Matrix[old_x][old_y] == 'B' and dx >= 0:
-                return False
-            
-            # Prevent AI pieces from moving backward
-            if self.Matrix[old_x][old_y] == 'C' and dx <= 0:
-                return False
-            
-            # Check for normal moves (1 square diagonally)
-            if abs(dx) == 1 and abs(dy) == 1 and self.Matrix[new_x][new_y] == "---":
+        if not (0 <= old_x < 8 and 0 <= old_y < 8 and 0 <= new_x < 8 and 0 <= new_y < 8):
+            return False
+        piece = self.Matrix[old_x][old_y]
+        if piece not in PIECE_DIRECTIONS or self.Matrix[new_x][new_y] != "---":
+            return False
+        
+        # Normal moves (1 square diagonally, in the piece's directions)
+        for step_x, step_y, _ in STEP_TABLES[piece][old_x * 8 + old_y]:
+            if step_x == new_x and step_y == new_y:
+                return True
+        
+        # Capture moves (2 squares diagonally, over an opponent piece)
+        for mid_x, mid_y, jump_x, jump_y, _ in JUMP_TABLES[piece][old_x * 8 + old_y]:
+            if jump_x == new_x and jump_y == new_y and self.Matrix[mid_x][mid_y] in OPPONENTS[piece]:
                 return True
-            
-            # Check for capture moves (2 squares diagonally)
-            if abs(dx) == 2 and abs(dy) == 2:
-                mid_x, mid_y = (old_x + new_x) // 2, (old_y + new_y) // 2
-                if (self.Matrix[new_x][new_y] == "---" and 
-                    self.Matrix[mid_x][mid_y] in ("C" if self.Matrix[old_x][old_y] == "B" else "B")):
-                    return True
         
         return False
 
@@ -93,16 +160,22 @@ class GameBoard:
         Returns:
             True if the move was successful, False otherwise
         """
-        if self.is_valid_move(old_x, old_y, new_x, new_y):
+        # An empty source square has no piece (and no hash key) to move
+        if self.is_valid_move(old_x, old_y, new_x, new_y) and self.Matrix[old_x][old_y] != "---":
             dx, dy = new_x - old_x, new_y - old_y
             capture = abs(dx) == 2 and abs(dy) == 2  # Check if the move is a capture
             
-            self.Matrix[new_x][new_y] = self.Matrix[old_x][old_y]
+            piece = self.Matrix[old_x][old_y]
+            self.Matrix[new_x][new_y] = piece
             self.Matrix[old_x][old_y] = "---"
+            self.zobrist_hash ^= PIECE_KEYS[piece][old_x * 8 + old_y] ^ PIECE_KEYS[piece][new_x * 8 + new_y]
+            self.evaluation += SIGNED_WEIGHTS[piece][new_x * 8 + new_y] - SIGNED_WEIGHTS[piece][old_x * 8 + old_y]
             
             if capture:
                 # Remove the captured piece and update scores
                 mid_x, mid_y = (old_x + new_x) // 2, (old_y + new_y) // 2
+                self.zobrist_hash ^= PIECE_KEYS[self.Matrix[mid_x][mid_y]][mid_x * 8 + mid_y]
+                self.evaluation -= SIGNED_WEIGHTS[self.Matrix[mid_x][mid_y]][mid_x * 8 + mid_y]
                 self.Matrix[mid_x][mid_y] = "---"
                 
                 if self.PlayerTurn:
@@ -122,6 +195,65 @@ class GameBoard:
         
         return False
 
+    def iter_moves(self, maximizing_player: bool) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Yield the valid move coordinates for a player one at a time, capture moves first.
+        
+        Moves come from the precomputed step and jump tables, so nothing is
+        validated twice, copied or printed, and a search that stops early never
+        looks at the remaining pieces. The board may be changed between moves as
+        long as it is back in the same position when the next one is requested
+        (as with make_move/unmake_move).
+        
+        Args:
+            maximizing_player: True for AI player, False for human player
+            
+        Yields:
+            (old_x, old_y, new_x, new_y) tuples
+        """
+        own = ("C", "CK") if maximizing_player else ("B", "BK")
+        opponent = ("B", "BK") if maximizing_player else ("C", "CK")
+        matrix = self.Matrix
+        for x, y in DARK_SQUARES:
+            piece = matrix[x][y]
+            if piece in own:
+                for mid_x, mid_y, new_x, new_y, move in JUMP_TABLES[piece][x * 8 + y]:
+                    if matrix[new_x][new_y] == "---" and matrix[mid_x][mid_y] in opponent:
+                        yield move
+        for x, y in DARK_SQUARES:
+            piece = matrix[x][y]
+            if piece in own:
+                for new_x, new_y, move in STEP_TABLES[piece][x * 8 + y]:
+                    if matrix[new_x][new_y] == "---":
+                        yield move
+
+    def generate_moves(self, maximizing_player: bool) -> List[Tuple[int, int, int, int]]:
+        """
+        Generate the valid move coordinates for a player without copying the board.
+        
+        Args:
+            maximizing_player: True for AI player, False for human player
+            
+        Returns:
+            List of (old_x, old_y, new_x, new_y) tuples, capture moves first
+        """
+        return list(self.iter_moves(maximizing_player))
+
+    def iter_valid_moves(self, maximizing_player: bool) -> Iterator[Tuple['GameBoard', Tuple[int, int, int, int]]]:
+        """
+        Yield the child boards one at a time, each copied only when it is requested.
+        
+        Args:
+            maximizing_player: True for AI player, False for human player
+            
+        Yields:
+            Tuples of (new_board_state, move_coordinates), capture moves first
+        """
+        for move in self.iter_moves(maximizing_player):
+            new_board = self.__copy__()
+            new_board.make_move(move)
+            yield new_board, move
+
     def get_valid_moves(self, maximizing_player: bool) -> List[Tuple['GameBoard', Tuple[int, int, int, int]]]:
         """
         Get all valid moves for the current player (AI or player).
@@ -132,31 +264,65 @@ class GameBoard:
         Returns:
             List of tuples containing (new_board_state, move_coordinates)
         """
-        jump_moves = []  # Capture moves
-        normal_moves = []  # Normal moves
-        player_piece = "C" if maximizing_player else "B"  # Determine which player's moves to calculate
+        return list(self.iter_valid_moves(maximizing_player))
+
+    def make_move(self, move: Tuple[int, int, int, int]) -> tuple:
+        """
+        Apply a generated move in place, without validation or output.
         
-        for i in range(8):
-            for j in range(8):
-                if self.Matrix[i][j] == player_piece:
-                    # Check all possible moves (normal and capture)
-                    for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2), (-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                        new_x, new_y = i + dx, j + dy
-                        
-                        if abs(dx) == 2 and abs(dy) == 2:  # Capture move
-                            mid_x, mid_y = (i + new_x) // 2, (j + new_y) // 2
-                            if self.is_valid_move(i, j, new_x, new_y):
-                                new_board = deepcopy(self)
-                                new_board.move_piece(i, j, new_x, new_y)
-                                jump_moves.append((new_board, (i, j, new_x, new_y)))
-                        
-                        elif abs(dx) == 1 and abs(dy) == 1:  # Normal move
-                            if self.is_valid_move(i, j, new_x, new_y):
-                                new_board = deepcopy(self)
-                                new_board.move_piece(i, j, new_x, new_y)
-                                normal_moves.append((new_board, (i, j, new_x, new_y)))
-        
-        return jump_moves + normal_moves  # Return all valid moves
+        Args:
+            move: (old_x, old_y, new_x, new_y) tuple from generate_moves
+            
+        Returns:
+            Undo token to pass to unmake_move
+        """
+        old_x, old_y, new_x, new_y = move
+        captured = None
+        token_hash, token_evaluation = self.zobrist_hash, self.evaluation
+        
+        piece = self.Matrix[old_x][old_y]
+        self.Matrix[new_x][new_y] = piece
+        self.Matrix[old_x][old_y] = "---"
+        self.zobrist_hash ^= PIECE_KEYS[piece][old_x * 8 + old_y] ^ PIECE_KEYS[piece][new_x * 8 + new_y]
+        self.evaluation += SIGNED_WEIGHTS[piece][new_x * 8 + new_y] - SIGNED_WEIGHTS[piece][old_x * 8 + old_y]
+        
+        if abs(new_x - old_x) == 2:
+            # Remove the captured piece and update scores
+            mid_x, mid_y = (old_x + new_x) // 2, (old_y + new_y) // 2
+            captured = self.Matrix[mid_x][mid_y]
+            self.Matrix[mid_x][mid_y] = "---"
+            self.zobrist_hash ^= PIECE_KEYS[captured][mid_x * 8 + mid_y]
+            self.evaluation -= SIGNED_WEIGHTS[captured][mid_x * 8 + mid_y]
+        
+        token = (move, captured, self.PlayerTurn, self.ComputerPieces, self.PlayerPieces,
+                 self.PlayerPoints, self.ComputerPoints, token_hash, token_evaluation)
+        
+        if captured is not None:
+            if self.PlayerTurn:
+                self.ComputerPieces -= 1
+                self.PlayerPoints += 1
+            else:
+                self.PlayerPieces -= 1
+                self.ComputerPoints += 1
+        
+        self.PlayerTurn = not self.PlayerTurn  # Switch turns
+        return token
+
+    def unmake_move(self, token: tuple) -> None:
+        """
+        Revert a move applied with make_move.
+        
+        Args:
+            token: Undo token returned by make_move
+        """
+        move, captured, self.PlayerTurn, self.ComputerPieces, self.PlayerPieces, \
+            self.PlayerPoints, self.ComputerPoints, self.zobrist_hash, self.evaluation = token
+        old_x, old_y, new_x, new_y = move
+        
+        self.Matrix[old_x][old_y] = self.Matrix[new_x][new_y]
+        self.Matrix[new_x][new_y] = "---"
+        if captured is not None:
+            self.Matrix[(old_x + new_x) // 2][(old_y + new_y) // 2] = captured
 
     def check_game_over(self) -> bool:
         """
@@ -177,14 +343,25 @@ class GameBoard:
         """
         Evaluate the board state for the AI (higher score is better for the AI).
         
+        The score is maintained incrementally by every move, so this is O(1).
+        
+        Returns:
+            Integer score representing board advantage
+        """
+        if self.verify_evaluation:
+            expected = self.recompute_evaluation()
+            if self.evaluation != expected:
+                raise AssertionError(f"Incremental evaluation {self.evaluation} != full recompute {expected}")
+        return self.evaluation
+
+    def recompute_evaluation(self) -> int:
+        """
+        Evaluate the board from scratch by scanning every square.
+        
         Returns:
             Integer score representing board advantage
         """
-        player_score = sum((7 - x if y % 2 == 0 else x) for x in range(8) for y in range(8) 
-                          if self.Matrix[x][y] == 'B')
-        computer_score = sum((x if y % 2 == 0 else 7 - x) for x in range(8) for y in range(8) 
-                           if self.Matrix[x][y] == 'C')
-        return computer_score - player_score  # Return the difference in scores
+        return evaluate_matrix(self.Matrix)  # AI weights minus player weights
 
     def get_board_state(self) -> List[List[str]]:
         """
@@ -203,16 +380,18 @@ class GameBoard:
             state: Board state matrix to set
         """
         self.Matrix = [row[:] for row in state]
+        self.zobrist_hash = hash_matrix(self.Matrix)
+        self.evaluation = self.recompute_evaluation()
 
     def count_pieces(self) -> Tuple[int, int]:
         """
-        Count the number of pieces for each player.
+        Count the number of pieces for each player, kings included.
         
         Returns:
             Tuple of (player_pieces, computer_pieces)
         """
-        player_count = sum(1 for row in self.Matrix for cell in row if cell == 'B')
-        computer_count = sum(1 for row in self.Matrix for cell in row if cell == 'C')
+        player_count = sum(1 for row in self.Matrix for cell in row if cell in ('B', 'BK'))
+        computer_count = sum(1 for row in self.Matrix for cell in row if cell in ('C', 'CK'))
         return player_count, computer_count
 
     def __str__(self) -> str:
@@ -225,9 +404,61 @@ class GameBoard:
             result += "\n"
         return result
 
+    def to_bytes(self) -> bytes:
+        """
+        Encode the position and side to move in ``POSITION.size`` (13) bytes.
+
+        Returns:
+            Encoded position, identical for both backends
+        """
+        player_bb = computer_bb = king_bb = 0
+        for square, (x, y) in enumerate(DARK_SQUARES):
+            piece = self.Matrix[x][y]
+            if piece == "---":
+                continue
+            if piece[0] == "B":
+                player_bb |= 1 << square
+            else:
+                computer_bb |= 1 << square
+            if len(piece) == 2:
+                king_bb |= 1 << square
+        return POSITION.pack(player_bb, computer_bb, king_bb, self.PlayerTurn)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GameBoard':
+        """
+        Build a board from an encoded position.
+
+        Piece counts come from the position; points are the pieces each side has
+        captured from its starting 12.
+
+        Args:
+            data: Position encoded by ``to_bytes`` (of either backend)
+
+        Returns:
+            New board
+
+        Raises:
+            ValueError: If the data is not a valid encoded position
+        """
+        player_bb, computer_bb, king_bb, player_turn = unpack_position(data)
+        state = [["---" for _ in range(8)] for _ in range(8)]
+        for square, (x, y) in enumerate(DARK_SQUARES):
+            bit = 1 << square
+            if (player_bb | computer_bb) & bit:
+                state[x][y] = ("B" if player_bb & bit else "C") + ("K" if king_bb & bit else "")
+        board = cls.__new__(cls)
+        board.set_board_state(state)
+        board.PlayerTurn = player_turn
+        board.PlayerPieces, board.ComputerPieces = bin(player_bb).count("1"), bin(computer_bb).count("1")
+        board.SelectedPiece = None
+        board.PlayerPoints = 12 - board.ComputerPieces
+        board.ComputerPoints = 12 - board.PlayerPieces
+        return board
+
     def __copy__(self) -> 'GameBoard':
-        """Create a shallow copy of the board."""
-        new_board = GameBoard()
+        """Create a copy of the board without re-running the starting setup."""
+        new_board = GameBoard.__new__(GameBoard)
         new_board.Matrix = [row[:] for row in self.Matrix]
         new_board.PlayerTurn = self.PlayerTurn
         new_board.ComputerPieces = self.ComputerPieces
@@ -235,16 +466,10 @@ class GameBoard:
         new_board.SelectedPiece = self.SelectedPiece
         new_board.PlayerPoints = self.PlayerPoints
         new_board.ComputerPoints = self.ComputerPoints
+        new_board.zobrist_hash = self.zobrist_hash
+        new_board.evaluation = self.evaluation
         return new_board
 
     def __deepcopy__(self, memo) -> 'GameBoard':
         """Create a deep copy of the board."""
-        new_board = GameBoard()
-        new_board.Matrix = [row[:] for row in self.Matrix]
-        new_board.PlayerTurn = self.PlayerTurn
-        new_board.ComputerPieces = self.ComputerPieces
-        new_board.PlayerPieces = self.PlayerPieces
-        new_board.SelectedPiece = self.SelectedPiece
-        new_board.PlayerPoints = self.PlayerPoints
-        new_board.ComputerPoints = self.ComputerPoints
-        return new_board
+        return self.__copy__()
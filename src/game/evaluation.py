@@ -0,0 +1,126 @@
+"""
+Board Evaluation Weights
+
+This module contains the per-square weights behind ``evaluate_board``. A man's
+value depends on its square (an advancement term by default); kings are not
+scored. The signed tables let boards keep the evaluation up to date by adding
+the weight delta of the squares a move touches instead of rescanning the board.
+
+Weights fitted by ``python -m src.tools.tune`` are written to a JSON file that is
+loaded when this module is first imported: the file named by the
+``CHECKERS_WEIGHTS`` environment variable (which must exist), otherwise
+``evaluation_weights.json`` in the repository root if it exists. The path does
+not depend on the working directory, and worker processes inherit the variable,
+so every process of a run evaluates with the same weights. ``WEIGHTS_PATH`` and
+``WEIGHTS_DIGEST`` identify the weights in use (search logs record them).
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+
+# Tuned weights replacing the defaults below, loaded at import time
+WEIGHTS_ENV = "CHECKERS_WEIGHTS"  # Environment variable naming the weight file
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                    "evaluation_weights.json")
+
+# (row, column) of each dark square, in the order weight files list them
+_DARK_SQUARES = [(x, y) for x in range(8) for y in range(8) if (x + y) % 2 == 1]
+
+# Positional weight of a man on (x, y), indexed by x * 8 + y
+PLAYER_WEIGHTS = [(7 - x if y % 2 == 0 else x) for x in range(8) for y in range(8)]
+COMPUTER_WEIGHTS = [(x if y % 2 == 0 else 7 - x) for x in range(8) for y in range(8)]
+
+
+def load_weights(path: str) -> Tuple[List[int], List[int]]:
+    """
+    Read a weight file written by ``write_weights``.
+
+    Args:
+        path: JSON weight file
+
+    Returns:
+        Tuple of (player weights, AI weights), each indexed by x * 8 + y
+
+    Raises:
+        ValueError: If the file does not hold 32 integer weights per side
+    """
+    with open(path) as weights_file:
+        data = json.load(weights_file)
+    tables = []
+    for side in ("player", "computer"):
+        weights = data.get(side) if isinstance(data, dict) else None
+        if not isinstance(weights, list) or len(weights) != 32 or \
+                not all(isinstance(weight, int) for weight in weights):
+            raise ValueError(f"{path}: '{side}' must be a list of 32 integer weights")
+        table = [0] * 64
+        for (x, y), weight in zip(_DARK_SQUARES, weights):
+            table[x * 8 + y] = weight
+        tables.append(table)
+    return tables[0], tables[1]
+
+
+def write_weights(path: str, player_weights: List[int], computer_weights: List[int], **info) -> None:
+    """
+    Write a weight file.
+
+    Args:
+        path: Output file
+        player_weights: Weight of a player man ('B') on each square, indexed by x * 8 + y
+        computer_weights: Weight of an AI man ('C') on each square, indexed by x * 8 + y
+        **info: Extra fields stored alongside, e.g. how the weights were fitted
+    """
+    data = {'player': [int(player_weights[x * 8 + y]) for x, y in _DARK_SQUARES],
+            'computer': [int(computer_weights[x * 8 + y]) for x, y in _DARK_SQUARES]}
+    data.update(info)
+    with open(path, "w") as weights_file:
+        json.dump(data, weights_file, indent=1)
+
+
+def _resolve_weights_path() -> Optional[str]:
+    """
+    Absolute path of the weight file to load, or None to keep the built-in weights.
+
+    Raises:
+        FileNotFoundError: If the environment variable names a missing file
+    """
+    path = os.environ.get(WEIGHTS_ENV)
+    if path:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{WEIGHTS_ENV} names a missing weight file: {path}")
+        return os.path.abspath(path)
+    return DEFAULT_WEIGHTS_PATH if os.path.exists(DEFAULT_WEIGHTS_PATH) else None
+
+
+# Weight file in use (None: the built-in weights) and a short digest of the weights themselves
+WEIGHTS_PATH = _resolve_weights_path()
+if WEIGHTS_PATH is not None:
+    PLAYER_WEIGHTS, COMPUTER_WEIGHTS = load_weights(WEIGHTS_PATH)
+WEIGHTS_DIGEST = hashlib.sha1(json.dumps([PLAYER_WEIGHTS, COMPUTER_WEIGHTS]).encode()).hexdigest()[:12]
+
+# Largest value of one man on any square (7 with the built-in weights), the unit for score margins
+MAX_SQUARE_WEIGHT = max(abs(weight) for weight in PLAYER_WEIGHTS + COMPUTER_WEIGHTS)
+
+# Contribution of each piece to the AI's score (player pieces count against it)
+SIGNED_WEIGHTS: Dict[str, List[int]] = {
+    "B": [-weight for weight in PLAYER_WEIGHTS],
+    "C": list(COMPUTER_WEIGHTS),
+    "BK": [0] * 64,
+    "CK": [0] * 64,
+    "---": [0] * 64,
+}
+
+
+def evaluate_matrix(matrix: List[List[str]]) -> int:
+    """
+    Evaluate a board matrix from scratch (higher is better for the AI).
+
+    Args:
+        matrix: 8x8 board matrix
+
+    Returns:
+        Integer score, equal to GameBoard.evaluate_board for the same position
+    """
+    return sum(SIGNED_WEIGHTS[matrix[x][y]][x * 8 + y] for x in range(8) for y in range(8))
@@ -0,0 +1,71 @@
+"""
+Compact Position Notation
+
+This module converts boards to and from a one-line text form: 32 characters, one
+per dark square in row-major order, followed by a space and the side to move.
+
+    '-' empty, 'b' player man, 'c' AI man, 'B' player king, 'C' AI king
+    side to move: 'b' (player) or 'c' (AI)
+
+The starting position is ``cccccccccccc--------bbbbbbbbbbbb b``.
+"""
+
+from typing import List
+
+from .board import DARK_SQUARES, GameBoard
+
+
+SYMBOL_TO_PIECE = {"-": "---", "b": "B", "c": "C", "B": "BK", "C": "CK"}
+PIECE_TO_SYMBOL = {piece: symbol for symbol, piece in SYMBOL_TO_PIECE.items()}
+
+START_POSITION = "cccccccccccc--------bbbbbbbbbbbb b"
+
+
+def board_to_string(board_obj) -> str:
+    """
+    Describe a board in compact notation.
+
+    Args:
+        board_obj: Board of either backend
+
+    Returns:
+        Position string
+    """
+    state = board_obj.get_board_state()
+    squares = "".join(PIECE_TO_SYMBOL[state[x][y]] for x, y in DARK_SQUARES)
+    return f"{squares} {'b' if board_obj.PlayerTurn else 'c'}"
+
+
+def board_from_string(text: str, board_class=GameBoard):
+    """
+    Build a board from compact notation.
+
+    Piece counts come from the position; points are the pieces each side has
+    captured from its starting 12.
+
+    Args:
+        text: Position string
+        board_class: Board backend to create
+
+    Returns:
+        New board of ``board_class``
+
+    Raises:
+        ValueError: If the string is not a valid position
+    """
+    parts = text.split()
+    if len(parts) != 2 or len(parts[0]) != 32 or parts[1] not in ("b", "c") or \
+            any(symbol not in SYMBOL_TO_PIECE for symbol in parts[0]):
+        raise ValueError(f"Invalid position string: {text!r}")
+
+    state: List[List[str]] = [["---" for _ in range(8)] for _ in range(8)]
+    for (x, y), symbol in zip(DARK_SQUARES, parts[0]):
+        state[x][y] = SYMBOL_TO_PIECE[symbol]
+
+    board = board_class()
+    board.set_board_state(state)
+    board.PlayerTurn = parts[1] == "b"
+    board.PlayerPieces, board.ComputerPieces = board.count_pieces()
+    board.PlayerPoints = 12 - board.ComputerPieces
+    board.ComputerPoints = 12 - board.PlayerPieces
+    return board
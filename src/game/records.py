@@ -0,0 +1,225 @@
+"""
+Game Records
+
+This module archives played games in an append-only binary file. Games are
+written move by move as they are played, so an interrupted game loses nothing
+and several games (e.g. on the server) can be recorded into one file at once;
+``read_games`` streams the file back one game at a time, so even millions of
+games are scanned in constant memory.
+
+File layout (little endian):
+
+    header   magic b"CKGR", version (u16)
+    records  tag (u8), game id (u32), then by tag:
+               b"S" start   starting position (13 bytes, see ``GameBoard.to_bytes``)
+               b"M" move    from square (u8), to square (u8)
+               b"E" end     result (u8)
+
+Squares use the 32-square numbering of the bitboard backend. Game ids only need
+to be unique among the games in progress: a start record for an id whose game
+never ended closes that game as unfinished (e.g. after a crash).
+"""
+
+import struct
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from .bitboard import BitboardGameBoard, RC_TO_SQUARE, SQUARE_TO_RC
+from .board import POSITION
+
+
+MAGIC = b"CKGR"
+VERSION = 1
+HEADER = struct.Struct("<4sH")
+RECORD = struct.Struct("<cI")  # Tag and game id, at the start of every record
+
+START, MOVE, END = b"S", b"M", b"E"
+PAYLOAD_SIZES = {START: POSITION.size, MOVE: 2, END: 1}
+MOVE_PAYLOAD = struct.Struct("<BB")
+
+# Results stored in end records
+UNFINISHED, PLAYER_WIN, COMPUTER_WIN = 0, 1, 2
+
+_READ_SIZE = 1 << 20  # Bytes read from the file at a time
+
+
+def game_result(board_obj) -> int:
+    """
+    Result of a position: a side with no pieces or, on its turn, no legal move has lost.
+
+    Args:
+        board_obj: Board of either backend
+
+    Returns:
+        PLAYER_WIN, COMPUTER_WIN or UNFINISHED
+    """
+    if board_obj.PlayerPieces == 0:
+        return COMPUTER_WIN
+    if board_obj.ComputerPieces == 0:
+        return PLAYER_WIN
+    if not board_obj.generate_moves(not board_obj.PlayerTurn):
+        return COMPUTER_WIN if board_obj.PlayerTurn else PLAYER_WIN
+    return UNFINISHED
+
+
+class GameRecord:
+    """One recorded game: its starting position, moves and result."""
+
+    __slots__ = ("game_id", "start", "moves", "result")
+
+    def __init__(self, game_id: int, start: bytes):
+        self.game_id = game_id
+        self.start = start  # Encoded starting position
+        self.moves: List[tuple] = []  # (old_x, old_y, new_x, new_y) in play order
+        self.result = UNFINISHED
+
+    def start_board(self, board_class=BitboardGameBoard):
+        """Board of ``board_class`` set up at the starting position."""
+        return board_class.from_bytes(self.start)
+
+    def positions(self, board_class=BitboardGameBoard) -> Iterator:
+        """
+        Replay the game.
+
+        Args:
+            board_class: Board backend to replay on
+
+        Yields:
+            The same board after the start and after every move
+        """
+        board = self.start_board(board_class)
+        yield board
+        for move in self.moves:
+            board.make_move(move)
+            yield board
+
+
+class GameRecordWriter:
+    """Appends games to a record file, one record per event, flushed as written."""
+
+    def __init__(self, path: str):
+        """
+        Open a record file for appending, creating it if needed.
+
+        Args:
+            path: Record file
+
+        Raises:
+            ValueError: If an existing file is not a game record file of this version
+        """
+        self.file: BinaryIO = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(MAGIC, VERSION))
+            self.file.flush()
+        else:
+            with open(path, "rb") as existing:
+                header = existing.read(HEADER.size)
+            if len(header) != HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION):
+                self.file.close()
+                raise ValueError(f"{path} is not a version {VERSION} game record file")
+        self.next_game_id = 1  # Used by start_game when the caller has no ids of its own
+
+    def start_game(self, board_obj, game_id: Optional[int] = None) -> int:
+        """
+        Record the start of a game.
+
+        Args:
+            board_obj: Starting position
+            game_id: Id of the game, or None to number games in the order they start
+
+        Returns:
+            The game's id, to pass to ``record_move`` and ``end_game``
+        """
+        if game_id is None:
+            game_id = self.next_game_id
+            self.next_game_id += 1
+        self._write(START, game_id, board_obj.to_bytes())
+        return game_id
+
+    def record_move(self, game_id: int, move: tuple) -> None:
+        """
+        Record a move of a game in progress.
+
+        Args:
+            game_id: Id returned by ``start_game``
+            move: (old_x, old_y, new_x, new_y)
+        """
+        old_x, old_y, new_x, new_y = move
+        self._write(MOVE, game_id, MOVE_PAYLOAD.pack(RC_TO_SQUARE[old_x * 8 + old_y], RC_TO_SQUARE[new_x * 8 + new_y]))
+
+    def end_game(self, game_id: int, result: int) -> None:
+        """
+        Record the end of a game.
+
+        Args:
+            game_id: Id returned by ``start_game``
+            result: PLAYER_WIN, COMPUTER_WIN or UNFINISHED (abandoned)
+        """
+        self._write(END, game_id, bytes((result,)))
+
+    def close(self) -> None:
+        """Close the file."""
+        self.file.close()
+
+    def _write(self, tag: bytes, game_id: int, payload: bytes) -> None:
+        self.file.write(RECORD.pack(tag, game_id) + payload)
+        self.file.flush()
+
+
+def read_games(path: str, include_unfinished: bool = True) -> Iterator[GameRecord]:
+    """
+    Stream the games of a record file, each as soon as its end record is read.
+
+    Only the games in progress at any point of the file are held in memory. Games
+    that never got an end record are yielded as UNFINISHED when their id is
+    reused or the file ends; a record cut short by a crash ends the file.
+
+    Args:
+        path: Record file
+        include_unfinished: Also yield games that never got an end record
+
+    Yields:
+        GameRecord of every game
+
+    Raises:
+        ValueError: If the file is not a game record file of this version, or is corrupt
+    """
+    open_games: Dict[int, GameRecord] = {}
+    with open(path, "rb") as record_file:
+        header = record_file.read(HEADER.size)
+        if len(header) != HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION):
+            raise ValueError(f"{path} is not a version {VERSION} game record file")
+        buffer = b""
+        offset = 0
+        while True:
+            chunk = record_file.read(_READ_SIZE)
+            if not chunk:
+                break
+            buffer = buffer[offset:] + chunk
+            offset = 0
+            end = len(buffer)
+            while end - offset >= RECORD.size:
+                tag, game_id = RECORD.unpack_from(buffer, offset)
+                size = PAYLOAD_SIZES.get(tag)
+                if size is None:
+                    raise ValueError(f"Corrupt game record file {path}: unknown record {tag!r}")
+                if end - offset < RECORD.size + size:
+                    break  # The rest of this record is in the next chunk
+                start = offset + RECORD.size
+                offset = start + size
+                if tag == MOVE:
+                    game = open_games.get(game_id)
+                    if game is not None:
+                        src, dst = MOVE_PAYLOAD.unpack_from(buffer, start)
+                        game.moves.append(SQUARE_TO_RC[src] + SQUARE_TO_RC[dst])
+                elif tag == START:
+                    unfinished = open_games.pop(game_id, None)
+                    if unfinished is not None and include_unfinished:
+                        yield unfinished
+                    open_games[game_id] = GameRecord(game_id, buffer[start:offset])
+                else:
+                    game = open_games.pop(game_id, None)
+                    if game is not None:
+                        game.result = buffer[start]
+                        yield game
+    if include_unfinished:
+        yield from open_games.values()
@@ -0,0 +1,42 @@
+"""
+Zobrist Hashing Keys
+
+This module contains the random keys used to hash checkers positions. Both board
+backends use the same keys, so a position hashes to the same value whichever
+backend produced it.
+"""
+
+import random
+from typing import Dict, List
+
+
+ZOBRIST_SEED = 0x5EED  # Fixed seed so hashes are stable across runs and processes
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# One 64-bit key per (piece, square); light squares get keys too but are never used
+PIECE_KEYS: Dict[str, List[int]] = {
+    piece: [_rng.getrandbits(64) for _ in range(64)] for piece in ("B", "C", "BK", "CK")
+}
+
+# Board hashes cover the pieces only; searches XOR this in when the AI is to move
+SIDE_KEY = _rng.getrandbits(64)
+
+
+def hash_matrix(matrix: List[List[str]]) -> int:
+    """
+    Compute the Zobrist hash of the pieces on a board from scratch.
+
+    Args:
+        matrix: 8x8 board matrix of '---', 'B', 'C', 'BK' or 'CK'
+
+    Returns:
+        64-bit hash of the piece placement
+    """
+    key = 0
+    for x in range(8):
+        for y in range(8):
+            piece = matrix[x][y]
+            if piece != "---":
+                key ^= PIECE_KEYS[piece][x * 8 + y]
+    return key
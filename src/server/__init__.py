@@ -0,0 +1,3 @@
+"""
+Headless multi-game server for the Checkers AI Game.
+"""
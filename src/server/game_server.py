@@ -0,0 +1,405 @@
+"""
+Multi-Game Server
+
+This module hosts many games at once behind an asyncio TCP server. Clients send
+one JSON object per line and get one JSON object per line back; boards live in
+memory and AI moves are searched on a shared, size-limited process pool.
+
+Requests (an optional "id" field is echoed in the reply):
+
+    {"op": "new_game"}                                  -> {"game": 1, "position": "..."}
+    {"op": "move", "game": 1, "move": [5, 0, 4, 1],
+     "time_budget": 0.2}                                -> {"ai_move": [...], "position": "...", ...}
+    {"op": "end_game", "game": 1}                       -> {"ok": true}
+    {"op": "stats"}                                     -> throughput and latency figures,
+                                                           and the evaluation weights in use
+
+A "move" plays the player's move and replies with the AI's answer. Each game has
+at most one search in flight and waiting games are served round-robin, so no
+game can hold the pool while others wait; once ``max_queued`` searches are
+waiting, new ones are refused with ``"error": "busy"`` and the client should
+retry later.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional
+
+from ..ai.book import DEFAULT_PATH as BOOK_PATH, OpeningBook
+from ..ai.iterative import iterative_deepening
+from ..ai.tablebase import DEFAULT_PATH as TABLEBASE_PATH, EndgameTablebase
+from ..ai.transposition import TranspositionTable
+from ..game.bitboard import BitboardGameBoard
+from ..game import evaluation
+from ..game.board import GameBoard
+from ..game.notation import board_from_string, board_to_string
+from ..game.records import GameRecordWriter, game_result
+
+
+BOARD_CLASSES = {"bitboard": BitboardGameBoard, "matrix": GameBoard}
+
+# Per-process search state, created by the pool initializer
+_worker_table = None
+_worker_tablebase = None
+
+
+def _init_worker(table_megabytes: float, tablebase_path: Optional[str]) -> None:
+    """Give each worker process its own transposition table, and the endgame table if there is one."""
+    global _worker_table, _worker_tablebase
+    _worker_table = TranspositionTable(table_megabytes)
+    if tablebase_path and os.path.exists(tablebase_path):
+        _worker_tablebase = EndgameTablebase(tablebase_path)
+
+
+def _search_position(position: str, board_name: str, time_budget: float, max_depth: int) -> dict:
+    """Search the AI's move in a position inside a worker process."""
+    board = board_from_string(position, BOARD_CLASSES[board_name])
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    best_move, score = iterative_deepening(board, True, stats, time_budget, max_depth=max_depth,
+                                           table=_worker_table, tablebase=_worker_tablebase)
+    return {'move': best_move, 'score': score if abs(score) != math.inf else None,
+            'nodes': stats['nodes_expanded'], 'depth': stats['depth_reached']}
+
+
+class QueueFull(Exception):
+    """Raised when the scheduler already holds its maximum number of waiting searches."""
+
+
+class FairScheduler:
+    """
+    Runs searches on a process pool, taking games in round-robin order.
+
+    Each game has its own FIFO queue; a fixed number of dispatchers (one per
+    worker process) repeatedly take the next request from the game at the head
+    of the ready ring and move that game to the back.
+    """
+
+    def __init__(self, executor: ProcessPoolExecutor, workers: int, max_queued: int):
+        """
+        Create the scheduler; call ``start`` from inside the event loop.
+
+        Args:
+            executor: Process pool the searches run on
+            workers: Searches run at the same time (the pool size)
+            max_queued: Waiting searches allowed before new ones are refused
+        """
+        self.executor = executor
+        self.workers = workers
+        self.max_queued = max_queued
+        self.queues: Dict[int, Deque[tuple]] = {}
+        self.ready: Deque[int] = deque()  # Games with queued work, in service order
+        self.queued = 0
+        self.running = 0
+        self.wakeup = None
+        self.dispatchers: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the dispatcher tasks."""
+        self.wakeup = asyncio.Condition()
+        self.dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the dispatcher tasks and every request still running or waiting in the queues."""
+        for task in self.dispatchers:
+            task.cancel()  # Also cancels a pool call that has not started yet
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        for queue in self.queues.values():
+            for future, _, _ in queue:
+                future.cancel()
+            queue.clear()
+        self.ready.clear()
+        self.queued = 0
+
+    async def submit(self, game_id: int, function: Callable, *args) -> object:
+        """
+        Queue a call for a game and wait for its result.
+
+        Raises:
+            QueueFull: If ``max_queued`` searches are already waiting
+        """
+        if self.queued >= self.max_queued:
+            raise QueueFull()
+        future = asyncio.get_running_loop().create_future()
+        queue = self.queues.setdefault(game_id, deque())
+        queue.append((future, function, args))
+        if len(queue) == 1:
+            self.ready.append(game_id)
+        self.queued += 1
+        async with self.wakeup:
+            self.wakeup.notify()
+        return await future
+
+    def forget(self, game_id: int) -> None:
+        """Drop a finished game's queue once it is empty."""
+        if not self.queues.get(game_id, True):
+            del self.queues[game_id]
+
+    async def _dispatch(self) -> None:
+        """Take work from the games in turn and run it on the pool."""
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self.wakeup:
+                await self.wakeup.wait_for(lambda: self.ready)
+                game_id = self.ready.popleft()
+                queue = self.queues[game_id]
+                future, function, args = queue.popleft()
+                if queue:
+                    self.ready.append(game_id)  # Back of the ring: other games go first
+                self.queued -= 1
+            if future.cancelled():
+                continue  # The client went away
+            self.running += 1
+            try:
+                result = await loop.run_in_executor(self.executor, function, *args)
+            except asyncio.CancelledError:
+                future.cancel()  # Stopped mid-search: the waiting request must not hang
+                raise
+            except Exception as error:
+                if not future.cancelled():
+                    future.set_exception(error)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self.running -= 1
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of numbers, or None if it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+class GameServer:
+    """Holds the game sessions and answers client requests."""
+
+    def __init__(self, workers: Optional[int] = None, max_queued: int = 64, board_name: str = "bitboard",
+                 default_time_budget: float = 0.5, max_time_budget: float = 5.0, max_depth: int = 32,
+                 table_megabytes: float = 16, book_path: Optional[str] = BOOK_PATH,
+                 tablebase_path: Optional[str] = TABLEBASE_PATH, latency_window: int = 10000,
+                 record_path: Optional[str] = None):
+        """
+        Configure the server; call ``start`` (or ``serve``) to open the pool and socket.
+
+        Args:
+            workers: Search processes (defaults to the CPU count)
+            max_queued: Waiting searches allowed before requests are refused as busy
+            board_name: Board backend for the sessions, "bitboard" or "matrix"
+            default_time_budget: Seconds per AI move when a request gives none
+            max_time_budget: Upper limit on the time budget a request may ask for
+            max_depth: Deepest iteration of any search
+            table_megabytes: Transposition table size of each worker
+            book_path: Opening book answered from without searching, used if the file exists
+            tablebase_path: Endgame table loaded by the workers, used if the file exists
+            latency_window: Number of recent move latencies kept for percentiles
+            record_path: Game record file every game is appended to, move by move
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queued = max_queued
+        self.board_class = BOARD_CLASSES[board_name]
+        self.board_name = board_name
+        self.default_time_budget = default_time_budget
+        self.max_time_budget = max_time_budget
+        self.max_depth = max_depth
+        self.table_megabytes = table_megabytes
+        self.tablebase_path = tablebase_path
+        self.book = OpeningBook(book_path) if book_path and os.path.exists(book_path) else None
+        self.games: Dict[int, object] = {}
+        self.records = GameRecordWriter(record_path) if record_path else None
+        self.thinking = set()  # Games whose AI move is being searched
+        self.clients = set()  # Open client connections
+        self.next_game_id = 1
+        self.latencies: Deque[float] = deque(maxlen=latency_window)
+        self.moves_played = 0
+        self.book_moves = 0
+        self.rejected = 0
+        self.first_move_at = None
+        self.executor = None
+        self.scheduler = None
+        self.server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Start the worker pool, the scheduler and the listening socket."""
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(self.table_megabytes, self.tablebase_path))
+        self.scheduler = FairScheduler(self.executor, self.workers, self.max_queued)
+        self.scheduler.start()
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on (useful when started on port 0)."""
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop accepting clients, disconnect the open ones and shut the pool down."""
+        self.server.close()
+        for writer in list(self.clients):
+            writer.close()
+        await self.server.wait_closed()
+        await self.scheduler.stop()
+        self.executor.shutdown()  # Only calls already running are left; the scheduler cancelled the rest
+        if self.records is not None:
+            for game_id, board in self.games.items():
+                self.records.end_game(game_id, game_result(board))  # UNFINISHED unless already decided
+            self.records.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Run until cancelled."""
+        await self.start(host, port)
+        print(f"Serving on {host}:{self.port} with {self.workers} search workers", file=sys.stderr)
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one connection's requests in order until it closes."""
+        self.clients.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = {}
+                try:
+                    request = json.loads(line)
+                    reply = await self.handle_request(request)
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {'ok': False, 'error': f"bad request: {error}"}
+                if isinstance(request, dict) and 'id' in request:
+                    reply['id'] = request['id']
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()  # Stop reading while this client is not keeping up
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    async def handle_request(self, request: dict) -> dict:
+        """
+        Dispatch one request.
+
+        Raises:
+            KeyError, TypeError, ValueError: If the request is malformed
+        """
+        op = request['op']
+        if op == "new_game":
+            game_id = self.next_game_id
+            self.next_game_id += 1
+            self.games[game_id] = self.board_class()
+            if self.records is not None:
+                self.records.start_game(self.games[game_id], game_id)
+            return {'ok': True, 'game': game_id, 'position': board_to_string(self.games[game_id])}
+        if op == "move":
+            return await self.play_move(request)
+        if op == "end_game":
+            board = self.games.pop(request['game'], None)
+            self.scheduler.forget(request['game'])
+            if board is not None and self.records is not None:
+                self.records.end_game(request['game'], game_result(board))
+            return {'ok': True}
+        if op == "stats":
+            return {'ok': True, **self.metrics()}
+        raise ValueError(f"unknown op {op!r}")
+
+    async def play_move(self, request: dict) -> dict:
+        """Play the player's move, then search and play the AI's reply."""
+        received = time.perf_counter()
+        game_id = request['game']
+        board = self.games.get(game_id)
+        if board is None:
+            return {'ok': False, 'error': "unknown game"}
+        if game_id in self.thinking:
+            return {'ok': False, 'error': "AI move in progress"}
+        move = tuple(request['move'])
+        if not board.PlayerTurn or move not in board.generate_moves(False):
+            return {'ok': False, 'error': "illegal move", 'position': board_to_string(board)}
+        time_budget = min(float(request.get('time_budget', self.default_time_budget)), self.max_time_budget)
+
+        token = board.make_move(move)
+        reply = {'ok': True}
+        if not self._finished(board, True):
+            ai_move = self.book.lookup(board) if self.book is not None else None
+            if ai_move is not None:
+                self.book_moves += 1
+                reply.update({'ai_move': list(ai_move), 'book': True})
+            else:
+                self.thinking.add(game_id)
+                try:
+                    result = await self.scheduler.submit(game_id, _search_position, board_to_string(board),
+                                                         self.board_name, time_budget, self.max_depth)
+                except QueueFull:
+                    board.unmake_move(token)  # The client may send the same move again
+                    self.rejected += 1
+                    return {'ok': False, 'error': "busy", 'queued': self.scheduler.queued}
+                finally:
+                    self.thinking.discard(game_id)
+                ai_move = result['move']
+                reply.update({'ai_move': list(ai_move) if ai_move else None, 'score': result['score'],
+                              'nodes': result['nodes'], 'depth': result['depth']})
+            if self.games.get(game_id) is board and ai_move is not None:
+                board.make_move(ai_move)
+        if self.records is not None and self.games.get(game_id) is board:
+            self.records.record_move(game_id, move)  # Only once the move can no longer be taken back
+            if reply.get('ai_move') is not None:
+                self.records.record_move(game_id, ai_move)
+
+        latency = time.perf_counter() - received
+        self.latencies.append(latency)
+        self.moves_played += 1
+        if self.first_move_at is None:
+            self.first_move_at = received
+        reply.update({'position': board_to_string(board), 'game_over': self._finished(board, False),
+                      'latency': latency})
+        return reply
+
+    @staticmethod
+    def _finished(board, maximizing_player: bool) -> bool:
+        """True once a side has no pieces, or the side to move has no legal move."""
+        return board.PlayerPieces == 0 or board.ComputerPieces == 0 or \
+            not board.generate_moves(maximizing_player)
+
+    def metrics(self) -> dict:
+        """Throughput and latency figures since the first move."""
+        elapsed = time.perf_counter() - self.first_move_at if self.first_move_at is not None else 0.0
+        latencies = list(self.latencies)
+        return {'games': len(self.games), 'moves': self.moves_played, 'book_moves': self.book_moves,
+                'rejected': self.rejected, 'queued': self.scheduler.queued, 'running': self.scheduler.running,
+                'moves_per_second': self.moves_played / elapsed if elapsed > 0 else 0.0,
+                'latency_p50': percentile(latencies, 0.50), 'latency_p99': percentile(latencies, 0.99),
+                'weights_path': evaluation.WEIGHTS_PATH, 'weights_digest': evaluation.WEIGHTS_DIGEST}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Serve many checkers games over TCP with JSON lines.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--workers", type=int, help="search processes (default: CPU count)")
+    parser.add_argument("--max-queued", type=int, default=64, help="waiting searches before refusing as busy")
+    parser.add_argument("--time-budget", type=float, default=0.5, help="default seconds per AI move")
+    parser.add_argument("--board", choices=sorted(BOARD_CLASSES), default="bitboard", help="board backend")
+    parser.add_argument("--record", metavar="PATH", help="append every game to this game record file")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.workers, args.max_queued, args.board, args.time_budget, record_path=args.record)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Local Load Generator
+
+Plays many games against the game server at once, each from its own connection,
+choosing random legal player moves, and reports throughput and move latency:
+
+    python -m src.server.load_generator --spawn --games 32 --moves 8
+
+With ``--spawn`` a server is started in this process on a free port; otherwise
+the generator connects to ``--host``/``--port``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import List, Optional
+
+from ..game.notation import board_from_string
+from .game_server import GameServer, percentile
+
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, message: dict) -> dict:
+    """Send one request and wait for its reply."""
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def play_game(host: str, port: int, moves: int, time_budget: float, seed: int,
+                    latencies: List[float], counters: dict) -> None:
+    """
+    Play up to ``moves`` player moves in one game, retrying while the server is busy.
+
+    Args:
+        host: Server address
+        port: Server port
+        moves: Player moves to play (fewer if the game ends)
+        time_budget: AI seconds per move to request
+        seed: Seed of this game's random player
+        latencies: List receiving the latency of every answered move
+        counters: Dict whose 'moves', 'busy' and 'errors' counts are updated
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        reply = await _request(reader, writer, {'op': "new_game"})
+        game_id, position = reply['game'], reply['position']
+        for _ in range(moves):
+            legal = board_from_string(position).generate_moves(False)
+            if not legal:
+                break
+            move = rng.choice(legal)
+            backoff = 0.01
+            while True:
+                started = time.perf_counter()
+                reply = await _request(reader, writer, {'op': "move", 'game': game_id, 'move': move,
+                                                        'time_budget': time_budget})
+                if reply.get('error') != "busy":
+                    break
+                counters['busy'] += 1
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 1.0)
+            if not reply['ok']:
+                counters['errors'] += 1
+                break
+            latencies.append(time.perf_counter() - started)
+            counters['moves'] += 1
+            position = reply['position']
+            if reply['game_over']:
+                break
+        await _request(reader, writer, {'op': "end_game", 'game': game_id})
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(host: str, port: int, games: int, moves: int, time_budget: float, seed: int = 0) -> dict:
+    """
+    Play ``games`` games concurrently and summarize the client-side measurements.
+
+    Returns:
+        Dict with moves, seconds, moves_per_second, latency_p50, latency_p99,
+        busy retries, errors and the server's own 'server' stats
+    """
+    latencies: List[float] = []
+    counters = {'moves': 0, 'busy': 0, 'errors': 0}
+    started = time.perf_counter()
+    await asyncio.gather(*(play_game(host, port, moves, time_budget, seed + game, latencies, counters)
+                           for game in range(games)))
+    elapsed = time.perf_counter() - started
+    reader, writer = await asyncio.open_connection(host, port)
+    server_stats = await _request(reader, writer, {'op': "stats"})
+    writer.close()
+    await writer.wait_closed()
+    return {**counters, 'games': games, 'seconds': elapsed,
+            'moves_per_second': counters['moves'] / elapsed if elapsed > 0 else 0.0,
+            'latency_p50': percentile(latencies, 0.50), 'latency_p99': percentile(latencies, 0.99),
+            'server': server_stats}
+
+
+async def _spawn_and_run(args) -> dict:
+    """Start a server on a free local port, run the load against it, then stop it."""
+    server = GameServer(args.workers, args.max_queued)
+    await server.start("127.0.0.1", 0)
+    try:
+        return await run_load("127.0.0.1", server.port, args.games, args.moves, args.time_budget, args.seed)
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Load-test the checkers game server.")
+    parser.add_argument("--host", default="127.0.0.1", help="server address")
+    parser.add_argument("--port", type=int, default=8765, help="server port")
+    parser.add_argument("--spawn", action="store_true", help="start a local server instead of connecting")
+    parser.add_argument("--workers", type=int, help="search processes of a spawned server")
+    parser.add_argument("--max-queued", type=int, default=64, help="queue limit of a spawned server")
+    parser.add_argument("--games", type=int, default=16, help="concurrent games")
+    parser.add_argument("--moves", type=int, default=10, help="player moves per game")
+    parser.add_argument("--time-budget", type=float, default=0.05, help="AI seconds per move")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random players")
+    args = parser.parse_args(argv)
+
+    if args.spawn:
+        results = asyncio.run(_spawn_and_run(args))
+    else:
+        results = asyncio.run(run_load(args.host, args.port, args.games, args.moves, args.time_budget, args.seed))
+    p50, p99 = (f"{results[key] * 1000:.1f} ms" if results[key] is not None else "n/a"  # No completed moves
+                for key in ('latency_p50', 'latency_p99'))
+    print(f"{results['moves']} moves in {results['seconds']:.2f} s: {results['moves_per_second']:.1f} moves/sec, "
+          f"p50 {p50}, p99 {p99}, "
+          f"{results['busy']} busy retries, {results['errors']} errors")
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
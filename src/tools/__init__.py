@@ -0,0 +1,3 @@
+"""
+Command-line tools for the Checkers AI Game that run without the GUI.
+"""
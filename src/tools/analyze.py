@@ -0,0 +1,199 @@
+"""
+Batch Position Analysis
+
+Streams positions from a file (one compact position string per line, see
+src/game/notation.py), searches each on a process pool and writes one JSON line
+per position, in input order:
+
+    python -m src.tools.analyze positions.txt --depth 6 > analysis.jsonl
+    python -m src.tools.analyze - --time 0.5 < positions.txt
+    python -m src.tools.analyze deep.txt --depth 10 --parallel 16 > analysis.jsonl
+    python -m src.tools.analyze deep.txt --depth 8 --parallel 16 --speedup > speedup.jsonl
+
+At most a fixed number of positions are in flight at once, so memory use does
+not depend on the size of the input. With ``--parallel N`` positions are instead
+searched one at a time, each split across N processes by root move (see
+src/ai/parallel.py), which suits a few deep searches on a many-core machine;
+``--speedup`` also times a serial search of each position and records the
+wall-clock speedup.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from ..ai.iterative import iterative_deepening
+from ..ai.minimax import SearchToolBox
+from ..ai.parallel import ParallelSearch
+from ..game.bitboard import BitboardGameBoard
+from ..game.board import GameBoard
+from ..game.notation import board_from_string
+
+BOARD_CLASSES = {"bitboard": BitboardGameBoard, "matrix": GameBoard}
+
+
+def analyze_position(line_number: int, position: str, depth: int, time_budget: Optional[float] = None,
+                     board_name: str = "bitboard", parallel: Optional[ParallelSearch] = None,
+                     measure_speedup: bool = False) -> dict:
+    """
+    Search one position for the side to move.
+
+    With a time budget the search deepens iteratively (up to ``depth``) until the
+    budget runs out; otherwise it searches exactly ``depth`` plies.
+
+    Args:
+        line_number: Line of the position in the input, echoed in the result
+        position: Position string
+        depth: Search depth (maximum depth with a time budget)
+        time_budget: Seconds per position, or None for a fixed-depth search
+        board_name: "bitboard" or "matrix"
+        parallel: Process pool that splits a fixed-depth search by root move, or None
+        measure_speedup: With ``parallel``, also time a serial search and record 'speedup'
+
+    Returns:
+        JSON-serializable result; holds an 'error' field if the line is not a valid position
+    """
+    result = {'line': line_number, 'position': position}
+    try:
+        board = board_from_string(position, BOARD_CLASSES[board_name])
+    except ValueError as error:
+        result['error'] = str(error)
+        return result
+
+    maximizing_player = not board.PlayerTurn
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    started = time.perf_counter()
+    if parallel is not None:
+        best_move, score = parallel.search(board, depth, maximizing_player, stats, measure_speedup)
+        depth_reached = depth
+    elif time_budget is None:
+        best_move, score = SearchToolBox.minimax_in_place(board, depth, -math.inf, math.inf, maximizing_player,
+                                                          stats)
+        depth_reached = depth
+    else:
+        best_move, score = iterative_deepening(board, maximizing_player, stats, time_budget, max_depth=depth)
+        depth_reached = stats['depth_reached']
+    result.update({
+        'side': "c" if maximizing_player else "b",
+        'best_move': list(best_move) if best_move else None,
+        'score': score if abs(score) != math.inf else None,  # No legal move
+        'nodes': stats['nodes_expanded'],
+        'depth': depth_reached,
+        'seconds': time.perf_counter() - started,
+    })
+    if parallel is not None:
+        result['worker_utilization'] = stats['worker_utilization']
+    if 'speedup' in stats:
+        result['speedup'] = stats['speedup']
+    return result
+
+
+def read_positions(lines: Iterable[str]) -> Iterator[tuple]:
+    """Yield (line number, position) for every non-blank, non-comment line."""
+    for line_number, line in enumerate(lines, 1):
+        position = line.strip()
+        if position and not position.startswith("#"):
+            yield line_number, position
+
+
+def _write(output: TextIO, result: dict) -> None:
+    """Write one result line and flush it, so readers see results as they arrive."""
+    output.write(json.dumps(result) + "\n")
+    output.flush()
+
+
+def analyze_stream(lines: Iterable[str], output: TextIO, depth: int, time_budget: Optional[float] = None,
+                   board_name: str = "bitboard", workers: Optional[int] = None,
+                   max_pending: Optional[int] = None, parallel: Optional[int] = None,
+                   measure_speedup: bool = False) -> int:
+    """
+    Analyze positions as they are read and write results in input order.
+
+    Args:
+        lines: Input lines
+        output: Stream receiving one JSON line per position
+        depth: Search depth (maximum depth with a time budget)
+        time_budget: Seconds per position, or None for fixed-depth searches
+        board_name: "bitboard" or "matrix"
+        workers: Worker processes (defaults to the CPU count); 0 analyzes in this process
+        max_pending: Positions in flight at once (defaults to four per worker)
+        parallel: Split each fixed-depth search across this many processes instead,
+            analyzing one position at a time
+        measure_speedup: With ``parallel``, also time a serial search of each position
+
+    Returns:
+        Number of positions analyzed
+    """
+    count = 0
+    if parallel:
+        with ParallelSearch(parallel) as searcher:
+            for line_number, position in read_positions(lines):
+                _write(output, analyze_position(line_number, position, depth, None, board_name, searcher,
+                                                measure_speedup))
+                count += 1
+        return count
+    if workers == 0:
+        for line_number, position in read_positions(lines):
+            _write(output, analyze_position(line_number, position, depth, time_budget, board_name))
+            count += 1
+        return count
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 4 * workers
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for line_number, position in read_positions(lines):
+            if len(pending) >= max_pending:
+                # Wait for the oldest position so results leave in input order
+                _write(output, pending.popleft().result())
+                count += 1
+            pending.append(executor.submit(analyze_position, line_number, position, depth, time_budget,
+                                           board_name))
+        while pending:
+            _write(output, pending.popleft().result())
+            count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Analyze checkers positions in bulk, one per input line.")
+    parser.add_argument("input", help="file of position strings, or - for standard input")
+    parser.add_argument("--depth", type=int, default=5, help="search depth (maximum depth with --time)")
+    parser.add_argument("--time", type=float, help="seconds per position, searching iteratively up to --depth")
+    parser.add_argument("--board", choices=sorted(BOARD_CLASSES), default="bitboard", help="board backend")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count, 0: no pool)")
+    parser.add_argument("--parallel", type=int, metavar="N",
+                        help="split each position's search across N processes (fixed depth only)")
+    parser.add_argument("--speedup", action="store_true",
+                        help="with --parallel, also time a serial search and record the speedup")
+    parser.add_argument("--output", help="write JSON lines here instead of standard output")
+    args = parser.parse_args(argv)
+    if args.parallel is not None and (args.parallel < 1 or args.time is not None):
+        parser.error("--parallel takes a positive process count and cannot be combined with --time")
+    if args.speedup and args.parallel is None:
+        parser.error("--speedup needs --parallel")
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        started = time.perf_counter()
+        count = analyze_stream(source, output, args.depth, args.time, args.board, args.workers,
+                               parallel=args.parallel, measure_speedup=args.speedup)
+        print(f"Analyzed {count} positions in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Headless Benchmark Suite
+
+This module measures engine speed without the GUI: perft counts (the number of
+positions reachable at each depth) from the starting position and a fixed set of
+midgame and endgame positions, and a fixed-depth search over the same set.
+Results are written as JSON so runs from different commits can be compared:
+
+    python -m src.tools.benchmark --output results.json
+    python -m src.tools.benchmark --compare results.json
+
+A comparison fails (exit status 1) when perft counts or search results change,
+or when nodes/sec drops by more than the tolerance.
+"""
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from ..ai.minimax import SearchToolBox
+from ..game.bitboard import BitboardGameBoard
+from ..game.board import GameBoard
+from ..game.notation import START_POSITION, board_from_string
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+# Fixed benchmark positions in compact notation (see src/game/notation.py)
+POSITIONS = {
+    "start": START_POSITION,
+    "opening": "cccc-ccccc---bccb-b-b-bb--bbbbbb b",
+    "early-midgame": "cc---cccccccc-bccbbbb-bbbb--bbb- b",
+    "midgame": "-c-c--ccccbccc--b-bcb-bbbbb-b-b- b",
+    "late-midgame": "c--cc-cccc-cbbb----b--cb-b-bbb-c b",
+    "tactical": "-cbcc--cc--cb--ccbbbb-b-bcc--b-b b",
+    "endgame": "c-cb---b-cc-cc--bb-bb-b-cbc-b--- b",
+    "late-endgame": "--b-c---b-ccbcc--bb-b---b-cb---- b",
+}
+
+BOARD_CLASSES = {"bitboard": BitboardGameBoard, "matrix": GameBoard}
+ALGORITHMS = ("in-place", "copy", "pvs")
+COMPARED_SETTINGS = ("board", "algorithm")  # Runs with different settings are not comparable
+
+
+def perft(board_obj, depth: int, maximizing_player: bool) -> int:
+    """
+    Count the positions reachable in exactly ``depth`` moves.
+
+    Args:
+        board_obj: Position to count from (restored before returning)
+        depth: Number of moves to play
+        maximizing_player: True when it is the AI's turn
+
+    Returns:
+        Number of leaf positions
+    """
+    if depth == 0:
+        return 1
+    moves = board_obj.generate_moves(maximizing_player)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        token = board_obj.make_move(move)
+        nodes += perft(board_obj, depth - 1, not maximizing_player)
+        board_obj.unmake_move(token)
+    return nodes
+
+
+def _rate(count: int, seconds: float) -> float:
+    """Count per second, guarding against a zero timer reading."""
+    return count / seconds if seconds > 0 else 0.0
+
+
+def run_perft(positions: Dict[str, str], max_depth: int, board_class) -> List[dict]:
+    """
+    Run perft to every depth up to ``max_depth`` on each position.
+
+    Args:
+        positions: Name -> position string
+        max_depth: Deepest perft depth
+        board_class: Board backend to use
+
+    Returns:
+        One result dict per position and depth
+    """
+    results = []
+    for name, position in positions.items():
+        board = board_from_string(position, board_class)
+        for depth in range(1, max_depth + 1):
+            started = time.perf_counter()
+            nodes = perft(board, depth, not board.PlayerTurn)
+            seconds = time.perf_counter() - started
+            results.append({'position': name, 'depth': depth, 'nodes': nodes, 'seconds': seconds,
+                            'nodes_per_second': _rate(nodes, seconds)})
+    return results
+
+
+def run_search(positions: Dict[str, str], max_depth: int, board_class, algorithm: str = "in-place",
+               trace_memory: bool = False) -> List[dict]:
+    """
+    Run a fixed-depth alpha-beta search to every depth up to ``max_depth`` on each position.
+
+    Args:
+        positions: Name -> position string
+        max_depth: Deepest search depth
+        board_class: Board backend to use
+        algorithm: "in-place" (``minimax_in_place``), "copy" (``minimax``) or "pvs"
+            (``minimax_in_place`` with Principal Variation Search; each row also gets the
+            plain alpha-beta node count and the resulting 'node_reduction')
+        trace_memory: Record the peak traced allocation of each search (slows the search)
+
+    Returns:
+        One result dict per position and depth
+    """
+    search = SearchToolBox.minimax if algorithm == "copy" else SearchToolBox.minimax_in_place
+    options = {'pvs': True} if algorithm == "pvs" else {}
+    results = []
+    for name, position in positions.items():
+        board = board_from_string(position, board_class)
+        for depth in range(1, max_depth + 1):
+            stats = {'nodes_expanded': 0, 'prunes': 0}
+            if trace_memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            best_move, score = search(board, depth, -math.inf, math.inf, not board.PlayerTurn, stats, **options)
+            seconds = time.perf_counter() - started
+            result = {'position': name, 'depth': depth, 'nodes_expanded': stats['nodes_expanded'],
+                      'prunes': stats['prunes'], 'best_move': list(best_move) if best_move else None,
+                      'score': score if abs(score) != math.inf else None, 'seconds': seconds,
+                      'nodes_per_second': _rate(stats['nodes_expanded'], seconds)}
+            if trace_memory:
+                result['peak_traced_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+                tracemalloc.stop()
+            if algorithm == "pvs":
+                reference = {'nodes_expanded': 0, 'prunes': 0}
+                SearchToolBox.minimax_in_place(board, depth, -math.inf, math.inf, not board.PlayerTurn, reference)
+                result['pvs_researches'] = stats.get('pvs_researches', 0)
+                result['reference_nodes'] = reference['nodes_expanded']
+                result['node_reduction'] = 1 - stats['nodes_expanded'] / reference['nodes_expanded'] \
+                    if reference['nodes_expanded'] else 0.0
+            results.append(result)
+    return results
+
+
+def peak_memory_kb() -> Optional[float]:
+    """Peak resident memory of this process in KiB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == "darwin" else float(peak)  # macOS reports bytes
+
+
+def _git_commit() -> Optional[str]:
+    """Current git commit, if the benchmark runs inside a checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _totals(rows: List[dict], count_key: str) -> dict:
+    """Summed counts and overall rate of a result list."""
+    count = sum(row[count_key] for row in rows)
+    seconds = sum(row['seconds'] for row in rows)
+    totals = {count_key: count, 'seconds': seconds, 'nodes_per_second': _rate(count, seconds)}
+    if rows and 'prunes' in rows[0]:
+        totals['prunes'] = sum(row['prunes'] for row in rows)
+    return totals
+
+
+def run_benchmark(board_name: str = "bitboard", perft_depth: int = 6, search_depth: int = 7,
+                  algorithm: str = "in-place", trace_memory: bool = False) -> dict:
+    """
+    Run the perft and search benchmarks over the fixed position set.
+
+    Args:
+        board_name: "bitboard" or "matrix"
+        perft_depth: Deepest perft depth (0 skips perft)
+        search_depth: Deepest search depth (0 skips the search benchmark)
+        algorithm: Search variant, see ``run_search``
+        trace_memory: Record per-search peak allocations
+
+    Returns:
+        JSON-serializable results
+    """
+    board_class = BOARD_CLASSES[board_name]
+    perft_results = run_perft(POSITIONS, perft_depth, board_class)
+    search_results = run_search(POSITIONS, search_depth, board_class, algorithm, trace_memory)
+    return {
+        'meta': {'commit': _git_commit(), 'python': platform.python_version(), 'platform': platform.platform(),
+                 'board': board_name, 'algorithm': algorithm, 'perft_depth': perft_depth,
+                 'search_depth': search_depth, 'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S")},
+        'perft': perft_results,
+        'search': search_results,
+        'totals': {'perft': _totals(perft_results, 'nodes'), 'search': _totals(search_results, 'nodes_expanded')},
+        'peak_memory_kb': peak_memory_kb(),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2) -> List[str]:
+    """
+    List regressions of ``results`` against an earlier run.
+
+    Perft counts and search results (nodes, prunes, best move and score) must be
+    identical wherever both runs cover the same position and depth, and nodes/sec
+    over those shared runs may not drop by more than ``tolerance``. Both runs
+    must use the same board backend and search algorithm.
+
+    Args:
+        results: Current benchmark results
+        baseline: Earlier results loaded from JSON
+        tolerance: Allowed fractional slowdown
+
+    Returns:
+        Human-readable descriptions of each regression (empty if none)
+
+    Raises:
+        ValueError: If the runs used a different board or algorithm
+    """
+    earlier_meta = baseline.get('meta', {})
+    for setting in COMPARED_SETTINGS:
+        if setting in earlier_meta and earlier_meta[setting] != results['meta'][setting]:
+            raise ValueError(f"baseline {setting} is {earlier_meta[setting]!r}, "
+                             f"this run used {results['meta'][setting]!r}")
+    problems = []
+    for section, fields, count_key in (('perft', ('nodes',), 'nodes'),
+                                       ('search', ('nodes_expanded', 'prunes', 'best_move', 'score'),
+                                        'nodes_expanded')):
+        earlier = {(row['position'], row['depth']): row for row in baseline.get(section, [])}
+        shared, shared_old = [], []
+        for row in results[section]:
+            old = earlier.get((row['position'], row['depth']))
+            if old is None:
+                continue
+            shared.append(row)
+            shared_old.append(old)
+            for field in fields:
+                if old.get(field) != row[field]:
+                    problems.append(f"{section} {row['position']} depth {row['depth']}: "
+                                    f"{field} {old.get(field)} -> {row[field]}")
+        # Speed is compared over the rows both runs share, so depth settings may differ
+        old_rate = _totals(shared_old, count_key)['nodes_per_second']
+        new_rate = _totals(shared, count_key)['nodes_per_second']
+        if old_rate and new_rate < old_rate * (1 - tolerance):
+            problems.append(f"{section} nodes/sec {old_rate:,.0f} -> {new_rate:,.0f} "
+                            f"({new_rate / old_rate - 1:+.0%})")
+    return problems
+
+
+def print_report(results: dict) -> None:
+    """Print a per-depth summary table of the results."""
+    meta = results['meta']
+    print(f"Board: {meta['board']}  Search: {meta['algorithm']}  Commit: {meta['commit']}")
+    for section, count_key in (('perft', 'nodes'), ('search', 'nodes_expanded')):
+        by_depth: Dict[int, List[dict]] = {}
+        for row in results[section]:
+            by_depth.setdefault(row['depth'], []).append(row)
+        if not by_depth:
+            continue
+        print(f"\n{section:>6} depth {'nodes':>12} {'prunes':>10} {'seconds':>9} {'nodes/sec':>12}")
+        for depth, rows in sorted(by_depth.items()):
+            totals = _totals(rows, count_key)
+            prunes = totals.get('prunes', '-')
+            print(f"{'':>6} {depth:>5} {totals[count_key]:>12,} {prunes:>10} "
+                  f"{totals['seconds']:>9.3f} {totals['nodes_per_second']:>12,.0f}")
+    if results['peak_memory_kb'] is not None:
+        print(f"\nPeak memory: {results['peak_memory_kb'] / 1024:.1f} MiB")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Headless perft and search benchmark for the Checkers AI.")
+    parser.add_argument("--board", choices=sorted(BOARD_CLASSES), default="bitboard", help="board backend")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="in-place", help="minimax variant")
+    parser.add_argument("--perft-depth", type=int, default=6, help="deepest perft depth (0 to skip)")
+    parser.add_argument("--search-depth", type=int, default=7, help="deepest search depth (0 to skip)")
+    parser.add_argument("--trace-memory", action="store_true", help="record peak allocations per search")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed fractional nodes/sec drop")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.board, args.perft_depth, args.search_depth, args.algorithm, args.trace_memory)
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        try:
+            problems = compare(results, baseline, args.tolerance)
+        except ValueError as error:
+            print(f"Cannot compare with {args.compare}: {error}", file=sys.stderr)
+            return 1
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        if problems:
+            return 1
+        print("\nNo regressions against", args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Opening Book Builder
+
+Runs deep searches of the AI's replies over the first few turns and writes the
+book the game consults before searching:
+
+    python -m src.tools.build_book --moves 3 --depth 10
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+from ..ai.book import DEFAULT_PATH, build_opening_book
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Build the checkers opening book.")
+    parser.add_argument("--moves", type=int, default=3, help="number of AI moves covered")
+    parser.add_argument("--depth", type=int, default=10, help="search depth for every book position")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="book file to write")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count = build_opening_book(args.output, args.moves, args.depth,
+                               progress=lambda done, turn: print(f"\rTurn {turn}: {done} positions", end=""))
+    print(f"\nWrote {count} positions to {args.output} ({os.path.getsize(args.output):,} bytes) "
+          f"in {time.perf_counter() - started:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
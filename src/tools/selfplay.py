@@ -0,0 +1,132 @@
+"""
+Self-Play Data Generator
+
+Plays the engine against itself without a GUI and appends the games to a game
+record file (see src/game/records.py), the training data of the evaluation tuner:
+
+    python -m src.tools.selfplay games.ckgr --games 20000 --depth 4 --workers 4
+
+Both sides search to a fixed depth. The first few plies of every game are played
+at random, and later moves occasionally too, so the games cover many different
+positions instead of repeating the engine's favorite line.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from ..ai.iterative import iterative_deepening
+from ..ai.minimax import Move
+from ..ai.ordering import MoveOrderer
+from ..ai.transposition import TranspositionTable
+from ..game.bitboard import BitboardGameBoard
+from ..game.records import UNFINISHED, GameRecordWriter, game_result
+
+MAX_PLIES = 300  # Games still running after this many plies are recorded as unfinished
+
+
+def play_game(seed: int, depth: int = 4, random_plies: int = 6,
+              random_move_rate: float = 0.05) -> Tuple[List[Move], int]:
+    """
+    Play one game of the engine against itself from the starting position.
+
+    Args:
+        seed: Seed of the random moves, so every game can be reproduced
+        depth: Search depth of both sides
+        random_plies: Number of opening plies played at random
+        random_move_rate: Chance of a random move after the opening
+
+    Returns:
+        Tuple of (moves played, result)
+    """
+    rng = random.Random(seed)
+    board = BitboardGameBoard()
+    table = TranspositionTable(4)
+    ordering = MoveOrderer()
+    moves = []
+    while len(moves) < MAX_PLIES and game_result(board) == UNFINISHED:
+        maximizing_player = not board.PlayerTurn
+        legal = board.generate_moves(maximizing_player)
+        if len(moves) < random_plies or rng.random() < random_move_rate:
+            move = rng.choice(legal)
+        else:
+            move, _ = iterative_deepening(board, maximizing_player, {'nodes_expanded': 0, 'prunes': 0},
+                                          max_depth=depth, table=table, ordering=ordering)
+        board.make_move(move)
+        moves.append(move)
+    return moves, game_result(board)
+
+
+def _play_batch(seeds: List[int], depth: int, random_plies: int,
+                random_move_rate: float) -> List[Tuple[List[Move], int]]:
+    """Play a batch of games in a worker process (batches keep pickling overhead low)."""
+    return [play_game(seed, depth, random_plies, random_move_rate) for seed in seeds]
+
+
+def generate_games(games: int, depth: int = 4, random_plies: int = 6, random_move_rate: float = 0.05,
+                   seed: int = 0, workers: Optional[int] = None,
+                   batch_size: int = 16) -> Iterator[Tuple[List[Move], int]]:
+    """
+    Play self-play games, on a process pool unless ``workers`` is 0.
+
+    Args:
+        games: Number of games
+        depth: Search depth of both sides
+        random_plies: Number of opening plies played at random
+        random_move_rate: Chance of a random move after the opening
+        seed: Seed of the first game; game i uses seed + i
+        workers: Worker processes (None: CPU count, 0: play in this process)
+        batch_size: Games handed to a worker at a time
+
+    Yields:
+        (moves, result) of every game, in seed order
+    """
+    batches = [list(range(start, min(start + batch_size, seed + games)))
+               for start in range(seed, seed + games, batch_size)]
+    if workers == 0:
+        for batch in batches:
+            yield from _play_batch(batch, depth, random_plies, random_move_rate)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for played in executor.map(_play_batch, batches, [depth] * len(batches), [random_plies] * len(batches),
+                                   [random_move_rate] * len(batches)):
+            yield from played
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Play the engine against itself and record the games.")
+    parser.add_argument("output", help="game record file to append to")
+    parser.add_argument("--games", type=int, default=1000, help="number of games")
+    parser.add_argument("--depth", type=int, default=4, help="search depth of both sides")
+    parser.add_argument("--random-plies", type=int, default=6, help="opening plies played at random")
+    parser.add_argument("--random-rate", type=float, default=0.05, help="chance of a random move later on")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count, 0: no pool)")
+    args = parser.parse_args(argv)
+
+    writer = GameRecordWriter(args.output)
+    started = time.perf_counter()
+    positions = 0
+    try:
+        for count, (moves, result) in enumerate(generate_games(args.games, args.depth, args.random_plies,
+                                                               args.random_rate, args.seed, args.workers), 1):
+            game_id = writer.start_game(BitboardGameBoard())
+            for move in moves:
+                writer.record_move(game_id, move)
+            writer.end_game(game_id, result)
+            positions += len(moves) + 1
+            print(f"\r{count} games, {positions} positions", end="", file=sys.stderr)
+    finally:
+        writer.close()
+    print(f"\nWrote {args.games} games to {args.output} ({os.path.getsize(args.output):,} bytes) "
+          f"in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Evaluation Weight Tuner
+
+Fits the per-square evaluation weights to the outcomes of recorded games (see
+src/ai/tuning.py) and writes the weight file the evaluator loads at startup:
+
+    python -m src.tools.selfplay games.ckgr --games 20000
+    python -m src.tools.tune games.ckgr --output tuned_weights.json
+
+The output file is always named explicitly, so a run never replaces the weights
+the game loads by default (``evaluation_weights.json``) by accident; copy the
+file there, or pass it with ``main.py --weights``, once it has been checked.
+Requires NumPy.
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from ..ai.tuning import (current_weights, evaluate_features, fit_k, integer_weights, load_positions, signed_vector,
+                         texel_loss, tune_weights)
+from ..game.evaluation import write_weights
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Tune the evaluation weights on recorded games.")
+    parser.add_argument("records", nargs="+", help="game record files")
+    parser.add_argument("--output", required=True, help="weight file to write")
+    parser.add_argument("--iterations", type=int, default=300, help="optimizer steps over all positions")
+    parser.add_argument("--learning-rate", type=float, default=0.5, help="step size, in evaluation points")
+    parser.add_argument("--scale", type=float, help="multiplier applied before rounding the weights "
+                                                     "(default: the largest that fits the score range)")
+    parser.add_argument("--all-positions", action="store_true", help="keep positions with a capture pending")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    features, results, validation = load_positions(args.records, quiet_only=not args.all_positions)
+    train = ~validation
+    if not train.any():
+        print("No finished games with usable positions", file=sys.stderr)
+        return 1
+    print(f"Loaded {len(results):,} positions ({int(validation.sum()):,} for validation) "
+          f"in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+    initial = current_weights()
+    k = fit_k(evaluate_features(features[train], initial), results[train])
+    fitting = time.perf_counter()
+    weights = tune_weights(features[train], results[train], k, initial, args.iterations, args.learning_rate,
+                           progress=lambda step, loss: print(f"\rStep {step}: loss {loss:.5f}", end="",
+                                                             file=sys.stderr, flush=True))
+    print(f"\nFitted in {time.perf_counter() - fitting:.1f} s", file=sys.stderr)
+
+    player_weights, computer_weights, scale = integer_weights(weights, args.scale)
+    rounded = signed_vector(player_weights, computer_weights)
+    losses = {}
+    for name, rows in (("train", train), ("validation", validation)):
+        if rows.any():
+            before = texel_loss(evaluate_features(features[rows], initial), results[rows], k)
+            after = texel_loss(evaluate_features(features[rows], rounded), results[rows], k / scale)
+            losses[name] = [before, after]
+            print(f"{name:>10} loss {before:.5f} -> {after:.5f}", file=sys.stderr)
+
+    write_weights(args.output, player_weights, computer_weights, positions=int(len(results)), k=k / scale, scale=scale,
+                  loss=losses)
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+User interface components for the Checkers AI Game.
+"""
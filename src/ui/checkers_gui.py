@@ -0,0 +1,299 @@
+"""
+Checkers Tkinter User Interface
+
+This module contains the Tkinter front end for the Checkers AI Game: board drawing,
+click handling and the AI's turn.
+"""
+
+import os
+import time
+import tkinter as tk
+from typing import Optional
+
+from ..ai import book, tablebase
+from ..ai.background import BackgroundSearch
+from ..ai.instrumentation import SearchLog
+from ..game.bitboard import BitboardGameBoard
+from ..game.records import UNFINISHED, GameRecordWriter, game_result
+
+
+POLL_INTERVAL_MS = 20  # How often the event loop checks for a finished search
+
+
+class PlayingTheGame:
+    """
+    Tkinter game window: draws the board, handles player clicks and runs the AI.
+
+    The AI searches with iterative deepening under a per-move time budget, so its
+    think time stays close to ``time_budget`` whatever the position. Searches run on
+    a background worker polled from the Tk event loop, so the window stays
+    responsive; while the player thinks, the AI can ponder the predicted reply.
+    """
+
+    def __init__(self, root: tk.Tk, board_class=BitboardGameBoard, time_budget: float = 1.0,
+                 max_depth: int = 32, ponder: bool = True, tablebase_path: Optional[str] = tablebase.DEFAULT_PATH,
+                 book_path: Optional[str] = book.DEFAULT_PATH, search_log: Optional[SearchLog] = None,
+                 profile: Optional[str] = None, algorithm: str = "pvs", record_path: Optional[str] = None,
+                 verbose: bool = False):
+        """
+        Initialize the game UI and board.
+
+        Args:
+            root: Tk root window
+            board_class: Board backend to play on
+            time_budget: Seconds the AI may think per move
+            max_depth: Deepest iteration the AI will search
+            ponder: Search the predicted player reply during the player's turn
+            tablebase_path: Endgame table to probe during the search, used if the file exists
+            book_path: Opening book checked before searching, used if the file exists
+            search_log: Log receiving a JSON record with the stats of every AI move
+            profile: "cprofile" or "sampling" to time each search's parts (see profile_search)
+            algorithm: "pvs" (Principal Variation Search with aspiration windows), "alphabeta"
+                or "mcts" (Monte Carlo Tree Search)
+            record_path: Game record file every game is appended to, move by move
+            verbose: Print clicks, moves and every AI move's stats to standard output
+                (use search_log for machine-readable stats)
+        """
+        self.root = root
+        self.board_class = board_class
+        self.time_budget = time_budget
+        self.ponder = ponder
+        endgames = tablebase.EndgameTablebase(tablebase_path) if tablebase_path and os.path.exists(tablebase_path) else None
+        # Keeps its table and history between moves
+        self.worker = BackgroundSearch(max_depth, tablebase=endgames, profile=profile,
+                                       algorithm=algorithm)
+        self.book = book.OpeningBook(book_path) if book_path and os.path.exists(book_path) else None
+        self.search_log = search_log
+        self.verbose = verbose
+        self.search_job = None  # Search whose move the AI is waiting for
+        self.ponder_job = None  # Search of the predicted reply, while the player thinks
+        self.Board = board_class()
+        self.play_tour = []  # Track the sequence of moves
+        self.records = GameRecordWriter(record_path) if record_path else None
+        self.record_id = self.records.start_game(self.Board) if self.records is not None else None
+        self.stats = {'nodes_expanded': 0, 'prunes': 0, 'time_spent': 0, 'pruning_gains': 0}  # Track AI performance
+        self.setup_ui(root)
+
+    def setup_ui(self, root: tk.Tk) -> None:
+        """Set up the game UI (canvas, scoreboard, buttons, etc.)."""
+        self.canvas = tk.Canvas(root, width=400, height=400)
+        self.canvas.pack()
+        self.canvas.bind("<Button-1>", self.handle_click)  # Bind mouse clicks to handle_click method
+        self.scoreboard = tk.Label(root, text="Player: 0  AI: 0", font=("Arial", 16))
+        self.scoreboard.pack()
+        self.status_message = tk.Label(root, text="Your Turn", font=("Arial", 16))
+        self.status_message.pack()
+        self.restart_button = tk.Button(root, text="Restart", command=self.restart_game)
+        self.restart_button.pack()
+        self.create_board_items()
+        self.draw_board()  # Draw the initial board
+
+    def create_board_items(self) -> None:
+        """
+        Create every canvas item once: squares, then a hidden piece, king label and
+        highlight per square (in that order, so highlights stay on top).
+        """
+        for i in range(8):
+            for j in range(8):
+                color = "#D2B48C" if (i + j) % 2 == 0 else "#8B4513"  # Alternate square colors
+                self.canvas.create_rectangle(j*50, i*50, (j+1)*50, (i+1)*50, fill=color, outline="black")
+        self.piece_items = [[self.canvas.create_oval(j*50+10, i*50+10, (j+1)*50-10, (i+1)*50-10,
+                                                     outline="black", state="hidden")
+                             for j in range(8)] for i in range(8)]
+        self.king_items = [[self.canvas.create_text(j*50+25, i*50+25, text="K", font=("Arial", 20), fill="gold",
+                                                    state="hidden")
+                            for j in range(8)] for i in range(8)]
+        self.highlight_items = [[self.canvas.create_rectangle(j*50, i*50, (j+1)*50, (i+1)*50, outline="yellow",
+                                                              width=3, state="hidden")
+                                 for j in range(8)] for i in range(8)]
+        self.drawn_state = [["---"] * 8 for _ in range(8)]  # What the canvas currently shows
+        self.highlighted = []  # Squares whose highlight is shown
+
+    def draw_board(self) -> None:
+        """Bring the canvas up to date with the board, touching only squares that changed."""
+        self.clear_highlights()
+        state = self.Board.get_board_state()
+        for i in range(8):
+            for j in range(8):
+                piece = state[i][j]
+                if piece == self.drawn_state[i][j]:
+                    continue
+                self.drawn_state[i][j] = piece
+                if piece == "---":
+                    self.canvas.itemconfigure(self.piece_items[i][j], state="hidden")
+                else:
+                    piece_color = "red" if piece.startswith("B") else "blue"  # Player pieces are red, AI pieces are blue
+                    self.canvas.itemconfigure(self.piece_items[i][j], fill=piece_color, state="normal")
+                is_king = piece in ("BK", "CK")  # Kings have a "K" label
+                self.canvas.itemconfigure(self.king_items[i][j], state="normal" if is_king else "hidden")
+
+    def handle_click(self, event) -> None:
+        """Handle player clicks on the board."""
+        column, row = event.x // 50, event.y // 50  # Convert pixel coordinates to board coordinates
+        if not (0 <= row < 8 and 0 <= column < 8) or self.search_job is not None or self.game_over():
+            return  # Ignore clicks off the board, while the AI thinks, or after the game ended
+        if self.verbose:
+            print(f"Click registered at: ({row}, {column})")
+        if self.Board.SelectedPiece is None:
+            # If no piece is selected, select the clicked piece (if it's the player's piece)
+            if self.Board.Matrix[row][column] == "B":
+                self.Board.SelectedPiece = (row, column)
+                self.highlight_valid_moves(row, column)  # Highlight valid moves for the selected piece
+        else:
+            # If a piece is already selected, attempt to move it to the clicked position
+            old_row, old_column = self.Board.SelectedPiece
+            if self.verbose:
+                print(f"Attempting move from ({old_row}, {old_column}) to ({row}, {column})")
+            if self.Board.move_piece(old_row, old_column, row, column):  # Execute the move
+                self.record_move((old_row, old_column, row, column))
+            self.Board.SelectedPiece = None
+            self.draw_board()  # Redraw the board
+            self.update_scoreboard()  # Update the scoreboard
+            if self.game_over():
+                self.cancel_search()
+                self.log_game_over()
+                return
+            if not self.Board.PlayerTurn:
+                # If it's the AI's turn, let the AI make a move
+                self.status_message.config(text="AI's Turn")
+                self.computer_move((old_row, old_column, row, column))
+            else:
+                self.status_message.config(text="Your Turn")
+
+    def highlight_valid_moves(self, row: int, column: int) -> None:
+        """Highlight valid moves for the selected piece."""
+        self.clear_highlights()
+        for old_x, old_y, new_x, new_y in self.Board.generate_moves(False):
+            if (old_x, old_y) == (row, column):
+                self.canvas.itemconfigure(self.highlight_items[new_x][new_y], state="normal")
+                self.highlighted.append((new_x, new_y))
+
+    def clear_highlights(self) -> None:
+        """Hide the move highlights."""
+        for i, j in self.highlighted:
+            self.canvas.itemconfigure(self.highlight_items[i][j], state="hidden")
+        self.highlighted = []
+
+    def computer_move(self, player_move=None) -> None:
+        """
+        Play the book move if the position is in the opening book; otherwise start
+        the AI's search on the background worker and poll for its move.
+
+        Args:
+            player_move: The player's last move; if it matches the ponder prediction,
+                the ponder search becomes the real search instead of starting over
+        """
+        job, self.ponder_job = self.ponder_job, None
+        if self.book is not None:
+            started = time.perf_counter()
+            book_move = self.book.lookup(self.Board, self.stats)
+            if book_move is not None:
+                if job is not None:
+                    job.cancel()
+                self.stats['time_spent'] = time.perf_counter() - started
+                self.stats['principal_variation'] = []  # Nothing to ponder on
+                self.play_computer_move(book_move)
+                return
+        if job is not None and job.ponder_move == player_move:
+            # Ponder hit: time spent pondering counts toward the budget
+            job.requested_at = time.perf_counter()
+            job.limits.set_time_budget(self.time_budget)
+        else:
+            if job is not None:
+                job.cancel()
+            job = self.worker.search(self.Board, dict(self.stats), self.time_budget)
+        self.search_job = job
+        self.root.after(POLL_INTERVAL_MS, self.poll_search)
+
+    def poll_search(self) -> None:
+        """Apply the AI's move once the background search has finished."""
+        job = self.search_job
+        if job is None:
+            return  # Cancelled by a restart
+        if not job.done.is_set():
+            self.root.after(POLL_INTERVAL_MS, self.poll_search)
+            return
+
+        self.search_job = None
+        self.stats = job.stats
+        self.stats['time_spent'] = time.perf_counter() - job.requested_at  # Track the time taken for the AI's move
+        self.play_computer_move(job.best_move)
+
+    def play_computer_move(self, best_move) -> None:
+        """Apply the AI's chosen move, then hand the turn back to the player."""
+        if best_move:
+            old_x, old_y, new_x, new_y = best_move
+            self.Board.move_piece(old_x, old_y, new_x, new_y)  # Execute the AI's move
+            self.record_move(best_move)
+            self.draw_board()  # Redraw the board
+            self.update_scoreboard()  # Update the scoreboard
+            if self.verbose:
+                print(f"AI's Move: from ({old_x}, {old_y}) to ({new_x}, {new_y})")
+                print("Current AI Performance Metrics:", self.stats)
+            if self.search_log is not None:
+                self.search_log.record("ai_move", self.stats, move=list(best_move))
+            if not self.game_over():
+                self.status_message.config(text="Your Turn")  # Switch back to the player's turn
+                self.start_pondering()
+            else:
+                self.log_game_over()
+
+    def record_move(self, move) -> None:
+        """Add a played move to the move list and the game record."""
+        self.play_tour.append(tuple(move))
+        if self.record_id is not None:
+            self.records.record_move(self.record_id, move)
+
+    def end_record(self, result: int) -> None:
+        """Close the current game in the game record, if there is one."""
+        if self.record_id is not None:
+            self.records.end_game(self.record_id, result)
+            self.record_id = None
+
+    def log_game_over(self) -> None:
+        """Record the final score in the search log and the result in the game record."""
+        self.end_record(game_result(self.Board))
+        if self.search_log is not None:
+            self.search_log.record("game_over", player_points=self.Board.PlayerPoints,
+                                   computer_points=self.Board.ComputerPoints, player_moves=(len(self.play_tour) + 1) // 2)
+
+    def start_pondering(self) -> None:
+        """Search the position after the player's predicted reply while they think."""
+        pv = self.stats.get('principal_variation', [])
+        if self.ponder and len(pv) >= 2:
+            self.ponder_job = self.worker.ponder(self.Board, pv[1], dict(self.stats))
+
+    def cancel_search(self) -> None:
+        """Stop any running or queued AI search and ignore its result."""
+        for job in (self.search_job, self.ponder_job):
+            if job is not None:
+                job.cancel()
+        self.search_job = self.ponder_job = None
+
+    def game_over(self) -> bool:
+        """Show the result and return True once one side has no pieces left."""
+        if self.Board.PlayerPieces == 0:
+            self.status_message.config(text="Game Over! The AI wins.")
+            return True
+        if self.Board.ComputerPieces == 0:
+            self.status_message.config(text="Game Over! You win.")
+            return True
+        return False
+
+    def update_scoreboard(self) -> None:
+        """Update the scoreboard with the current scores."""
+        self.scoreboard.config(text=f"Player: {self.Board.PlayerPoints}  AI: {self.Board.ComputerPoints}")
+
+    def restart_game(self) -> None:
+        """Restart the game by resetting the board and stats."""
+        self.cancel_search()
+        self.end_record(UNFINISHED)  # No-op if the game already ended
+        self.Board = self.board_class()
+        self.worker.table.clear()
+        self.play_tour = []
+        if self.records is not None:
+            self.record_id = self.records.start_game(self.Board)
+        self.stats = {'nodes_expanded': 0, 'prunes': 0, 'time_spent': 0, 'pruning_gains': 0}
+        self.draw_board()
+        self.update_scoreboard()
+        self.status_message.config(text="Your Turn")
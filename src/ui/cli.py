@@ -0,0 +1,95 @@
+"""
+Checkers Command-Line Interface
+
+This module plays a game in the terminal: the board is printed as text, the player
+types moves as four numbers ("5 0 4 1" moves the piece on row 5, column 0 to row 4,
+column 1) and the AI answers with the engine. It never imports tkinter.
+"""
+
+import sys
+from typing import Optional, TextIO
+
+from ..ai.minimax import Move
+from ..engine import PLAYER_WIN, UNFINISHED, Engine, game_result
+from ..game.bitboard import BitboardGameBoard
+from ..game.notation import board_to_string
+
+
+HELP = "Enter a move as 'row column row column' (e.g. 5 0 4 1), 'moves' to list legal moves or 'quit'."
+
+
+def parse_move(text: str) -> Optional[Move]:
+    """
+    Read a move typed as four numbers, separated by spaces, commas or dashes.
+
+    Args:
+        text: The typed line
+
+    Returns:
+        (old_x, old_y, new_x, new_y), or None if the line is not four numbers
+    """
+    parts = text.replace(",", " ").replace("-", " ").split()
+    if len(parts) != 4 or not all(part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
+
+
+def play_cli(engine: Engine, board_class=BitboardGameBoard, input_stream: TextIO = sys.stdin,
+             output: TextIO = sys.stdout) -> int:
+    """
+    Play one game in the terminal.
+
+    Args:
+        engine: Engine choosing the AI's moves
+        board_class: Board backend to play on
+        input_stream: Where the player's moves are read from
+        output: Where the board and messages are written
+
+    Returns:
+        PLAYER_WIN, COMPUTER_WIN, or UNFINISHED if the player quit or the input ended
+    """
+    board = board_class()
+    engine.new_game()
+    print(HELP, file=output)
+    shown = None  # Position last printed, so it is not repeated after a mistyped move
+    plies = 0
+    while True:
+        result = game_result(board)
+        if result != UNFINISHED:
+            print(board, file=output)
+            print("You win!" if result == PLAYER_WIN else "The AI wins.", file=output)
+            if engine.search_log is not None:
+                engine.search_log.record("game_over", player_points=board.PlayerPoints,
+                                         computer_points=board.ComputerPoints, player_moves=(plies + 1) // 2)
+            return result
+
+        if not board.PlayerTurn:
+            stats = {}
+            move = engine.choose_move(board, stats)
+            board.make_move(move)
+            plies += 1
+            searched = f"{stats['playouts']} playouts" if 'playouts' in stats else f"{stats['nodes_expanded']} nodes"
+            print(f"AI plays {' '.join(map(str, move))} ({stats.get('depth_reached', 0)} plies, "
+                  f"{searched}, {stats['time_spent']:.2f}s)", file=output)
+            continue
+
+        if shown != board_to_string(board):
+            shown = board_to_string(board)
+            print(board, file=output)
+            print(f"{shown}  Player: {board.PlayerPoints}  AI: {board.ComputerPoints}", file=output)
+        print("Your move: ", end="", file=output, flush=True)
+        line = input_stream.readline()
+        if not line or line.strip().lower() in ("quit", "exit", "q"):
+            return UNFINISHED
+        legal = board.generate_moves(False)
+        if line.strip().lower() == "moves":
+            print(" | ".join(" ".join(map(str, move)) for move in legal), file=output)
+            continue
+        move = parse_move(line)
+        if move is None:
+            print(HELP, file=output)
+        elif move not in legal:
+            print("Illegal move.", file=output)
+        else:
+            board.make_move(move)
+            plies += 1
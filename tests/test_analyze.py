@@ -0,0 +1,89 @@
+"""Tests for the streaming batch analysis command."""
+
+import io
+import json
+import math
+
+import pytest
+
+from src.ai.minimax import SearchToolBox
+from src.game.bitboard import BitboardGameBoard
+from src.game.notation import START_POSITION, board_from_string, board_to_string
+from src.tools import analyze
+from tests.test_search import new_stats, random_positions
+
+
+def positions(count):
+    return [board_to_string(board) for board in random_positions(BitboardGameBoard, count, seed=7)]
+
+
+def run(lines, **kwargs):
+    output = io.StringIO()
+    count = analyze.analyze_stream(lines, output, 3, **kwargs)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(results) == count
+    return results
+
+
+def test_results_match_a_direct_search():
+    lines = positions(6)
+    for line_number, result in enumerate(run(lines, workers=0), 1):
+        assert result['line'] == line_number and result['position'] == lines[line_number - 1]
+        board = board_from_string(result['position'], BitboardGameBoard)
+        stats = new_stats()
+        best_move, score = SearchToolBox.minimax_in_place(board, 3, -math.inf, math.inf, not board.PlayerTurn,
+                                                          stats)
+        assert result['best_move'] == (list(best_move) if best_move else None)
+        assert result['score'] == (score if abs(score) != math.inf else None)
+        assert result['nodes'] == stats['nodes_expanded'] and result['depth'] == 3
+
+
+def test_comments_blank_lines_and_errors():
+    results = run(["# header\n", "\n", START_POSITION + "\n", "not a position\n"], workers=0)
+    assert [result['line'] for result in results] == [3, 4]
+    assert results[0]['side'] == "b" and results[0]['best_move'] is not None
+    assert 'error' in results[1] and 'best_move' not in results[1]
+
+
+def test_pool_keeps_input_order():
+    lines = positions(10)
+    pooled = run(lines, workers=2, max_pending=3)
+    serial = run(lines, workers=0)
+    for result in pooled + serial:
+        del result['seconds']
+    assert pooled == serial
+
+
+@pytest.mark.parametrize("board_name", ["bitboard", "matrix"])
+def test_time_budget_searches_iteratively(board_name):
+    result = run([START_POSITION], time_budget=5.0, board_name=board_name, workers=0)[0]
+    assert result['depth'] == 3 and result['best_move'] is not None
+
+
+def test_main_writes_the_output_file(tmp_path):
+    source = tmp_path / "positions.txt"
+    source.write_text("\n".join(positions(3)) + "\n")
+    target = tmp_path / "analysis.jsonl"
+    assert analyze.main([str(source), "--depth", "2", "--workers", "0", "--output", str(target)]) == 0
+    assert [json.loads(line)['line'] for line in target.read_text().splitlines()] == [1, 2, 3]
+
+
+def test_parallel_search_matches_the_serial_analysis():
+    lines = positions(4)
+    parallel = run(lines, parallel=2)
+    serial = run(lines, workers=0)
+    for result in parallel:
+        assert 0.0 < result.pop('worker_utilization') <= 1.0
+    for result in parallel + serial:
+        del result['seconds'], result['nodes']  # Split searches prune differently
+    assert parallel == serial
+    with pytest.raises(SystemExit):
+        analyze.main(["-", "--parallel", "2", "--time", "0.1"])
+    with pytest.raises(SystemExit):
+        analyze.main(["-", "--speedup"])
+
+
+def test_parallel_analysis_records_the_speedup():
+    for result in run(positions(2), parallel=2, measure_speedup=True):
+        assert result['speedup'] > 0.0
+    assert all('speedup' not in result for result in run(positions(2), parallel=2))
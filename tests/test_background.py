@@ -0,0 +1,61 @@
+"""Tests for the background search worker and pondering."""
+
+import pytest
+
+from src.ai.background import BackgroundSearch
+from src.game.bitboard import BitboardGameBoard
+
+
+def new_stats():
+    return {'nodes_expanded': 0, 'prunes': 0}
+
+
+@pytest.fixture
+def worker():
+    searcher = BackgroundSearch(max_depth=32)
+    yield searcher
+    searcher.shutdown()
+
+
+def position_with_ai_to_move():
+    board = BitboardGameBoard()
+    board.make_move((5, 0, 4, 1))
+    return board
+
+
+def test_search_runs_off_the_calling_thread(worker):
+    board = position_with_ai_to_move()
+    job = worker.search(board, new_stats(), time_budget=0.1)
+    assert job.done.wait(5)
+    assert job.best_move in board.generate_moves(True)
+    assert job.stats['depth_reached'] >= 1
+    assert board.get_board_state() == position_with_ai_to_move().get_board_state()
+
+
+def test_ponder_hit_becomes_the_real_search(worker):
+    board = BitboardGameBoard()
+    job = worker.ponder(board, (5, 0, 4, 1), new_stats())
+    assert job is not None and job.ponder_move == (5, 0, 4, 1)
+    assert not job.done.wait(0.2)  # Pondering has no deadline of its own
+    job.limits.set_time_budget(0.3)  # The prediction came true: time already spent counts
+    assert job.done.wait(5)
+    assert job.best_move in position_with_ai_to_move().generate_moves(True)
+
+
+def test_ponder_miss_is_cancelled_and_next_search_runs(worker):
+    assert worker.ponder(BitboardGameBoard(), (4, 1, 3, 0), new_stats()) is None  # Not a legal move
+    ponder = worker.ponder(BitboardGameBoard(), (5, 0, 4, 1), new_stats())
+    real = worker.search(position_with_ai_to_move(), new_stats(), time_budget=0.05)
+    ponder.cancel()
+    assert ponder.done.wait(5) and ponder.cancelled
+    assert real.done.wait(5)
+    assert real.best_move is not None
+
+
+def test_cancelled_job_is_skipped(worker):
+    blocker = worker.ponder(BitboardGameBoard(), (5, 0, 4, 1), new_stats())
+    queued = worker.search(position_with_ai_to_move(), new_stats(), time_budget=1.0)
+    queued.cancel()
+    blocker.cancel()
+    assert queued.done.wait(5)
+    assert queued.best_move is None
@@ -0,0 +1,100 @@
+"""Tests for the perft harness, the benchmark regression check and the position notation."""
+
+import copy
+import json
+
+import pytest
+
+from src.game.bitboard import BitboardGameBoard
+from src.game.board import GameBoard
+from src.game.notation import START_POSITION, board_from_string, board_to_string
+from src.tools import benchmark
+from src.tools.benchmark import POSITIONS, compare, perft, run_benchmark
+
+
+@pytest.mark.parametrize("name", sorted(POSITIONS))
+def test_perft_agrees_across_backends_and_restores_the_board(name):
+    matrix_board = board_from_string(POSITIONS[name], GameBoard)
+    bitboard = board_from_string(POSITIONS[name], BitboardGameBoard)
+    for depth in (1, 2, 3):
+        assert perft(matrix_board, depth, not matrix_board.PlayerTurn) == \
+            perft(bitboard, depth, not bitboard.PlayerTurn)
+    assert board_to_string(matrix_board) == board_to_string(bitboard) == POSITIONS[name]
+
+
+def test_perft_start_position():
+    board = board_from_string(START_POSITION, BitboardGameBoard)
+    assert [perft(board, depth, False) for depth in (1, 2)] == [7, 49]
+
+
+def test_notation_round_trip_and_errors():
+    for position in POSITIONS.values():
+        assert board_to_string(board_from_string(position)) == position
+    board = board_from_string(START_POSITION)
+    assert (board.PlayerPieces, board.ComputerPieces, board.PlayerPoints, board.ComputerPoints) == (12, 12, 0, 0)
+    for bad in ("", START_POSITION[:-1] + "x", "ccc b", START_POSITION.replace("c", "x", 1)):
+        with pytest.raises(ValueError):
+            board_from_string(bad)
+
+
+def test_notation_counts_kings_on_both_backends():
+    position = "C-c-------------------------bb-B c"
+    for board_class in (GameBoard, BitboardGameBoard):
+        board = board_from_string(position, board_class)
+        assert board.count_pieces() == (3, 2)
+        assert (board.PlayerPieces, board.ComputerPieces, board.PlayerPoints, board.ComputerPoints) == (3, 2, 10, 9)
+        assert board_to_string(board) == position
+
+
+@pytest.fixture(scope="module")
+def results():
+    return run_benchmark("bitboard", perft_depth=2, search_depth=2)
+
+
+def test_identical_results_have_no_regressions(results):
+    assert compare(results, copy.deepcopy(results)) == []
+
+
+def test_changed_counts_and_slowdowns_are_reported(results):
+    baseline = copy.deepcopy(results)
+    baseline['perft'][0]['nodes'] += 1
+    baseline['search'][1]['prunes'] += 1
+    problems = compare(results, baseline)
+    assert any(problem.startswith("perft start depth 1: nodes") for problem in problems)
+    assert any("prunes" in problem for problem in problems)
+
+    baseline = copy.deepcopy(results)
+    for row in baseline['search']:
+        row['seconds'] /= 10  # The earlier run was ten times faster
+    assert any("nodes/sec" in problem for problem in compare(results, baseline))
+    assert compare(results, baseline, tolerance=0.95) == []
+
+
+def test_rows_missing_from_the_baseline_are_ignored(results):
+    baseline = copy.deepcopy(results)
+    baseline['search'] = [row for row in baseline['search'] if row['depth'] == 1]
+    assert compare(results, baseline) == []
+
+
+@pytest.mark.parametrize("setting,value", [("board", "matrix"), ("algorithm", "copy")])
+def test_runs_with_other_settings_are_not_compared(results, setting, value):
+    baseline = copy.deepcopy(results)
+    baseline['meta'][setting] = value
+    with pytest.raises(ValueError, match=setting):
+        compare(results, baseline)
+
+
+def test_main_writes_json_and_compares(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    args = ["--perft-depth", "1", "--search-depth", "1"]
+    assert benchmark.main(args + ["--output", str(output)]) == 0
+    saved = json.loads(output.read_text())
+    assert saved['meta']['board'] == "bitboard" and len(saved['perft']) == len(POSITIONS)
+    assert benchmark.main(args + ["--compare", str(output), "--tolerance", "1"]) == 0
+    saved['search'][0]['nodes_expanded'] += 1
+    output.write_text(json.dumps(saved))
+    assert benchmark.main(args + ["--compare", str(output), "--tolerance", "1"]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert benchmark.main(args + ["--compare", str(output), "--algorithm", "copy"]) == 1
+    captured = capsys.readouterr()
+    assert "Cannot compare" in captured.err and "REGRESSION" not in captured.out
@@ -0,0 +1,223 @@
+"""Tests for the board backends: the matrix GameBoard and BitboardGameBoard must agree."""
+
+import random
+
+import pytest
+
+from src.game.bitboard import BitboardGameBoard
+from src.game.board import GameBoard
+from src.game.zobrist import hash_matrix
+
+DARK_SQUARES = [(x, y) for x in range(8) for y in range(8) if (x + y) % 2 == 1]
+
+
+def random_state(rng, kings=False):
+    """A random board matrix of men, with some kings if asked."""
+    state = [["---"] * 8 for _ in range(8)]
+    for x, y in DARK_SQUARES:
+        roll = rng.random()
+        if roll < 0.25:
+            state[x][y] = "BK" if kings and rng.random() < 0.25 else "B"
+        elif roll < 0.5:
+            state[x][y] = "CK" if kings and rng.random() < 0.25 else "C"
+    return state
+
+
+def assert_same_position(matrix_board, bitboard):
+    assert matrix_board.get_board_state() == bitboard.get_board_state()
+    assert matrix_board.evaluate_board() == bitboard.evaluate_board() == matrix_board.recompute_evaluation()
+    assert bitboard.evaluate_board() == bitboard.recompute_evaluation()
+    assert (matrix_board.PlayerPieces, matrix_board.ComputerPieces) == (bitboard.PlayerPieces, bitboard.ComputerPieces)
+    assert (matrix_board.PlayerPoints, matrix_board.ComputerPoints) == (bitboard.PlayerPoints, bitboard.ComputerPoints)
+    assert matrix_board.PlayerTurn == bitboard.PlayerTurn
+    assert matrix_board.zobrist_hash == bitboard.zobrist_hash == hash_matrix(matrix_board.get_board_state())
+    assert matrix_board.to_bytes() == bitboard.to_bytes()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_games_agree(seed):
+    rng = random.Random(seed)
+    matrix_board, bitboard = GameBoard(), BitboardGameBoard()
+    for _ in range(200):
+        assert_same_position(matrix_board, bitboard)
+        for side in (True, False):
+            matrix_children = matrix_board.get_valid_moves(side)
+            bitboard_children = bitboard.get_valid_moves(side)
+            assert [move for _, move in matrix_children] == [move for _, move in bitboard_children]
+            for (matrix_child, _), (bitboard_child, _) in zip(matrix_children, bitboard_children):
+                assert_same_position(matrix_child, bitboard_child)
+        moves = [move for _, move in matrix_board.get_valid_moves(not matrix_board.PlayerTurn)]
+        if not moves:
+            break
+        move = rng.choice(moves)
+        assert matrix_board.move_piece(*move) and bitboard.move_piece(*move)
+
+
+def test_random_positions_agree():
+    rng = random.Random(1)
+    for _ in range(300):
+        state = random_state(rng)
+        matrix_board, bitboard = GameBoard(), BitboardGameBoard()
+        matrix_board.set_board_state(state)
+        bitboard.set_board_state(state)
+        assert bitboard.count_pieces() == matrix_board.count_pieces()
+        assert bitboard.evaluate_board() == matrix_board.evaluate_board()
+        for side in (True, False):
+            assert ([move for _, move in matrix_board.get_valid_moves(side)] ==
+                    [move for _, move in bitboard.get_valid_moves(side)])
+        for x, y in DARK_SQUARES:
+            if state[x][y] != "---":
+                for dx in (-2, -1, 1, 2):
+                    for dy in (-2, -1, 1, 2):
+                        assert matrix_board.is_valid_move(x, y, x + dx, y + dy) == \
+                            bitboard.is_valid_move(x, y, x + dx, y + dy)
+
+
+def test_random_positions_with_kings_agree():
+    rng = random.Random(3)
+    for _ in range(300):
+        state = random_state(rng, kings=True)
+        matrix_board, bitboard = GameBoard(), BitboardGameBoard()
+        matrix_board.set_board_state(state)
+        bitboard.set_board_state(state)
+        assert matrix_board.count_pieces() == bitboard.count_pieces()
+        for side in (True, False):
+            moves = matrix_board.generate_moves(side)
+            assert moves == bitboard.generate_moves(side) == list(matrix_board.iter_moves(side))
+            for (matrix_child, move), (bitboard_child, _) in zip(matrix_board.iter_valid_moves(side),
+                                                                 bitboard.iter_valid_moves(side)):
+                assert matrix_child.get_board_state() == bitboard_child.get_board_state()
+                assert matrix_child.zobrist_hash == bitboard_child.zobrist_hash
+        for x, y in DARK_SQUARES:
+            if state[x][y] in ("BK", "CK"):
+                for dx in (-2, -1, 1, 2):
+                    for dy in (-2, -1, 1, 2):
+                        assert matrix_board.is_valid_move(x, y, x + dx, y + dy) == \
+                            bitboard.is_valid_move(x, y, x + dx, y + dy)
+
+
+def test_kings_move_and_capture_backwards():
+    state = [["---"] * 8 for _ in range(8)]
+    state[2][3], state[3][4], state[5][2] = "BK", "C", "CK"
+    for board_class in (GameBoard, BitboardGameBoard):
+        board = board_class()
+        board.set_board_state(state)
+        assert board.generate_moves(False)[0] == (2, 3, 4, 5)
+        assert board.is_valid_move(2, 3, 3, 2) and board.is_valid_move(5, 2, 4, 1)
+
+
+def test_children_do_not_change_the_parent():
+    bitboard = BitboardGameBoard()
+    before = bitboard.get_board_state()
+    children = bitboard.get_valid_moves(False)
+    assert len(children) == 7
+    assert bitboard.get_board_state() == before
+    assert all(child.get_board_state() != before for child, _ in children)
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_make_unmake_restores_position(board_class):
+    rng = random.Random(2)
+    board = board_class()
+    for _ in range(60):
+        moves = board.generate_moves(not board.PlayerTurn)
+        if not moves:
+            break
+        before = (board.get_board_state(), board.zobrist_hash, board.evaluate_board(), board.PlayerTurn,
+                  board.PlayerPieces, board.ComputerPieces, board.PlayerPoints, board.ComputerPoints)
+        for move in moves:
+            token = board.make_move(move)
+            assert board.zobrist_hash == hash_matrix(board.get_board_state())
+            board.unmake_move(token)
+            assert (board.get_board_state(), board.zobrist_hash, board.evaluate_board(), board.PlayerTurn,
+                    board.PlayerPieces, board.ComputerPieces, board.PlayerPoints, board.ComputerPoints) == before
+        board.make_move(rng.choice(moves))
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_make_move_matches_move_piece(board_class):
+    rng = random.Random(4)
+    board = board_class()
+    for _ in range(60):
+        moves = board.generate_moves(not board.PlayerTurn)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        moved = board.__copy__()
+        assert moved.move_piece(*move)
+        board.make_move(move)
+        assert board.get_board_state() == moved.get_board_state()
+        assert (board.PlayerTurn, board.PlayerPieces, board.ComputerPieces, board.PlayerPoints,
+                board.ComputerPoints) == (moved.PlayerTurn, moved.PlayerPieces, moved.ComputerPieces,
+                                          moved.PlayerPoints, moved.ComputerPoints)
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_move_piece_rejects_empty_square(board_class):
+    board = board_class()
+    assert not board.move_piece(4, 1, 3, 0)
+    assert board.move_piece(5, 0, 4, 1)
+    assert board.Matrix[4][1] == "B" and not board.PlayerTurn
+    assert board.zobrist_hash == hash_matrix(board.get_board_state())
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_incremental_evaluation_follows_every_move(board_class, monkeypatch):
+    monkeypatch.setattr(board_class, "verify_evaluation", True)
+    rng = random.Random(5)
+    board = board_class()
+    for _ in range(80):
+        moves = board.generate_moves(not board.PlayerTurn)
+        if not moves:
+            break
+        board.make_move(rng.choice(moves))
+        board.evaluate_board()  # Raises if the incremental score drifted
+    for child, _ in board.get_valid_moves(not board.PlayerTurn):
+        child.evaluate_board()
+
+    board.evaluation += 1
+    with pytest.raises(AssertionError):
+        board.evaluate_board()
+
+
+def reference_moves(board, maximizing_player):
+    """Moves of the men found by trying every diagonal with is_valid_move, captures first."""
+    own = "C" if maximizing_player else "B"
+    jumps, steps = [], []
+    for x, y in DARK_SQUARES:
+        if board.Matrix[x][y] == own:
+            for dx, dy in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+                if board.is_valid_move(x, y, x + 2 * dx, y + 2 * dy):
+                    jumps.append((x, y, x + 2 * dx, y + 2 * dy))
+            for dx, dy in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+                if board.is_valid_move(x, y, x + dx, y + dy):
+                    steps.append((x, y, x + dx, y + dy))
+    return jumps + steps
+
+
+def test_move_tables_match_is_valid_move():
+    rng = random.Random(6)
+    for _ in range(300):
+        state = random_state(rng)
+        for board_class in (GameBoard, BitboardGameBoard):
+            board = board_class()
+            board.set_board_state(state)
+            for side in (True, False):
+                moves = list(board.iter_moves(side))
+                assert moves == board.generate_moves(side) == reference_moves(board, side)
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_children_are_copied_on_demand(board_class, monkeypatch):
+    board = board_class()
+    before = board.get_board_state()
+    children = [(child.get_board_state(), move) for child, move in board.get_valid_moves(False)]
+    assert [(child.get_board_state(), move) for child, move in board.iter_valid_moves(False)] == children
+    assert board.get_board_state() == before
+
+    copies = []
+    original_copy = board_class.__copy__
+    monkeypatch.setattr(board_class, "__copy__", lambda self: copies.append(1) or original_copy(self))
+    first_child, first_move = next(board.iter_valid_moves(False))
+    assert len(copies) == 1
+    assert (first_child.get_board_state(), first_move) == children[0]
@@ -0,0 +1,73 @@
+"""Tests for building and probing the opening book."""
+
+import math
+from copy import copy
+
+import pytest
+
+from src.ai import book as book_module
+from src.ai.book import ENTRY, HEADER, OpeningBook, build_opening_book
+from src.ai.transposition import position_key
+from src.game.bitboard import RC_TO_SQUARE, BitboardGameBoard
+from src.game.board import GameBoard
+
+
+@pytest.fixture(scope="module")
+def book_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("book") / "opening.ckbk"
+    assert build_opening_book(str(path), moves=2, depth=3) > 0
+    return path
+
+
+def test_book_covers_every_first_player_move(book_path):
+    book = OpeningBook(str(book_path))
+    assert book.depth == 3
+    stats = {}
+    for board_class in (GameBoard, BitboardGameBoard):
+        start = board_class()
+        for player_move in start.generate_moves(False):
+            board = copy(start)
+            board.make_move(player_move)
+            move = book.lookup(board, stats)
+            assert move in board.generate_moves(True)
+    assert stats == {'book_hits': 14}
+
+
+def test_book_misses_positions_it_does_not_cover(book_path):
+    book = OpeningBook(str(book_path))
+    stats = {}
+    assert book.lookup(BitboardGameBoard(), stats) is None
+    assert stats == {'book_misses': 1}
+
+
+def test_book_rejects_other_files(book_path, tmp_path):
+    data = book_path.read_bytes()
+    truncated = tmp_path / "truncated.ckbk"
+    truncated.write_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        OpeningBook(str(truncated))
+    renamed = tmp_path / "renamed.ckbk"
+    renamed.write_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        OpeningBook(str(renamed))
+    assert len(OpeningBook(str(book_path))) == (len(data) - HEADER.size) // 12
+
+
+def test_infinite_scores_are_clamped_on_disk(tmp_path, monkeypatch):
+    searched = []
+
+    def decided_search(board, maximizing_player, stats, **kwargs):
+        move = board.generate_moves(maximizing_player)[0]
+        score = math.inf if len(searched) % 2 == 0 else -math.inf  # Won and lost lines
+        searched.append((position_key(board, True), move, score))
+        return move, score
+
+    monkeypatch.setattr(book_module, "iterative_deepening", decided_search)
+    path = tmp_path / "decided.ckbk"
+    assert build_opening_book(str(path), moves=1, depth=3) == len(searched) == 7
+    data = path.read_bytes()
+    stored = [ENTRY.unpack_from(data, HEADER.size + index * ENTRY.size) for index in range(len(searched))]
+    expected = sorted((key, RC_TO_SQUARE[old_x * 8 + old_y], RC_TO_SQUARE[new_x * 8 + new_y],
+                       32767 if score > 0 else -32768)
+                      for key, (old_x, old_y, new_x, new_y), score in searched)
+    assert stored == expected
@@ -0,0 +1,137 @@
+"""Tests for the entry point, the GUI-free engine and the terminal game."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.ai.instrumentation import SearchLog
+from src.ai.iterative import ASPIRATION_WINDOW
+from src.engine import UNFINISHED, Engine
+from src.game import evaluation
+from src.game.bitboard import BitboardGameBoard
+from src.game.board import GameBoard
+from src.game.evaluation import write_weights
+from src.ui.cli import parse_move, play_cli
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def engine():
+    engine = Engine(time_budget=5.0, max_depth=3, table_megabytes=1, tablebase_path=None, book_path=None)
+    yield engine
+    engine.close()
+
+
+def test_parse_move():
+    assert parse_move("5 0 4 1") == (5, 0, 4, 1)
+    assert parse_move("5,0-4,1\n") == (5, 0, 4, 1)
+    assert parse_move("5 0 4") is None
+    assert parse_move("a b c d") is None
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_engine_chooses_legal_moves(engine, board_class):
+    board = board_class()
+    board.make_move(board.generate_moves(False)[0])
+    stats = {}
+    move = engine.choose_move(board, stats)
+    assert move in board.generate_moves(True)
+    assert stats['depth_reached'] == 3 and stats['time_spent'] > 0
+    with pytest.raises(ValueError):
+        Engine(algorithm="minimax", tablebase_path=None, book_path=None)
+
+
+def test_terminal_game(engine):
+    board = BitboardGameBoard()
+    first = board.generate_moves(False)[0]
+    script = "moves\nhello\n0 1 1 0\n" + " ".join(map(str, first)) + "\nquit\n"
+    output = io.StringIO()
+    assert play_cli(engine, BitboardGameBoard, io.StringIO(script), output) == UNFINISHED
+    text = output.getvalue()
+    assert " | ".join(" ".join(map(str, move)) for move in board.generate_moves(False)) in text
+    assert "Illegal move." in text and text.count("Enter a move") == 2
+    assert "AI plays" in text and "3 plies" in text
+
+
+def run_python(*args, check=True, **kwargs):
+    return subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, text=True, check=check,
+                          **kwargs)
+
+
+def test_main_plays_in_the_terminal():
+    result = run_python("main.py", "--cli", "--board", "matrix", "--time-budget", "0.1", input="quit\n")
+    assert "Your move" in result.stdout
+
+
+def test_engine_path_does_not_import_tkinter_or_numpy():
+    run_python("-c", "import sys, main, src.engine, src.ui.cli; assert not {'tkinter', 'numpy'} & set(sys.modules)")
+
+
+def test_terminal_game_writes_the_search_log(tmp_path):
+    log_path = tmp_path / "search.jsonl"
+    move = " ".join(map(str, BitboardGameBoard().generate_moves(False)[0]))
+    run_python("main.py", "--cli", "--time-budget", "0.1", "--search-log", str(log_path), "--profile", "sampling",
+               input=f"{move}\nquit\n")
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [record['event'] for record in records] == ["ai_move"]
+    assert records[0]['profile_mode'] == "sampling" and 'time_breakdown' in records[0]
+    assert records[0]['nodes_expanded'] > 0 and len(records[0]['move']) == 4
+
+
+def test_engine_logs_and_profiles_each_move():
+    records = []
+    engine = Engine(time_budget=5.0, max_depth=3, table_megabytes=1, tablebase_path=None, book_path=None,
+                    search_log=SearchLog(records.append), profile="cprofile")
+    board = BitboardGameBoard()
+    board.make_move(board.generate_moves(False)[0])
+    move = engine.choose_move(board)
+    engine.close()
+    assert [record['event'] for record in records] == ["ai_move"]
+    assert records[0]['move'] == list(move) and records[0]['profile_mode'] == "cprofile"
+
+
+def test_weights_option_selects_and_records_the_weights(tmp_path):
+    weights_path = tmp_path / "weights.json"
+    write_weights(str(weights_path), [1] * 64, [2] * 64)
+    log_path = tmp_path / "search.jsonl"
+    move = " ".join(map(str, BitboardGameBoard().generate_moves(False)[0]))
+    result = run_python("main.py", "--cli", "--time-budget", "0.1", "--weights", str(weights_path),
+                        "--search-log", str(log_path), input=f"{move}\nquit\n")
+    assert f"Evaluation weights: {weights_path}" in result.stderr
+    record = json.loads(log_path.read_text().splitlines()[0])
+    assert record['weights_path'] == str(weights_path)
+    assert record['weights_digest'] != evaluation.WEIGHTS_DIGEST
+
+    missing = run_python("main.py", "--cli", "--weights", str(tmp_path / "missing.json"), check=False)
+    assert missing.returncode == 2 and "weight file not found" in missing.stderr
+
+
+def test_weight_file_does_not_depend_on_the_working_directory(tmp_path):
+    code = "from src.game import evaluation; print(evaluation.DEFAULT_WEIGHTS_PATH)"
+    environment = {**os.environ, 'PYTHONPATH': REPO_ROOT}
+    environment.pop(evaluation.WEIGHTS_ENV, None)
+    result = subprocess.run([sys.executable, "-c", code], cwd=str(tmp_path), env=environment, capture_output=True,
+                            text=True, check=True)
+    assert result.stdout.strip() == os.path.join(REPO_ROOT, "evaluation_weights.json")
+
+    environment[evaluation.WEIGHTS_ENV] = str(tmp_path / "missing.json")
+    result = subprocess.run([sys.executable, "-c", code], cwd=str(tmp_path), env=environment, capture_output=True,
+                            text=True)
+    assert result.returncode != 0 and "FileNotFoundError" in result.stderr
+
+
+def test_aspiration_window_scales_with_the_loaded_weights(tmp_path):
+    if evaluation.WEIGHTS_PATH is None:
+        assert ASPIRATION_WINDOW == 5  # Built-in weights
+    weights_path = tmp_path / "tuned.json"
+    write_weights(str(weights_path), [20] * 64, [-39] * 64)
+    environment = {**os.environ, 'PYTHONPATH': REPO_ROOT, evaluation.WEIGHTS_ENV: str(weights_path)}
+    code = "from src.ai.iterative import ASPIRATION_WINDOW; print(ASPIRATION_WINDOW)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=str(tmp_path), env=environment, capture_output=True,
+                            text=True, check=True)
+    assert int(result.stdout) == 28
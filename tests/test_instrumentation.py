@@ -0,0 +1,72 @@
+"""Tests for the search counters, the JSON-lines search log and the profiler."""
+
+import json
+
+import pytest
+
+from src.ai.instrumentation import CATEGORY_NAMES, SearchLog, profile_search
+from src.ai.iterative import iterative_deepening
+from src.ai.ordering import MoveOrderer, summarize_cutoffs
+from src.game.bitboard import BitboardGameBoard
+from tests.test_search import new_stats
+
+
+def search(max_depth=5):
+    stats = new_stats()
+    iterative_deepening(BitboardGameBoard(), True, stats, max_depth=max_depth, ordering=MoveOrderer())
+    summarize_cutoffs(stats)
+    return stats
+
+
+def test_search_counters():
+    stats = search()
+    assert len(stats['nodes_by_depth']) == stats['depth_reached'] == 5
+    assert sum(stats['nodes_by_depth']) == stats['nodes_expanded']
+    assert stats['effective_branching_factor'] == stats['nodes_by_depth'][-1] / stats['nodes_by_depth'][-2]
+    assert sum(stats['cutoff_positions']) == stats['prunes']
+    assert 0 < stats['pruning_gains'] < 100
+
+
+def test_search_log_writes_json_lines(tmp_path):
+    path = tmp_path / "search.jsonl"
+    log = SearchLog(str(path))
+    stats = search(3)
+    log.record("ai_move", stats, move=[2, 1, 3, 0])
+    log.record("game_over", winner="computer")
+    log.close()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record['event'] for record in records] == ["ai_move", "game_over"]
+    assert records[0]['nodes_expanded'] == stats['nodes_expanded']
+    assert records[0]['nodes_by_depth'] == stats['nodes_by_depth']
+    assert records[0]['move'] == [2, 1, 3, 0]
+    assert records[1]['winner'] == "computer" and 'timestamp' in records[1]
+
+
+def test_search_log_callback():
+    records = []
+    log = SearchLog(records.append)
+    returned = log.record("ai_move", {'nodes_expanded': 3}, depth=2)
+    log.close()
+    assert records == [returned]
+    assert returned['event'] == "ai_move" and returned['nodes_expanded'] == 3 and returned['depth'] == 2
+
+
+@pytest.mark.parametrize("mode", ["cprofile", "sampling"])
+def test_profile_search_breaks_down_time(mode):
+    stats = new_stats()
+    with profile_search(stats, mode):
+        iterative_deepening(BitboardGameBoard(), True, stats, max_depth=5, ordering=MoveOrderer())
+    assert stats['profile_mode'] == mode
+    assert set(stats['time_breakdown']) == set(CATEGORY_NAMES)
+    assert sum(stats['time_breakdown'].values()) > 0
+    if mode == "cprofile":
+        assert stats['time_breakdown']['move_generation'] > 0 and len(stats['profile_top']) == 10
+    else:
+        assert stats['profile_samples'] > 0
+
+
+def test_profile_search_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        with profile_search({}, "perf"):
+            pass
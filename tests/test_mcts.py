@@ -0,0 +1,120 @@
+"""Tests for the Monte Carlo Tree Search engine and its tree reuse."""
+
+from src.ai.background import BackgroundSearch
+from src.ai.limits import SearchLimits
+from src.ai.mcts import UNEXPANDED, MonteCarloSearch
+from src.engine import Engine
+from src.game.bitboard import BitboardGameBoard
+from src.game.board import GameBoard
+
+
+def new_stats():
+    return {'nodes_expanded': 0, 'prunes': 0}
+
+
+def position_with_ai_to_move(board_class=BitboardGameBoard):
+    board = board_class()
+    board.make_move((5, 0, 4, 1))
+    return board
+
+
+def search(searcher, board, maximizing_player=True, nodes=2000):
+    stats = new_stats()
+    move, win_rate = searcher.search(board, maximizing_player, stats, limits=SearchLimits(node_budget=nodes,
+                                                                                          check_interval=1))
+    return move, win_rate, stats
+
+
+def assert_consistent_tree(searcher):
+    """Children lie next to each other, point back at their parent and share its playouts."""
+    for node in range(len(searcher)):
+        first = searcher.first_child[node]
+        if first == UNEXPANDED:
+            continue
+        children = range(first, first + searcher.child_count[node])
+        assert all(searcher.parent[child] == node for child in children)
+        assert sum(searcher.visits[child] for child in children) <= searcher.visits[node]
+
+
+def test_search_returns_a_legal_move():
+    for board_class in (GameBoard, BitboardGameBoard):
+        board = position_with_ai_to_move(board_class)
+        before = board.get_board_state()
+        move, win_rate, stats = search(MonteCarloSearch(seed=1), board)
+        assert move in board.generate_moves(True)
+        assert 0.0 <= win_rate <= 1.0
+        assert board.get_board_state() == before
+        assert stats['playouts'] > 0 and stats['tree_nodes'] == stats['nodes_expanded'] + 1
+        assert stats['tree_bytes'] > 0 and stats['principal_variation'][0] == move
+        assert stats['reused_nodes'] == stats['reused_playouts'] == 0
+
+
+def test_same_seed_same_search():
+    board = position_with_ai_to_move()
+    assert search(MonteCarloSearch(seed=4), board)[:2] == search(MonteCarloSearch(seed=4), board)[:2]
+
+
+def test_tree_is_reused_two_plies_down():
+    searcher = MonteCarloSearch(seed=2)
+    board = position_with_ai_to_move()
+    move, _, _ = search(searcher, board)
+    ai_node = max(range(searcher.first_child[0], searcher.first_child[0] + searcher.child_count[0]),
+                  key=searcher.visits.__getitem__)
+    first = searcher.first_child[ai_node]
+    reply_node = max(range(first, first + searcher.child_count[ai_node]), key=searcher.visits.__getitem__)
+    reply = searcher._move(reply_node)
+    kept_playouts = searcher.visits[reply_node]
+    assert kept_playouts > 0
+
+    board.make_move(move)
+    board.make_move(reply)
+    _, _, stats = search(searcher, board, nodes=500)
+    assert stats['reused_playouts'] == kept_playouts
+    assert stats['reused_nodes'] > 0
+    assert searcher.visits[0] == kept_playouts + stats['playouts']
+    assert_consistent_tree(searcher)
+
+
+def test_tree_is_reused_for_the_same_position_and_dropped_for_others():
+    searcher = MonteCarloSearch(seed=3)
+    board = position_with_ai_to_move()
+    _, _, first = search(searcher, board)
+    _, _, again = search(searcher, board, nodes=100)
+    assert again['reused_playouts'] == first['playouts']
+    assert again['reused_nodes'] == first['tree_nodes'] - 1
+
+    other = BitboardGameBoard()
+    other.make_move((5, 2, 4, 3))
+    _, _, fresh = search(searcher, other, nodes=100)
+    assert fresh['reused_nodes'] == fresh['reused_playouts'] == 0
+    assert_consistent_tree(searcher)
+
+
+def test_lost_position_has_no_move():
+    board = GameBoard()
+    state = [["---"] * 8 for _ in range(8)]
+    state[7][0] = "C"  # The AI man on the last row cannot move
+    state[0][1] = "B"
+    board.set_board_state(state)
+    board.PlayerPieces, board.ComputerPieces = board.count_pieces()
+    board.PlayerTurn = False
+    stats = new_stats()
+    move, win_rate = MonteCarloSearch(seed=5).search(board, True, stats, time_budget=0.05)
+    assert move is None and win_rate == 0.0 and stats['playouts'] >= 1
+
+
+def test_engine_and_background_worker_play_mcts():
+    board = position_with_ai_to_move()
+    engine = Engine(time_budget=0.05, algorithm="mcts", tablebase_path=None, book_path=None)
+    stats = {}
+    assert engine.choose_move(board, stats) in board.generate_moves(True)
+    assert stats['playouts'] > 0 and 0.0 <= stats['score'] <= 1.0
+    engine.close()
+
+    worker = BackgroundSearch(algorithm="mcts")
+    try:
+        job = worker.search(board, new_stats(), time_budget=0.05)
+        assert job.done.wait(5)
+        assert job.best_move in board.generate_moves(True) and job.stats['playouts'] > 0
+    finally:
+        worker.shutdown()
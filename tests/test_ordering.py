@@ -0,0 +1,54 @@
+"""Tests for the PV, killer and history move ordering."""
+
+import math
+
+from src.ai.minimax import SearchToolBox
+from src.ai.ordering import MoveOrderer, summarize_cutoffs
+from src.game.bitboard import BitboardGameBoard
+from tests.test_search import new_stats, random_positions
+
+QUIET = [(5, 0, 4, 1), (5, 2, 4, 1), (5, 2, 4, 3), (5, 4, 4, 3)]
+CAPTURES = [(4, 1, 2, 3), (4, 5, 2, 3)]
+
+
+def test_order_bands():
+    orderer = MoveOrderer()
+    orderer.record_cutoff(QUIET[3], ply=2, depth=1)  # Killer at ply 2, history 1
+    orderer.record_cutoff(QUIET[1], ply=5, depth=3)  # History 9, killer at another ply
+    moves = QUIET + CAPTURES
+    assert orderer.order(moves, 2, first_move=QUIET[2]) == [QUIET[2]] + CAPTURES + [QUIET[3], QUIET[1], QUIET[0]]
+    assert orderer.order(moves, 5) == CAPTURES + [QUIET[1], QUIET[3], QUIET[0], QUIET[2]]
+    assert sorted(orderer.order(moves, 0)) == sorted(moves)
+
+
+def test_killers_are_most_recent_first_and_bounded():
+    orderer = MoveOrderer(killer_slots=2)
+    for move in (QUIET[0], QUIET[1], QUIET[2], QUIET[1]):
+        orderer.record_cutoff(move, ply=3, depth=2)
+    assert orderer.killers[3] == [QUIET[1], QUIET[2]]
+    orderer.record_cutoff(CAPTURES[0], ply=3, depth=2)  # Captures are never killers
+    assert orderer.killers[3] == [QUIET[1], QUIET[2]]
+
+
+def test_new_search_forgets_killers_and_ages_history():
+    orderer = MoveOrderer()
+    orderer.record_cutoff(QUIET[0], ply=1, depth=4)
+    index = (5 * 8 + 0) * 64 + 4 * 8 + 1
+    assert orderer.history[index] == 16
+    orderer.new_search()
+    assert orderer.killers[1] == []
+    assert orderer.history[index] == 8
+
+
+def test_ordered_search_keeps_the_score_and_reports_cutoff_quality():
+    for board in random_positions(BitboardGameBoard, 10, seed=7):
+        maximizing_player = not board.PlayerTurn
+        plain = SearchToolBox.minimax_in_place(board, 4, -math.inf, math.inf, maximizing_player, new_stats())
+        stats = new_stats()
+        ordered = SearchToolBox.minimax_in_place(board, 4, -math.inf, math.inf, maximizing_player, stats,
+                                                 ordering=MoveOrderer())
+        assert ordered[1] == plain[1]
+        summarize_cutoffs(stats)
+        if stats['prunes']:
+            assert 0 <= stats['first_move_cutoff_rate'] <= 1
+            assert stats['average_cutoff_index'] >= 0
@@ -0,0 +1,80 @@
+"""Tests for the parallel root-split search."""
+
+import math
+import random
+
+import pytest
+
+from src.ai import parallel
+from src.ai.minimax import SearchToolBox
+from src.ai.parallel import MAX_ROOT_MOVES, ParallelSearch
+from src.game.bitboard import BitboardGameBoard
+
+
+def random_positions(count, seed=5):
+    """Positions reached by random play, each with a legal move for the side to move."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = BitboardGameBoard()
+        for _ in range(rng.randrange(4, 30)):
+            moves = board.generate_moves(not board.PlayerTurn)
+            if not moves:
+                break
+            board.make_move(rng.choice(moves))
+        if board.generate_moves(not board.PlayerTurn):
+            positions.append(board)
+    return positions
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ParallelSearch(workers=3) as searcher:
+        yield searcher
+
+
+def serial_search(board, depth):
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    return SearchToolBox.minimax_in_place(board, depth, -math.inf, math.inf, not board.PlayerTurn, stats)
+
+
+def test_reused_pool_matches_serial_search(pool):
+    # Deeper searches first, so stale worker table entries would show up in the shallower ones
+    for board in random_positions(12):
+        for depth in (5, 3, 4, 1):
+            stats = {'nodes_expanded': 0, 'prunes': 0}
+            assert pool.search(board, depth, not board.PlayerTurn, stats) == serial_search(board, depth)
+
+
+def test_search_reports_worker_stats(pool):
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    pool.search(BitboardGameBoard(), 4, False, stats)
+    assert stats['parallel_workers'] == 3
+    assert sum(stats['worker_nodes'].values()) > 0
+    assert 0.0 < stats['worker_utilization'] <= 1.0
+
+
+def test_search_reports_the_speedup_over_a_serial_search(pool):
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    pool.search(BitboardGameBoard(), 4, False, stats, measure_speedup=True)
+    assert stats['serial_wall_time'] > 0.0
+    assert stats['speedup'] == pytest.approx(stats['serial_wall_time'] / stats['parallel_wall_time'])
+
+
+def test_workers_read_the_bound_when_a_move_starts(monkeypatch):
+    board = BitboardGameBoard()
+    move = board.generate_moves(False)[2]
+    child = board.__copy__()
+    child.make_move(move)
+    stats = {'nodes_expanded': 0, 'prunes': 0}
+    exact = SearchToolBox.minimax_in_place(child, 2, -math.inf, math.inf, True, stats)[1]
+
+    scores = parallel.multiprocessing.Array('d', [math.nan] * MAX_ROOT_MOVES)
+    for name in ("_worker_table", "_worker_ordering", "_worker_search_id", "_root_scores"):
+        monkeypatch.setattr(parallel, name, None)
+    parallel._init_worker(1, scores)
+    assert parallel._search_root_move(board.__copy__(), move, 2, 3, False, 1)[:2] == (exact, math.inf)
+    scores[0], scores[5] = exact + 9, exact - 1  # Root moves finished while move 2 was queued
+    score, bound = parallel._search_root_move(board.__copy__(), move, 2, 3, False, 1)[:2]
+    assert bound == exact  # Beat move 5's score, or tie it as the earlier move
+    assert score >= bound  # Cut off: move 2 cannot change the result
@@ -0,0 +1,112 @@
+"""Tests for the compact position encoding and the game record file."""
+
+import random
+
+import pytest
+
+from src.game import records
+from src.game.bitboard import BitboardGameBoard
+from src.game.board import GameBoard
+from src.game.records import COMPUTER_WIN, PLAYER_WIN, UNFINISHED, GameRecordWriter, game_result, read_games
+from tests.test_search import random_positions
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_position_bytes_round_trip(board_class):
+    for board in random_positions(board_class, 20, seed=50):
+        data = board.to_bytes()
+        assert len(data) == 13
+        for other_class in (GameBoard, BitboardGameBoard):
+            decoded = other_class.from_bytes(data)
+            assert decoded.get_board_state() == board.get_board_state()
+            assert decoded.PlayerTurn == board.PlayerTurn
+            assert (decoded.PlayerPieces, decoded.ComputerPieces) == (board.PlayerPieces, board.ComputerPieces)
+            assert decoded.evaluate_board() == board.evaluate_board()
+            assert decoded.to_bytes() == data
+
+
+@pytest.mark.parametrize("data", [b"", bytes(14), bytes([1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]),
+                                  bytes([0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0]), bytes(12) + b"\x02"])
+def test_invalid_position_bytes_are_rejected(data):
+    for board_class in (GameBoard, BitboardGameBoard):
+        with pytest.raises(ValueError):
+            board_class.from_bytes(data)
+
+
+def test_interleaved_games_round_trip(tmp_path):
+    path = str(tmp_path / "games.ckgr")
+    rng = random.Random(3)
+    boards = {}
+    expected = {}
+    writer = GameRecordWriter(path)
+    for _ in range(3):
+        board = BitboardGameBoard()
+        game_id = writer.start_game(board)
+        boards[game_id] = board
+        expected[game_id] = (board.to_bytes(), [])
+    for _ in range(200):  # Moves of the three games alternate in the file
+        game_id = rng.choice(list(boards))
+        board = boards[game_id]
+        moves = board.generate_moves(not board.PlayerTurn)
+        if not moves:
+            continue
+        move = rng.choice(moves)
+        board.make_move(move)
+        writer.record_move(game_id, move)
+        expected[game_id][1].append(move)
+    writer.end_game(2, game_result(boards[2]))
+    writer.end_game(1, PLAYER_WIN)
+    writer.close()
+
+    games = list(read_games(path))
+    assert [game.game_id for game in games] == [2, 1, 3]
+    assert [game.result for game in games] == [game_result(boards[2]), PLAYER_WIN, UNFINISHED]
+    for game in games:
+        start, moves = expected[game.game_id]
+        assert game.start == start and game.moves == moves
+        *_, final = game.positions(GameBoard)
+        assert final.get_board_state() == boards[game.game_id].get_board_state()
+    assert [game.game_id for game in read_games(path, include_unfinished=False)] == [2, 1]
+
+
+def test_reused_ids_and_appending(tmp_path, monkeypatch):
+    monkeypatch.setattr(records, "_READ_SIZE", 7)  # Records straddle the read chunks
+    path = str(tmp_path / "games.ckgr")
+    writer = GameRecordWriter(path)
+    board = GameBoard()
+    writer.start_game(board, game_id=9)
+    writer.record_move(9, board.generate_moves(False)[0])
+    writer.close()
+    writer = GameRecordWriter(path)  # A new session reuses the id of the interrupted game
+    writer.start_game(board, game_id=9)
+    writer.end_game(9, COMPUTER_WIN)
+    writer.close()
+
+    games = list(read_games(path))
+    assert [(game.game_id, len(game.moves), game.result) for game in games] == [(9, 1, UNFINISHED),
+                                                                                (9, 0, COMPUTER_WIN)]
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"CKOB\x01\x00")
+    with pytest.raises(ValueError):
+        list(read_games(str(path)))
+    with pytest.raises(ValueError):
+        GameRecordWriter(str(path))
+    corrupt = tmp_path / "corrupt.ckgr"
+    corrupt.write_bytes(records.HEADER.pack(records.MAGIC, records.VERSION) + b"X" + bytes(4))
+    with pytest.raises(ValueError):
+        list(read_games(str(corrupt)))
+
+
+def test_game_result():
+    board = GameBoard()
+    assert game_result(board) == UNFINISHED
+    state = [["---"] * 8 for _ in range(8)]
+    state[7][0] = "C"  # The AI man on the last row cannot move
+    state[0][1] = "B"
+    board.set_board_state(state)
+    board.PlayerPieces, board.ComputerPieces = board.count_pieces()
+    board.PlayerTurn = False
+    assert game_result(board) == PLAYER_WIN
@@ -0,0 +1,128 @@
+"""Tests for the multi-game server: fair scheduling, backpressure and the JSON-lines protocol."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.game.bitboard import BitboardGameBoard
+from src.game.notation import START_POSITION, board_to_string
+from src.server import load_generator
+from src.server.game_server import FairScheduler, GameServer, QueueFull, percentile
+
+
+async def until(condition):
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+async def blocked_scheduler(executor, max_queued):
+    """A one-worker scheduler whose worker is held by a job until the returned event is set."""
+    scheduler = FairScheduler(executor, 1, max_queued)
+    scheduler.start()
+    release = threading.Event()
+    blocker = asyncio.ensure_future(scheduler.submit(0, release.wait))
+    await until(lambda: scheduler.running == 1)
+    return scheduler, release, blocker
+
+
+def test_waiting_games_are_served_round_robin():
+    async def scenario():
+        order = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scheduler, release, blocker = await blocked_scheduler(executor, 10)
+            jobs = [asyncio.ensure_future(scheduler.submit(game_id, order.append, (game_id, index)))
+                    for game_id, index in ((1, 0), (1, 1), (1, 2), (2, 0))]
+            await until(lambda: scheduler.queued == 4)
+            release.set()
+            await asyncio.gather(blocker, *jobs)
+            await scheduler.stop()
+        return order
+
+    assert asyncio.run(scenario()) == [(1, 0), (2, 0), (1, 1), (1, 2)]
+
+
+def test_full_queue_refuses_new_work():
+    async def scenario():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scheduler, release, blocker = await blocked_scheduler(executor, 2)
+            jobs = [asyncio.ensure_future(scheduler.submit(game_id, abs, -game_id)) for game_id in (1, 2)]
+            await until(lambda: scheduler.queued == 2)
+            with pytest.raises(QueueFull):
+                await scheduler.submit(3, abs, -3)
+            release.set()
+            results = await asyncio.gather(blocker, *jobs)
+            assert scheduler.queued == 0
+            assert await scheduler.submit(3, abs, -3) == 3  # Accepted again once the queue drained
+            await scheduler.stop()
+        return results[1:]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_stop_cancels_waiting_work():
+    async def scenario():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scheduler, release, blocker = await blocked_scheduler(executor, 10)
+            jobs = [asyncio.ensure_future(scheduler.submit(game_id, abs, -game_id)) for game_id in (1, 2)]
+            await until(lambda: scheduler.queued == 2)
+            await scheduler.stop()
+            release.set()
+            await asyncio.gather(blocker, *jobs, return_exceptions=True)
+            assert blocker.cancelled() and all(job.cancelled() for job in jobs)
+            assert scheduler.queued == 0 and not scheduler.ready
+
+    asyncio.run(scenario())
+
+
+def test_percentile():
+    assert percentile([], 0.5) is None
+    assert percentile([3.0, 1.0, 2.0, 4.0], 0.5) == 2.0
+    assert percentile(list(range(1, 101)), 0.99) == 99
+
+
+def test_protocol_plays_a_game():
+    async def scenario():
+        server = GameServer(workers=1, max_queued=4, default_time_budget=0.05, max_depth=3,
+                            table_megabytes=1, book_path=None, tablebase_path=None)
+        await server.start(port=0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+
+        async def send(request):
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        try:
+            created = await send({'op': "new_game", 'id': 7})
+            assert created['ok'] and created['id'] == 7 and created['position'] == START_POSITION
+            game = created['game']
+            illegal = await send({'op': "move", 'game': game, 'move': [5, 0, 3, 2]})
+            assert not illegal['ok'] and illegal['error'] == "illegal move"
+            board = BitboardGameBoard()
+            move = board.generate_moves(False)[0]
+            played = await send({'op': "move", 'game': game, 'move': list(move)})
+            assert played['ok'] and played['depth'] >= 1 and not played['game_over']
+            board.make_move(move)
+            assert tuple(played['ai_move']) in board.generate_moves(True)
+            board.make_move(tuple(played['ai_move']))
+            assert played['position'] == board_to_string(board)
+            stats = await send({'op': "stats"})
+            assert stats['moves'] == 1 and stats['games'] == 1 and stats['rejected'] == 0
+            assert (await send({'op': "end_game", 'game': game}))['ok']
+            assert (await send({'op': "move", 'game': game, 'move': [5, 0, 4, 1]}))['error'] == "unknown game"
+            assert "bad request" in (await send({'op': "resign"}))['error']
+        finally:
+            writer.close()
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_load_generator_reports_runs_without_moves(capsys):
+    assert load_generator.main(["--spawn", "--workers", "1", "--games", "1", "--moves", "0"]) == 0
+    summary, results = capsys.readouterr().out.splitlines()
+    assert "p50 n/a, p99 n/a" in summary
+    assert json.loads(results)['moves'] == 0
@@ -0,0 +1,90 @@
+"""Tests that the endgame tablebase agrees with a brute-force solve."""
+
+from itertools import combinations
+from math import factorial
+
+import pytest
+
+from src.ai.tablebase import BINOMIAL, LOSS, MAX_DISTANCE, WIN, WIN_SCORE, EndgameTablebase, build_tablebase
+from src.game.bitboard import SQUARE_TO_RC, BitboardGameBoard
+
+MAX_PIECES = 3
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tablebase") / "endgame.cktb"
+    build_tablebase(str(path), MAX_PIECES)
+    table = EndgameTablebase(str(path))
+    yield table
+    table.close()
+
+
+def solve(board, maximizing_player, memo):
+    """(result, distance) for the side to move by exhaustive search; men never promote, so play always ends."""
+    key = (board.player_bb, board.computer_bb, maximizing_player)
+    if key not in memo:
+        children = []
+        for move in board.generate_moves(maximizing_player):
+            token = board.make_move(move)
+            children.append(solve(board, not maximizing_player, memo))
+            board.unmake_move(token)
+        if not children:
+            memo[key] = (LOSS, 0)  # No pieces or no legal move
+        elif any(result == LOSS for result, _ in children):
+            memo[key] = (WIN, min(1 + min(d for result, d in children if result == LOSS), MAX_DISTANCE))
+        else:
+            memo[key] = (LOSS, min(1 + max(d for _, d in children), MAX_DISTANCE))
+    return memo[key]
+
+
+def make_board(player_squares, computer_squares, maximizing_player):
+    """Bitboard position with men on the given squares."""
+    state = [["---"] * 8 for _ in range(8)]
+    for squares, piece in ((player_squares, "B"), (computer_squares, "C")):
+        for square in squares:
+            x, y = SQUARE_TO_RC[square]
+            state[x][y] = piece
+    board = BitboardGameBoard()
+    board.set_board_state(state)
+    board.PlayerPieces, board.ComputerPieces = board.count_pieces()
+    board.PlayerTurn = not maximizing_player
+    return board
+
+
+def positions(player, computer):
+    """Every position with the given numbers of men, for both sides to move."""
+    for player_squares in combinations(range(32), player):
+        free = [square for square in range(32) if square not in player_squares]
+        for computer_squares in combinations(free, computer):
+            for maximizing_player in (False, True):
+                yield make_board(player_squares, computer_squares, maximizing_player), maximizing_player
+
+
+@pytest.mark.parametrize("player,computer", [(1, 1), (2, 1), (1, 2)])
+def test_lookup_matches_brute_force(tablebase, player, computer):
+    memo = {}
+    for board, maximizing_player in positions(player, computer):
+        expected = solve(board, maximizing_player, memo)
+        assert tablebase.lookup(board, maximizing_player) == expected
+
+
+def test_probe_scores_for_the_ai(tablebase):
+    memo = {}
+    for board, maximizing_player in positions(1, 1):
+        result, distance = solve(board, maximizing_player, memo)
+        score = WIN_SCORE - distance if (result == WIN) == maximizing_player else distance - WIN_SCORE
+        assert tablebase.probe(board, maximizing_player) == score
+
+
+def test_positions_outside_the_table_are_not_covered(tablebase):
+    assert tablebase.lookup(BitboardGameBoard(), True) is None
+    board = next(positions(1, 1))[0]
+    board.king_bb = board.player_bb
+    assert tablebase.lookup(board, False) is None
+
+
+def test_binomials_match_factorials():
+    expected = [[factorial(n) // (factorial(k) * factorial(n - k)) if k <= n else 0 for k in range(33)]
+                for n in range(33)]
+    assert BINOMIAL == expected
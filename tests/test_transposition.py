@@ -0,0 +1,55 @@
+"""Tests for the transposition table's size bound and replacement policy."""
+
+from src.ai.transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+
+def single_bucket_table():
+    """A table whose every key maps to the same bucket."""
+    table = TranspositionTable(max_megabytes=0)
+    assert table.buckets == 1
+    return table
+
+
+def test_probe_returns_stored_entry_and_counts():
+    table = TranspositionTable(max_megabytes=1)
+    stats = {}
+    table.store(12345, 4, 7, EXACT, (5, 0, 4, 1))
+    assert table.probe(12345, stats) == (4, 7, EXACT, (5, 0, 4, 1))
+    assert table.probe(54321, stats) is None
+    assert stats == {'tt_hits': 1, 'tt_misses': 1}
+
+
+def test_deeper_entries_keep_the_depth_preferred_slot():
+    table = single_bucket_table()
+    stats = {}
+    table.store(1, 5, 10, EXACT, None)
+    table.store(2, 3, 20, LOWER, None)  # Shallower: goes to the always-replace slot
+    assert table.probe(1, stats) == (5, 10, EXACT, None)
+    assert table.probe(2, stats) == (3, 20, LOWER, None)
+
+    table.store(3, 2, 30, UPPER, None)  # Replaces the always-replace slot, not the deeper entry
+    assert table.probe(1, stats) is not None
+    assert table.probe(2, stats) is None
+    assert table.probe(3, stats) == (2, 30, UPPER, None)
+    assert stats['tt_collisions'] == 1
+
+    table.store(4, 5, 40, EXACT, None)  # As deep: takes the depth-preferred slot
+    assert table.probe(1, stats) is None
+    assert table.probe(4, stats) == (5, 40, EXACT, None)
+
+
+def test_same_position_is_overwritten_in_place():
+    table = single_bucket_table()
+    table.store(1, 6, 10, EXACT, None)
+    table.store(1, 2, 11, LOWER, None)
+    assert table.probe(1, {}) == (2, 11, LOWER, None)
+    assert len(table) == 1
+
+
+def test_size_is_bounded_and_clear_empties():
+    table = TranspositionTable(max_megabytes=0.01)
+    for key in range(10 * table.buckets):
+        table.store(key * 7919, key % 5, key, EXACT, None)
+    assert len(table) <= 2 * table.buckets
+    table.clear()
+    assert len(table) == 0
@@ -0,0 +1,99 @@
+"""Tests for self-play data generation and Texel tuning of the evaluation weights."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.ai import tuning  # noqa: E402
+from src.game import evaluation  # noqa: E402
+from src.game.bitboard import BitboardGameBoard  # noqa: E402
+from src.game.records import COMPUTER_WIN, UNFINISHED, GameRecordWriter, game_result, read_games  # noqa: E402
+from src.tools import selfplay, tune  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def records_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("selfplay") / "games.ckgr")
+    assert selfplay.main([path, "--games", "40", "--depth", "1", "--random-rate", "0.2", "--workers", "0"]) == 0
+    return path
+
+
+def test_self_play_is_reproducible_and_legal():
+    moves, result = selfplay.play_game(3, depth=1)
+    assert (moves, result) == selfplay.play_game(3, depth=1)
+    board = BitboardGameBoard()
+    for move in moves:
+        assert move in board.generate_moves(not board.PlayerTurn)
+        board.make_move(move)
+    assert game_result(board) == result
+    assert list(selfplay.generate_games(4, depth=1, seed=3, workers=0, batch_size=3)) == \
+        list(selfplay.generate_games(4, depth=1, seed=3, workers=2, batch_size=3))
+
+
+def test_features_score_like_the_board(records_path):
+    features, results, validation = tuning.load_positions([records_path], quiet_only=False)
+    expected_scores, expected_results = [], []
+    for record in read_games(records_path, include_unfinished=False):
+        if record.result == UNFINISHED:
+            continue
+        for board in record.positions():
+            if board.king_bb == 0:
+                expected_scores.append(board.evaluate_board())
+                expected_results.append(record.result == COMPUTER_WIN)
+    assert features.shape == (len(expected_scores), 64) and features.dtype == np.uint8
+    assert tuning.evaluate_features(features, tuning.current_weights()).tolist() == expected_scores
+    assert results.tolist() == expected_results
+    assert 0 < validation.sum() < len(validation)
+
+    quiet, _, _ = tuning.load_positions([records_path])
+    assert 0 < len(quiet) < len(features)
+
+
+def test_fit_k_recovers_the_scale():
+    scores = np.linspace(-40, 40, 81).astype(np.float32)
+    results = (1 / (1 + np.exp(-0.3 * scores))).astype(np.float32)
+    assert tuning.fit_k(scores, results) == pytest.approx(0.3, rel=1e-3)
+
+
+def test_tuning_lowers_the_loss(records_path):
+    features, results, _ = tuning.load_positions([records_path])
+    initial = tuning.current_weights()
+    k = tuning.fit_k(tuning.evaluate_features(features, initial), results)
+    losses = []
+    weights = tuning.tune_weights(features, results, k, initial, iterations=50,
+                                  progress=lambda step, loss: losses.append(loss))
+    assert len(losses) == 50
+    before = tuning.texel_loss(tuning.evaluate_features(features, initial), results, k)
+    assert tuning.texel_loss(tuning.evaluate_features(features, weights), results, k) < before
+
+    player_weights, computer_weights, scale = tuning.integer_weights(weights)
+    limit = (tuning.WIN_SCORE - tuning.MAX_DISTANCE) // 24
+    assert max(abs(weight) for weight in player_weights + computer_weights) <= limit
+    assert np.allclose(tuning.signed_vector(player_weights, computer_weights), weights * scale, atol=0.5)
+
+
+def test_tune_writes_a_loadable_weight_file(records_path, tmp_path):
+    output = str(tmp_path / "weights.json")
+    assert tune.main([records_path, "--output", output, "--iterations", "20"]) == 0
+    player_weights, computer_weights = evaluation.load_weights(output)
+    data = json.loads(open(output).read())
+    assert data['positions'] > 0 and set(data['loss']) == {"train", "validation"}
+    assert len(player_weights) == len(computer_weights) == 64
+
+    broken = tmp_path / "broken.json"
+    broken.write_text(json.dumps({'player': [1] * 31, 'computer': [1] * 32}))
+    with pytest.raises(ValueError):
+        evaluation.load_weights(str(broken))
+
+
+def test_tune_needs_finished_games(tmp_path):
+    path = str(tmp_path / "empty.ckgr")
+    GameRecordWriter(path).close()
+    assert tune.main([path, "--output", str(tmp_path / "weights.json")]) == 1
+
+
+def test_tune_never_writes_the_default_weight_file(tmp_path):
+    with pytest.raises(SystemExit):
+        tune.main([str(tmp_path / "games.ckgr")])  # --output is required
@@ -0,0 +1,57 @@
+"""Tests for the NumPy batched evaluation (skipped when NumPy is not installed)."""
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.ai.minimax import SearchToolBox  # noqa: E402
+from src.ai.vectorized import encode_boards, evaluate_many, minimax_batched  # noqa: E402
+from src.game.bitboard import BitboardGameBoard  # noqa: E402
+from src.game.board import GameBoard  # noqa: E402
+from tests.test_search import new_stats, random_positions  # noqa: E402
+
+
+def random_boards(count, seed):
+    """Boards of both backends with random men and kings."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        state = [["---"] * 8 for _ in range(8)]
+        for x in range(8):
+            for y in range(8):
+                if (x + y) % 2 == 1 and rng.random() < 0.5:
+                    state[x][y] = rng.choice(["B", "C", "BK", "CK"])
+        for board_class in (GameBoard, BitboardGameBoard):
+            board = board_class()
+            board.set_board_state(state)
+            boards.append(board)
+    return boards
+
+
+def test_evaluate_many_matches_evaluate_board():
+    boards = random_boards(200, seed=1)
+    scores = evaluate_many(boards)
+    assert scores.tolist() == [board.evaluate_board() for board in boards]
+    assert evaluate_many(encode_boards(boards)).tolist() == scores.tolist()
+
+
+def test_backends_encode_alike():
+    boards = random_boards(50, seed=2)
+    matrix_boards, bitboards = boards[0::2], boards[1::2]
+    assert np.array_equal(encode_boards(matrix_boards), encode_boards(bitboards))
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitboardGameBoard])
+def test_batched_search_matches_in_place_search(board_class):
+    for board in random_positions(board_class, 8, seed=3):
+        maximizing_player = not board.PlayerTurn
+        for depth in (1, 2, 3):
+            expected_stats, stats = new_stats(), new_stats()
+            expected = SearchToolBox.minimax_in_place(board, depth, -math.inf, math.inf, maximizing_player,
+                                                      expected_stats)
+            assert minimax_batched(board, depth, -math.inf, math.inf, maximizing_player, stats) == expected
+            assert (stats['nodes_expanded'], stats['prunes']) == (expected_stats['nodes_expanded'],
+                                                                  expected_stats['prunes'])